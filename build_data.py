@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Data build script for LingoDash
+Compiles data/*.csv into typed Arrow IPC files (data/compiled/*.arrow)
+with column renames and derived columns already applied
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import streamlit_app as app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile LingoDash CSV data into a columnar store")
+    parser.add_argument("--data-dir", type=Path, default=app.DATA_DIR, help="Directory containing the CSV files")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📦 Compiling LingoDash data")
+    print("=" * 60)
+
+    try:
+        written = app.compile_data(args.data_dir)
+    except ImportError:
+        print("❌ pyarrow is required to build the compiled data store")
+        return 1
+
+    for name, path in written.items():
+        print(f"  ✅ {name:<12} → {path} ({path.stat().st_size / 1024:.1f} KB)")
+
+    print("\nload_data() will use the compiled files until the CSVs change.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
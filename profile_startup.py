@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Startup profile report for LingoDash
+Runs `python -X importtime` on the app module in a fresh interpreter and
+lists the import cost of each module, slowest first
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+def parse_importtime(stderr_text):
+    """Parse `-X importtime` output into a list of (module, self_us, cumulative_us, depth)"""
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((name.strip(), self_us, cumulative_us, depth))
+    return entries
+
+
+def profile_imports(module="streamlit_app"):
+    """Import `module` in a fresh interpreter with -X importtime and return the parsed entries"""
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def format_report(entries, module="streamlit_app", top=20):
+    """Format the startup report: total time, heaviest direct imports and heaviest modules by self time"""
+    lines = []
+    total = next((cum for name, _, cum, depth in entries if name == module and depth == 0), None)
+    if total is None:
+        total = sum(cum for _, _, cum, depth in entries if depth == 0)
+
+    lines.append("=" * 60)
+    lines.append(f"⏱️  Startup profile for '{module}': {total / 1000:.1f} ms")
+    lines.append("=" * 60)
+
+    # Direct imports of the module are the depth-1 entries printed just before its own line
+    root = next((i for i, e in enumerate(entries) if e[0] == module and e[3] == 0), len(entries))
+    direct = []
+    for entry in reversed(entries[:root]):
+        if entry[3] == 0:
+            break
+        if entry[3] == 1:
+            direct.append(entry)
+    lines.append("\n📦 Heaviest top-level imports (cumulative):")
+    for name, _, cumulative_us, _ in sorted(direct, key=lambda e: e[2], reverse=True)[:top]:
+        lines.append(f"  {cumulative_us / 1000:9.1f} ms  {cumulative_us / total:6.1%}  {name}")
+
+    lines.append("\n🔍 Heaviest modules (self time):")
+    for name, self_us, _, _ in sorted(entries, key=lambda e: e[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {self_us / total:6.1%}  {name}")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time startup report for LingoDash")
+    parser.add_argument("--module", default="streamlit_app", help="Module to profile")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules to list")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.module)
+    if not entries:
+        print(f"❌ No import timings collected for '{args.module}'")
+        return 1
+
+    print(format_report(entries, module=args.module, top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
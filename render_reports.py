@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Batch report renderer for LingoDash
+Builds every dashboard figure from load_data() without a Streamlit server and
+writes it as HTML, SVG or PNG, one figure per job on a process pool
+"""
+
+import argparse
+import importlib.util
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import streamlit_app as app
+
+FORMATS = ("html", "svg", "png")
+PLOTLYJS_MODES = {"directory": "directory", "cdn": "cdn", "inline": True}
+DEFAULT_VARIANT = dict(scenario_factor=1.0, confidence_level=0.95, time_horizon=3)
+
+
+def tam_figure(data, variant):
+    return app.create_interactive_tam_chart(data['languages'])
+
+
+def roi_matrix_figure(data, variant):
+    return app.create_advanced_roi_matrix(data['languages'])
+
+
+def competitive_figure(data, variant):
+    return app.create_competitive_landscape(data['competitors'])
+
+
+def sensitivity_figure(data, variant):
+    return app.create_sensitivity_analysis(data['languages'])
+
+
+def roadmap_cashflow_figure(data, variant):
+    roadmap = app.compute_roadmap(data['phases'])
+    return app.create_roadmap_cashflow_chart(roadmap['monthly'], roadmap['summary']['breakeven_month'])
+
+
+def projection_figure(data, variant):
+    df_simulation = app.simulate_revenue_projection(
+        data['languages'],
+        confidence_level=variant['confidence_level'],
+        time_horizon=variant['time_horizon'],
+        n_paths=variant.get('n_paths', app.MONTE_CARLO_PATHS),
+    )
+    if df_simulation.empty:
+        df_simulation = data['projection']
+    return app.create_revenue_projection_with_scenarios(df_simulation, scenario_factor=variant['scenario_factor'])
+
+
+# Nome da figura -> (construtor, depende da variante de cenário)
+FIGURES = {
+    'tam': (tam_figure, False),
+    'roi_matrix': (roi_matrix_figure, False),
+    'competitive': (competitive_figure, False),
+    'sensitivity': (sensitivity_figure, False),
+    'roadmap_cashflow': (roadmap_cashflow_figure, False),
+    'projection': (projection_figure, True),
+}
+
+# Carregado uma vez por processo pelo initializer do pool
+_worker_data = None
+
+
+def _init_worker(data_dir):
+    global _worker_data
+    _worker_data = dict(zip(app.DATA_TABLES, app.load_data(Path(data_dir))))
+
+
+def build_variants(scenario_factors, confidence_levels, time_horizons, n_paths=None):
+    """Produto cartesiano dos controles de cenário"""
+    variants = []
+    for factor, confidence, horizon in itertools.product(scenario_factors, confidence_levels, time_horizons):
+        variant = dict(scenario_factor=factor, confidence_level=confidence, time_horizon=horizon)
+        if n_paths:
+            variant['n_paths'] = n_paths
+        variants.append(variant)
+    return variants
+
+
+def variant_suffix(variant):
+    return f"sf{variant['scenario_factor']:.2f}_cl{variant['confidence_level']:.2f}_h{variant['time_horizon']}"
+
+
+def build_jobs(figures, variants, output_dir, fmt="html", plotlyjs="directory", compact=False):
+    """Um job por arquivo; figuras que não dependem do cenário são renderizadas uma vez"""
+    jobs = []
+    for name in figures:
+        _, per_variant = FIGURES[name]
+        for variant in (variants if per_variant else variants[:1]):
+            stem = f"{name}__{variant_suffix(variant)}" if per_variant else name
+            jobs.append((name, variant, str(Path(output_dir) / f"{stem}.{fmt}"), fmt, plotlyjs, compact))
+    return jobs
+
+
+def render_job(job):
+    """Constrói uma figura e grava em disco; executa dentro de um worker do pool"""
+    name, variant, path, fmt, plotlyjs, compact = job
+    start = time.perf_counter()
+    fig = FIGURES[name][0](_worker_data, variant)
+    if compact:
+        fig = app.compact_figure(fig)
+    if fmt == "html":
+        fig.write_html(path, include_plotlyjs=PLOTLYJS_MODES[plotlyjs], full_html=True)
+    else:
+        fig.write_image(path, format=fmt)
+    return path, time.perf_counter() - start
+
+
+def render_reports(data_dir=app.DATA_DIR, output_dir="reports", fmt="html", figures=None,
+                   variants=None, workers=None, plotlyjs="directory", compact=False):
+    """
+    Renderiza as figuras selecionadas (todas por padrão) para cada variante de cenário.
+
+    Returns:
+        lista de (caminho, segundos) na ordem dos jobs
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}', expected one of {FORMATS}")
+    if fmt != "html" and importlib.util.find_spec("kaleido") is None:
+        raise ImportError("kaleido is required for SVG/PNG export")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if fmt == "html" and plotlyjs == "directory":
+        # Escrito uma vez aqui para que os workers não disputem o bundle compartilhado
+        from plotly.offline import get_plotlyjs
+        bundle = output_dir / "plotly.min.js"
+        if not bundle.exists():
+            bundle.write_text(get_plotlyjs(), encoding="utf-8")
+
+    jobs = build_jobs(figures or list(FIGURES), variants or [DEFAULT_VARIANT], output_dir, fmt, plotlyjs, compact)
+    workers = workers or os.cpu_count() or 1
+    # Agrupa jobs pequenos por ida e volta de IPC sem deixar workers ociosos
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(data_dir),)) as pool:
+        return list(pool.map(render_job, jobs, chunksize=chunksize))
+
+
+def payload_report(data_dir=app.DATA_DIR, figures=None, variant=None, budget=app.FIGURE_PAYLOAD_BUDGET_BYTES):
+    """Tamanho do JSON de cada figura (normal, compacto e sem template) contra o orçamento"""
+    data = dict(zip(app.DATA_TABLES, app.load_data(Path(data_dir))))
+    built = {name: FIGURES[name][0](data, variant or DEFAULT_VARIANT) for name in figures or FIGURES}
+    return app.analyze_figure_payloads(built, budget)
+
+
+def _floats(text):
+    return [float(value) for value in text.split(",")]
+
+
+def _ints(text):
+    return [int(value) for value in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render LingoDash figures to static files")
+    parser.add_argument("--data-dir", type=Path, default=app.DATA_DIR, help="Directory containing the CSV files")
+    parser.add_argument("--output-dir", type=Path, default=Path("reports"), help="Directory for the rendered files")
+    parser.add_argument("--format", choices=FORMATS, default="html", help="Output format (svg/png require kaleido)")
+    parser.add_argument("--figures", default=",".join(FIGURES), help=f"Comma-separated subset of: {', '.join(FIGURES)}")
+    parser.add_argument("--scenario-factors", type=_floats, default=[DEFAULT_VARIANT['scenario_factor']])
+    parser.add_argument("--confidence-levels", type=_floats, default=[DEFAULT_VARIANT['confidence_level']])
+    parser.add_argument("--horizons", type=_ints, default=[DEFAULT_VARIANT['time_horizon']])
+    parser.add_argument("--paths", type=int, default=None, help="Monte Carlo paths per projection variant")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--plotlyjs", choices=PLOTLYJS_MODES, default="directory",
+                        help="How HTML files load plotly.js (shared file, CDN or inlined)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write figures in compact mode (rounded typed arrays, text templates)")
+    parser.add_argument("--payload-report", action="store_true",
+                        help="Only measure the JSON payload of each figure against --budget")
+    parser.add_argument("--budget", type=int, default=app.FIGURE_PAYLOAD_BUDGET_BYTES,
+                        help="Payload budget per figure in bytes")
+    args = parser.parse_args()
+
+    figures = [name.strip() for name in args.figures.split(",") if name.strip()]
+    unknown = set(figures) - set(FIGURES)
+    if unknown:
+        print(f"❌ Unknown figures: {', '.join(sorted(unknown))}")
+        return 1
+    variants = build_variants(args.scenario_factors, args.confidence_levels, args.horizons, args.paths)
+
+    if args.payload_report:
+        report = payload_report(args.data_dir, figures, variants[0], args.budget)
+        print("=" * 60)
+        print(f"📦 Figure payloads (budget {args.budget:,} bytes)")
+        print("=" * 60)
+        print(report.to_string(index=False))
+        over = report.loc[report['Acima_Orçamento'], 'Figura'].tolist()
+        if over:
+            print(f"\n❌ Over budget: {', '.join(over)}")
+            return 1
+        print("\n✅ All figures within budget")
+        return 0
+
+    print("=" * 60)
+    print(f"🖼️  Rendering {len(figures)} figures × {len(variants)} scenario variants as {args.format.upper()}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    try:
+        results = render_reports(args.data_dir, args.output_dir, args.format, figures, variants,
+                                 args.workers, args.plotlyjs, args.compact)
+    except ImportError as error:
+        print(f"❌ {error}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    for path, seconds in results[:20]:
+        print(f"  ✅ {path} ({seconds:.2f}s)")
+    if len(results) > 20:
+        print(f"  … and {len(results) - 20} more")
+    print(f"\n📁 {len(results)} files written to {args.output_dir} in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
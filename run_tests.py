@@ -2,6 +2,10 @@
 """
 Test runner script for LingoDash tests
 Executes all test suites with coverage reporting
+
+Usage:
+    python run_tests.py           # test suites with coverage
+    python run_tests.py --scale   # scale benchmarks at 1k, 100k and 1M rows
 """
 
 import sys
@@ -57,5 +61,28 @@ def run_tests():
     
     return 0
 
+def run_scale_benchmarks():
+    """Run the benchmark budgets at every catalog size (1k, 100k and 1M rows)"""
+    
+    print("=" * 60)
+    print("📏 Running LingoDash Scale Benchmarks")
+    print("=" * 60)
+    
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(project_dir)
+    
+    env = dict(os.environ, LINGODASH_BENCH_SIZES="1000,100000,1000000")
+    cmd = ["python", "-m", "pytest", "tests/test_benchmarks.py", "-v", "-p", "no:xdist"]
+    print(" ".join(cmd))
+    print("-" * 60)
+    
+    result = subprocess.run(cmd, env=env, capture_output=False)
+    if result.returncode != 0:
+        print("\n❌ Scale benchmarks over budget")
+        return 1
+    
+    print("\n✅ All scale budgets met")
+    return 0
+
 if __name__ == "__main__":
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_scale_benchmarks() if "--scale" in sys.argv[1:] else run_tests())
\ No newline at end of file
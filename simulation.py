@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Simulation engines for LingoDash
+Monte Carlo revenue projection and vectorized sensitivity grid, kept free of
+Streamlit and Plotly so worker processes only import NumPy and pandas
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def run_pool_job(func_name, args, kwargs):
+    """
+    Ponto de entrada dos processos do pool: executa uma função deste módulo pelo nome.
+    O worker importa apenas este módulo, não o app Streamlit.
+    """
+    return globals()[func_name](*args, **kwargs)
+
+
+# ========================================================================================
+# MOTOR DE SIMULAÇÃO MONTE CARLO
+# ========================================================================================
+
+MONTE_CARLO_PATHS = 100_000
+MONTE_CARLO_SEED = 42
+# Volatilidade (desvio padrão log-normal) de cada premissa amostrada
+MONTE_CARLO_VOLATILITY = {'tam': 0.15, 'arppu': 0.10, 'cac': 0.20, 'growth': 0.35}
+# O crescimento observado Ano1→Ano2 decai pela metade a cada ano seguinte
+MONTE_CARLO_GROWTH_DECAY = 0.5
+# Limite de elementos (caminhos × idiomas) por bloco, para manter a memória estável
+MONTE_CARLO_CHUNK_ELEMENTS = 4_000_000
+
+
+def simulate_revenue_paths(df_languages, time_horizon=3, n_paths=MONTE_CARLO_PATHS,
+                           seed=MONTE_CARLO_SEED, volatility=None):
+    """
+    Simula caminhos de receita agregada (K) para todos os idiomas.
+
+    Para cada caminho e idioma são amostrados multiplicadores log-normais de TAM, ARPPU e CAC
+    e uma taxa de crescimento em torno do Revenue_Growth observado. Um CAC mais alto reduz o
+    crescimento obtido com o mesmo orçamento de aquisição. A receita do ano t é
+    Ano1_Revenue_K × TAM × ARPPU × Π(1 + crescimento × decaimento^k).
+
+    Returns:
+        ndarray (n_paths, time_horizon) com a receita agregada de cada ano
+    """
+    vol = {**MONTE_CARLO_VOLATILITY, **(volatility or {})}
+    base_revenue = df_languages['Ano1_Revenue_K'].to_numpy(dtype=float)
+    base_growth = (df_languages['Ano2_Revenue_K'] / df_languages['Ano1_Revenue_K'] - 1).to_numpy(dtype=float)
+    base_revenue = np.nan_to_num(base_revenue)
+    base_growth = np.nan_to_num(base_growth, posinf=0.0, neginf=0.0)
+    n_languages = len(base_revenue)
+
+    rng = np.random.default_rng(seed)
+    paths = np.zeros((n_paths, time_horizon))
+    chunk = max(1, MONTE_CARLO_CHUNK_ELEMENTS // max(n_languages, 1))
+
+    for start in range(0, n_paths, chunk):
+        size = (min(chunk, n_paths - start), n_languages)
+        # Log-normais com média 1 (mu = -sigma²/2) para não enviesar o cenário base
+        tam = rng.lognormal(-vol['tam'] ** 2 / 2, vol['tam'], size)
+        arppu = rng.lognormal(-vol['arppu'] ** 2 / 2, vol['arppu'], size)
+        cac = rng.lognormal(-vol['cac'] ** 2 / 2, vol['cac'], size)
+        growth = base_growth * rng.lognormal(-vol['growth'] ** 2 / 2, vol['growth'], size) / cac
+
+        revenue = base_revenue * tam * arppu
+        block = paths[start:start + size[0]]
+        block[:, 0] = revenue.sum(axis=1)
+        for year in range(1, time_horizon):
+            revenue *= 1 + growth * MONTE_CARLO_GROWTH_DECAY ** (year - 1)
+            block[:, year] = revenue.sum(axis=1)
+
+    return paths
+
+
+def simulate_revenue_projection(df_languages, confidence_level=0.95, time_horizon=3,
+                                n_paths=MONTE_CARLO_PATHS, seed=MONTE_CARLO_SEED):
+    """
+    Executa a simulação Monte Carlo e resume as bandas de percentis por ano,
+    no mesmo formato de df_projection (Período, Receita_Base_K, Receita_Min_K, Receita_Max_K, Confiança_Pct)
+    """
+    required_cols = {'Ano1_Revenue_K', 'Ano2_Revenue_K'}
+    if df_languages.empty or not required_cols.issubset(df_languages.columns):
+        return pd.DataFrame(columns=['Período', 'Receita_Base_K', 'Receita_Min_K', 'Receita_Max_K', 'Confiança_Pct'])
+
+    paths = simulate_revenue_paths(df_languages, time_horizon=time_horizon, n_paths=n_paths, seed=seed)
+    tail = (1 - confidence_level) / 2 * 100
+    lower, median, upper = np.percentile(paths, [tail, 50, 100 - tail], axis=0)
+
+    return pd.DataFrame({
+        'Período': [f"Ano {year}" for year in range(1, time_horizon + 1)],
+        'Receita_Base_K': median,
+        'Receita_Min_K': lower,
+        'Receita_Max_K': upper,
+        'Confiança_Pct': confidence_level * 100,
+    })
+
+
+# ========================================================================================
+# MOTOR DE SENSIBILIDADE VETORIZADO
+# ========================================================================================
+
+# Parâmetros de fallback quando não há dados de idiomas disponíveis
+SENSITIVITY_FALLBACK_BASE = {'TAM_Milhões': 100.0, 'conversion': 0.05, 'ARPPU_USD': 25.0}
+SENSITIVITY_DEFAULT_RANGE = (0.5, 2.0)  # 50% a 200% do base
+# Coluna opcional com a taxa de conversão pagante por idioma (fração, ex.: 0.05)
+SENSITIVITY_CONVERSION_COLUMN = 'Conversão'
+
+
+def _sensitivity_base(df, conversion=None):
+    """
+    Extrai TAM, conversão e ARPPU por idioma como arrays NumPy.
+    A conversão vem da coluna SENSITIVITY_CONVERSION_COLUMN quando presente; senão do
+    parâmetro `conversion` (escalar ou um valor por idioma), com fallback de 5%.
+    """
+    default_conversion = SENSITIVITY_FALLBACK_BASE['conversion'] if conversion is None else conversion
+    required_cols = {'Idioma', 'TAM_Milhões', 'ARPPU_USD'}
+    if df is None or df.empty or not required_cols.issubset(df.columns):
+        base = SENSITIVITY_FALLBACK_BASE
+        return (np.array(['Base']), np.array([base['TAM_Milhões']]),
+                np.atleast_1d(np.asarray(default_conversion, dtype=float))[:1], np.array([base['ARPPU_USD']]))
+
+    languages = df['Idioma'].to_numpy()
+    tam = df['TAM_Milhões'].to_numpy(dtype=float)
+    arppu = df['ARPPU_USD'].to_numpy(dtype=float)
+
+    rates = np.broadcast_to(np.asarray(default_conversion, dtype=float), len(df))
+    if SENSITIVITY_CONVERSION_COLUMN in df.columns:
+        column = df[SENSITIVITY_CONVERSION_COLUMN].to_numpy(dtype=float)
+        rates = np.where(np.isfinite(column), column, rates)
+
+    return languages, tam, rates, arppu
+
+
+def compute_sensitivity_grid(df=None, resolution=11, tam_range=SENSITIVITY_DEFAULT_RANGE,
+                             conversion_range=SENSITIVITY_DEFAULT_RANGE, languages=None, conversion=None):
+    """
+    Calcula a grade de receita (US$ milhões) TAM × Conversão por broadcasting NumPy.
+
+    Receita = (TAM × mult_tam) × (conversão × mult_conv) × ARPPU é bilinear nos multiplicadores,
+    então a grade é o produto externo dos multiplicadores escalado pela receita base
+    TAM_Milhões × conversão × ARPPU_USD de cada idioma - O(n_idiomas + resolução²), sem loops em Python.
+
+    Args:
+        df: DataFrame de idiomas (None usa os parâmetros de fallback)
+        resolution: pontos por eixo (int) ou tupla (n_tam, n_conversão)
+        languages: None para a grade agregada (soma de todos os idiomas) ou lista de idiomas
+            para uma grade por idioma com shape (n_idiomas, n_tam, n_conversão)
+        conversion: taxa de conversão base (escalar ou por idioma) quando df não tem a
+            coluna SENSITIVITY_CONVERSION_COLUMN; padrão 5%
+
+    Returns:
+        dict com 'tam_multipliers', 'conversion_multipliers', 'revenue' e 'languages'
+    """
+    n_tam, n_conv = (resolution, resolution) if np.isscalar(resolution) else resolution
+    tam_multipliers = np.linspace(tam_range[0], tam_range[1], int(n_tam))
+    conversion_multipliers = np.linspace(conversion_range[0], conversion_range[1], int(n_conv))
+    multiplier_grid = np.multiply.outer(tam_multipliers, conversion_multipliers)
+
+    names, tam, rates, arppu = _sensitivity_base(df, conversion)
+    base_revenue = np.nan_to_num(tam * rates * arppu)  # US$ milhões no ponto 1.0x × 1.0x
+
+    if languages is None:
+        revenue = base_revenue.sum() * multiplier_grid
+        names = np.array(['Todos'])
+    else:
+        mask = np.isin(names, list(languages))
+        names = names[mask]
+        revenue = base_revenue[mask][:, None, None] * multiplier_grid[None, :, :]
+
+    return {
+        'tam_multipliers': tam_multipliers,
+        'conversion_multipliers': conversion_multipliers,
+        'revenue': revenue,
+        'languages': names,
+    }
@@ -1,31 +1,67 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
+import os
 from pathlib import Path
 # ast import removed - no longer needed for data loading
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+import functools
+import bisect
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
+import re
+import sys
+import threading
 import warnings
 import time
-warnings.filterwarnings('ignore')
+
+# Motores de simulação num módulo sem Streamlit/Plotly, importado sozinho pelos workers do pool
+import simulation
+from simulation import (
+    MONTE_CARLO_PATHS, MONTE_CARLO_SEED, MONTE_CARLO_VOLATILITY, MONTE_CARLO_GROWTH_DECAY,
+    MONTE_CARLO_CHUNK_ELEMENTS, SENSITIVITY_FALLBACK_BASE, SENSITIVITY_DEFAULT_RANGE, SENSITIVITY_CONVERSION_COLUMN,
+    simulate_revenue_paths, simulate_revenue_projection, compute_sensitivity_grid,
+)
+
+
+class LazyModule:
+    """
+    Proxy que adia o import de um módulo pesado até o primeiro acesso a um atributo.
+    Reduz o tempo de cold start: o custo do import só é pago quando o módulo é usado.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+# Plotly graph_objects só é importado quando a primeira figura é construída
+go = LazyModule("plotly.graph_objects")
+pio = LazyModule("plotly.io")
 
 # ========================================================================================
 # CONFIGURAÇÃO DA PÁGINA E ESTILO
 # ========================================================================================
 
-st.set_page_config(
-    page_title="LingoDash: Estratégia de Expansão Multilíngue com Análise Científica",
-    page_icon="🌍",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 # Enhanced CSS with modern design system
-st.markdown("""
+APP_CSS = """
 <style>
     /* CSS Variables for Design System - Professional High-Contrast Palette */
     :root {
@@ -699,7 +735,76 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def configure_page():
+    """Configuração da página, filtros de warnings e estilos globais (executado por rerun, não no import)"""
+    warnings.filterwarnings('ignore')
+    st.set_page_config(
+        page_title="LingoDash: Estratégia de Expansão Multilíngue com Análise Científica",
+        page_icon="🌍",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(get_stylesheet_tag(), unsafe_allow_html=True)
+
+
+# Folha de estilo pré-compilada: servida como arquivo estático versionado pelo hash do conteúdo.
+# O arquivo é gerado em tempo de execução (ignorado pelo git); static/.gitkeep mantém a pasta no checkout
+STATIC_DIR = Path(__file__).parent / "static"
+STYLESHEET_PREFIX = "lingodash"
+
+
+def minify_css(css):
+    """Remove a tag <style>, comentários e espaços redundantes do CSS"""
+    css = re.sub(r"</?style>", "", css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def compile_stylesheet(css=APP_CSS):
+    """CSS minificado e o hash curto do conteúdo, usado no nome do arquivo"""
+    minified = minify_css(css)
+    return minified, hashlib.blake2b(minified.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def write_static_stylesheet(static_dir=None, css=APP_CSS):
+    """Grava static/lingodash.<hash>.css (se ainda não existir) e remove versões anteriores"""
+    minified, digest = compile_stylesheet(css)
+    static_dir = Path(static_dir if static_dir is not None else STATIC_DIR)
+    static_dir.mkdir(parents=True, exist_ok=True)
+    path = static_dir / f"{STYLESHEET_PREFIX}.{digest}.css"
+    if not path.exists():
+        path.write_text(minified, encoding="utf-8")
+    for stale in static_dir.glob(f"{STYLESHEET_PREFIX}.*.css"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return path
+
+
+def stylesheet_tag(static_serving, static_dir=None, css=APP_CSS):
+    """
+    <link> para o arquivo estático quando o static serving do Streamlit está ativo
+    (~70 bytes por rerun, o navegador reaproveita o arquivo); caso contrário o CSS
+    minificado inline.
+    """
+    if static_serving:
+        try:
+            path = write_static_stylesheet(static_dir, css)
+            return f'<link rel="stylesheet" href="app/static/{path.name}">'
+        except OSError:
+            pass  # Diretório somente leitura: usa o CSS inline
+    return f"<style>{compile_stylesheet(css)[0]}</style>"
+
+
+@st.cache_resource
+def get_stylesheet_tag():
+    """Tag de estilo do processo, compilada uma única vez"""
+    return stylesheet_tag(bool(st.get_option("server.enableStaticServing")))
 
 # =================================================================================
 # PALETA DE CORES CIENTIFICAMENTE OTIMIZADA - BASEADA EM PESQUISA ONLINE
@@ -784,89 +889,534 @@ def create_tufte_optimized_layout():
     }
 
 # Performance and accessibility monitoring
-import time
-
 def add_accessibility_attrs(fig, title, description=""):
     """
     Adds WCAG 2.1 AA compliant accessibility features to charts
     """
-    fig.update_layout(
-        title={
-            'text': f"<b style='color: {COLORS['primary']}'>{title}</b>",
-            'x': 0.02,  # Left-aligned for better readability
-            'font': {'size': 16, 'family': 'Inter'},
-        }
-    )
+    # Alinhamento e fonte do título vêm do template 'lingodash'
+    fig.update_layout(title_text=f"<b style='color: {COLORS['primary']}'>{title}</b>")
     return fig
 
+# Design system registrado como template do Plotly: validado uma única vez por processo e
+# referenciado pelo nome em cada figura, em vez de reaplicar o layout Tufte por gráfico
+TUFTE_TEMPLATE_NAME = "lingodash"
+
+
+def tufte_template():
+    """
+    Nome do template 'lingodash' (layout Tufte + alinhamento e fonte dos títulos).
+    O registro em plotly.io.templates acontece no primeiro uso, já que o Plotly é importado
+    sob demanda, e vale para todos os reruns e sessões do processo.
+    """
+    if TUFTE_TEMPLATE_NAME not in pio.templates:
+        layout = create_tufte_optimized_layout()
+        layout['title'] = {'x': 0.02, 'font': {'size': 16, 'family': 'Inter'}}
+        layout['hoverlabel'] = {'align': 'left'}
+        pio.templates[TUFTE_TEMPLATE_NAME] = go.layout.Template(layout=layout)
+    return TUFTE_TEMPLATE_NAME
+
+# ========================================================================================
+# INSTRUMENTAÇÃO DE PERFORMANCE (POR RERUN)
+# ========================================================================================
+
+# LINGODASH_PERF=0 desliga a coleta; os wrappers passam a chamar a função diretamente
+PERF_ENABLED = os.environ.get("LINGODASH_PERF", "1") != "0"
+# Registros mantidos por rerun (os mais antigos são descartados)
+PERF_MAX_RECORDS = 2_000
+
+
+class PerfRecorder:
+    """
+    Registra, para cada trecho instrumentado: tempo de parede, tempo de CPU do thread e a
+    variação líquida de blocos alocados pelo interpretador (sys.getallocatedblocks).
+    Trechos aninhados são registrados com sua profundidade; apenas os de profundidade 0
+    somam o total do rerun.
+    """
+
+    def __init__(self, max_records=PERF_MAX_RECORDS):
+        self.records = deque(maxlen=max_records)
+        self.started_at = datetime.now()
+        self._depth = 0
+
+    @contextmanager
+    def span(self, name):
+        depth = self._depth
+        self._depth += 1
+        wall, cpu, blocks = time.perf_counter(), time.thread_time(), sys.getallocatedblocks()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.records.append({
+                'name': name,
+                'depth': depth,
+                'wall_ms': (time.perf_counter() - wall) * 1000,
+                'cpu_ms': (time.thread_time() - cpu) * 1000,
+                'alloc_blocks': sys.getallocatedblocks() - blocks,
+            })
+
+    def summary(self):
+        """Agregado por trecho (chamadas, tempos totais e blocos), do mais lento para o mais rápido"""
+        columns = ['name', 'calls', 'wall_ms', 'cpu_ms', 'alloc_blocks']
+        if not self.records:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame(list(self.records))
+        summary = df.groupby('name', sort=False).agg(
+            calls=('wall_ms', 'size'), wall_ms=('wall_ms', 'sum'),
+            cpu_ms=('cpu_ms', 'sum'), alloc_blocks=('alloc_blocks', 'sum')
+        ).reset_index()
+        return summary[columns].sort_values('wall_ms', ascending=False, ignore_index=True)
+
+    def total_wall_ms(self):
+        return sum(record['wall_ms'] for record in self.records if record['depth'] == 0)
+
+    def export(self):
+        """Registros e agregados em estrutura serializável em JSON"""
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'total_wall_ms': round(self.total_wall_ms(), 3),
+            'summary': self.summary().round(3).to_dict(orient='records'),
+            'records': [{**record, 'wall_ms': round(record['wall_ms'], 3), 'cpu_ms': round(record['cpu_ms'], 3)}
+                        for record in self.records],
+        }
+
+
+# Sob o Streamlit o script é reexecutado a cada rerun, então este recorder é por rerun e sessão
+PERF_RECORDER = PerfRecorder()
+
+
+def reset_perf_recorder():
+    """Inicia um recorder vazio para o rerun atual"""
+    global PERF_RECORDER
+    PERF_RECORDER = PerfRecorder()
+    return PERF_RECORDER
+
+
+def perf_span(name):
+    """Context manager que registra o trecho no recorder do rerun atual"""
+    return PERF_RECORDER.span(name)
+
+
+def instrumented(func=None, *, name=None):
+    """Decorator que registra cada chamada da função no recorder do rerun atual"""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PERF_ENABLED:
+                return func(*args, **kwargs)
+            with perf_span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate(func) if func is not None else decorate
+
 # ========================================================================================
 # DADOS ESTRUTURADOS (Baseados no relatório original)
 # ========================================================================================
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour, no hash functions needed
-def load_data():
-    """Carrega e estrutura todos os dados do relatório LingoApp"""
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _file_content_hash(path, mtime_ns, size):
+    """Hash do conteúdo de um arquivo; mtime e tamanho fazem parte da chave, então só é recalculado quando mudam"""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+def data_file_signature(path):
+    """Assinatura (nome, mtime, tamanho, hash do conteúdo) de um arquivo de dados"""
+    path = Path(path)
+    stat = path.stat()
+    return (path.name, stat.st_mtime_ns, stat.st_size, _file_content_hash(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def data_files_signature(data_dir=DATA_DIR):
+    """Assinatura de todos os arquivos de dados, usada para invalidar caches derivados"""
+    return tuple(data_file_signature(path) for path in sorted(Path(data_dir).glob("*.csv")))
+
+
+# Assinatura calculada uma vez por rerun em main(); o script é reexecutado a cada rerun, então o valor
+# pertence à execução que carregou os dados (e às reexecuções de fragmentos dessa execução)
+_RUN_DATA_SIGNATURE = None
+
+
+def begin_data_run(data_dir=DATA_DIR):
+    """Fixa a assinatura dos arquivos de dados para a execução atual"""
+    global _RUN_DATA_SIGNATURE
+    _RUN_DATA_SIGNATURE = data_files_signature(data_dir)
+    return _RUN_DATA_SIGNATURE
+
+
+def run_data_signature():
+    """Assinatura da execução atual; fora de main() é calculada na hora"""
+    return _RUN_DATA_SIGNATURE if _RUN_DATA_SIGNATURE is not None else data_files_signature()
+
+
+def prepare_languages(df_languages):
+    """Renomeia colunas e calcula ROI_Ratio, ROI_Ano2_K e Revenue_Growth"""
+    # Dados principais dos idiomas (corrigidos para demanda de aprendizado)
+    df_languages = df_languages.rename(columns={
+        'TAM_Milhoes': 'TAM_Milhões',
+        'Complexidade_Tecnica': 'Complexidade_Técnica',
+        'Competicao_Level': 'Competição_Level'
+    })
+    df_languages['ROI_Ratio'] = df_languages['LTV_USD'] / df_languages['CAC_USD']
+    df_languages['ROI_Ano2_K'] = df_languages['Ano2_Revenue_K'] - df_languages['Investimento_K']
+    df_languages['Revenue_Growth'] = (df_languages['Ano2_Revenue_K'] / df_languages['Ano1_Revenue_K'] - 1) * 100
+    return df_languages
+
+
+def prepare_phases(df_phases):
+    """Dados de fases de rollout - Idiomas fica como string; a versão estruturada é explode_phase_languages()"""
+    return df_phases.rename(columns={
+        'Usuarios_Projetados': 'Usuários_Projetados'
+    })
+
+
+def prepare_competitors(df_competitors):
+    """Análise competitiva"""
+    return df_competitors.rename(columns={
+        'Modelo_Negocio': 'Modelo_Negócio',
+        'User_Base_Milhoes': 'User_Base_Milhões',
+        'Revenue_Milhoes': 'Revenue_Milhões'
+    })
+
+
+def prepare_projection(df_projection):
+    """Projeção de receita temporal"""
+    return df_projection.rename(columns={
+        'Periodo': 'Período',
+        'Confianca_Pct': 'Confiança_Pct'
+    })
+
+
+# Tabelas na ordem retornada por load_data, com a preparação aplicada a cada CSV
+DATA_TABLES = {
+    'languages': prepare_languages,
+    'phases': prepare_phases,
+    'competitors': prepare_competitors,
+    'projection': prepare_projection,
+}
+
+# ========================================================================================
+# ARMAZENAMENTO COLUNAR COMPILADO (ARROW IPC / FEATHER V2)
+# ========================================================================================
+
+COMPILED_DIR_NAME = "compiled"
+COMPILED_SUFFIX = ".arrow"
+
+
+def compiled_table_path(name, data_dir=DATA_DIR):
+    """Caminho do arquivo compilado de uma tabela"""
+    return Path(data_dir) / COMPILED_DIR_NAME / f"{name}{COMPILED_SUFFIX}"
+
+
+def _source_metadata(csv_path):
+    """Metadados do CSV de origem gravados no arquivo compilado para detectar versões desatualizadas"""
+    stat = Path(csv_path).stat()
+    return {b'source_mtime_ns': str(stat.st_mtime_ns).encode(), b'source_size': str(stat.st_size).encode()}
+
+
+def compile_data(data_dir=DATA_DIR):
+    """
+    Converte data/*.csv em arquivos Arrow IPC tipados, com renomeações e colunas derivadas
+    já aplicadas. Os arquivos são gravados sem compressão para permitir memory-mapping.
+
+    Returns:
+        dict nome -> caminho do arquivo compilado
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    written = {}
+    for name, prepare in DATA_TABLES.items():
+        csv_path = Path(data_dir) / f"{name}.csv"
+        table = pa.Table.from_pandas(prepare(pd.read_csv(csv_path)), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_source_metadata(csv_path)})
+
+        output = compiled_table_path(name, data_dir)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        feather.write_feather(table, output, compression='uncompressed')
+        written[name] = output
+    return written
+
+
+def read_compiled_table(name, data_dir=DATA_DIR):
+    """
+    Lê a tabela compilada via memory-map (zero-copy para colunas numéricas sem nulos).
+    Retorna None se o arquivo não existir, estiver desatualizado em relação ao CSV
+    ou se o pyarrow não estiver instalado - nesses casos o chamador usa o CSV.
+    """
+    compiled = compiled_table_path(name, data_dir)
+    csv_path = Path(data_dir) / f"{name}.csv"
+    if not compiled.exists():
+        return None
+    try:
+        import pyarrow.feather as feather
+        table = feather.read_table(compiled, memory_map=True)
+    except (ImportError, OSError, ValueError):
+        return None
+
+    metadata = table.schema.metadata or {}
+    source = _source_metadata(csv_path)
+    if any(metadata.get(key) != value for key, value in source.items()):
+        return None  # CSV alterado desde a compilação
+    return table.to_pandas(split_blocks=True)
+
+
+def read_table(name, data_dir=DATA_DIR):
+    """Lê uma tabela do armazenamento compilado, com fallback para o CSV"""
+    df = read_compiled_table(name, data_dir)
+    if df is None:
+        df = DATA_TABLES[name](pd.read_csv(Path(data_dir) / f"{name}.csv"))
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_table_cached(name, data_dir, content_hash):
+    """
+    Carrega uma tabela e registra o horário da carga.
+    A chave é o hash do conteúdo do CSV: apenas a tabela cujo arquivo mudou é recarregada.
+    """
+    return read_table(name, Path(data_dir)), datetime.now()
+
+
+@instrumented
+def load_data_with_status(data_dir=DATA_DIR):
+    """
+    Carrega as quatro tabelas com invalidação por arquivo (mtime, tamanho e hash do conteúdo).
+
+    Returns:
+        ((df_languages, df_phases, df_competitors, df_projection), horário da carga mais recente)
+    """
     try:
-        data_dir = Path(__file__).parent / "data"
-
-        # Dados principais dos idiomas (corrigidos para demanda de aprendizado)
-        df_languages = pd.read_csv(data_dir / "languages.csv")
-        df_languages.rename(columns={
-            'TAM_Milhoes': 'TAM_Milhões',
-            'Complexidade_Tecnica': 'Complexidade_Técnica',
-            'Competicao_Level': 'Competição_Level'
-        }, inplace=True)
-        df_languages['ROI_Ratio'] = df_languages['LTV_USD'] / df_languages['CAC_USD']
-        df_languages['ROI_Ano2_K'] = df_languages['Ano2_Revenue_K'] - df_languages['Investimento_K']
-        df_languages['Revenue_Growth'] = (df_languages['Ano2_Revenue_K'] / df_languages['Ano1_Revenue_K'] - 1) * 100
-
-        # Dados de fases de rollout - keep as strings to avoid hashing issues
-        df_phases = pd.read_csv(data_dir / "phases.csv")
-        df_phases.rename(columns={
-            'Usuarios_Projetados': 'Usuários_Projetados'
-        }, inplace=True)
-        # Keep original string format to avoid unhashable list issues
-        # Lists will be parsed when needed in specific functions
-
-        # Análise competitiva
-        df_competitors = pd.read_csv(data_dir / "competitors.csv")
-        df_competitors.rename(columns={
-            'Modelo_Negocio': 'Modelo_Negócio',
-            'User_Base_Milhoes': 'User_Base_Milhões',
-            'Revenue_Milhoes': 'Revenue_Milhões'
-        }, inplace=True)
-
-        # Projeção de receita temporal
-        df_projection = pd.read_csv(data_dir / "projection.csv")
-        df_projection.rename(columns={
-            'Periodo': 'Período',
-            'Confianca_Pct': 'Confiança_Pct'
-        }, inplace=True)
-
-        return df_languages, df_phases, df_competitors, df_projection
+        started_at = datetime.now()
+        loaded = [
+            _load_table_cached(name, str(data_dir), data_file_signature(Path(data_dir) / f"{name}.csv")[3])
+            for name in DATA_TABLES
+        ]
+        # Tabela carregada antes desta chamada veio do cache
+        metrics = get_metrics_registry()
+        for name, (_, loaded_at) in zip(DATA_TABLES, loaded):
+            metrics.inc('lingodash_load_data_cache_total', table=name,
+                        result='hit' if loaded_at < started_at else 'miss')
+        frames = tuple(df for df, _ in loaded)
+        return frames, max(loaded_at for _, loaded_at in loaded)
         
     except Exception as e:
         st.error(f"Erro ao carregar dados: {str(e)}")
         # Return empty DataFrames as fallback
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        return (pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()), None
+
+
+@instrumented
+def load_data(data_dir=DATA_DIR):
+    """Carrega e estrutura todos os dados do relatório LingoApp"""
+    return load_data_with_status(data_dir)[0]
+
+
+# ========================================================================================
+# TABELA FASE → IDIOMA (ESTRUTURADA)
+# ========================================================================================
+
+# Colunas de df_languages trazidas para cada linha fase → idioma
+PHASE_LANGUAGE_COLUMNS = ['TAM_Milhões', 'ARPPU_USD', 'Investimento_K', 'Ano1_Revenue_K', 'Ano2_Revenue_K', 'ROI_Ratio']
+PHASE_LANGUAGE_PATTERN = r"""['"]([^'"]+)['"]"""
+
+
+def explode_phase_languages(df_phases, df_languages):
+    """
+    Normaliza a coluna Idiomas (listas em string) numa tabela com uma linha por fase e idioma.
+
+    As métricas da fase ganham o sufixo _Fase; as colunas de PHASE_LANGUAGE_COLUMNS vêm de
+    df_languages (NaN para idiomas sem cadastro, sinalizados em Idioma_Cadastrado). Todas as
+    colunas são escalares, então a tabela pode ser hasheada pelos caches.
+    """
+    phases = df_phases.reset_index(drop=True)
+    names = phases['Idiomas'].astype(str).str.findall(PHASE_LANGUAGE_PATTERN).explode().dropna().str.strip()
+
+    exploded = pd.DataFrame({
+        'Fase': phases['Fase'].to_numpy()[names.index],
+        'Fase_Ordem': names.index.to_numpy(dtype=np.int64),
+        'Idioma': names.to_numpy(dtype=object),
+        'Idiomas_na_Fase': names.groupby(level=0).size().reindex(names.index).to_numpy(),
+        'Investimento_Fase_K': phases['Investimento_K'].to_numpy()[names.index],
+        'Receita_Fase_K': phases['Receita_Esperada_K'].to_numpy()[names.index],
+        'Usuários_Fase': phases['Usuários_Projetados'].to_numpy()[names.index],
+    })
+
+    language_cols = [col for col in PHASE_LANGUAGE_COLUMNS if col in df_languages.columns]
+    if 'Idioma' in df_languages.columns:
+        languages = df_languages.drop_duplicates('Idioma').set_index('Idioma')[language_cols]
+        exploded = exploded.join(languages, on='Idioma')
+        exploded['Idioma_Cadastrado'] = exploded['Idioma'].isin(languages.index)
+    else:
+        exploded['Idioma_Cadastrado'] = False
+    return exploded
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _phase_languages_cached(data_dir, phases_hash, languages_hash):
+    """Tabela fase → idioma, chaveada pelos hashes de phases.csv e languages.csv"""
+    df_phases, _ = _load_table_cached('phases', data_dir, phases_hash)
+    df_languages, _ = _load_table_cached('languages', data_dir, languages_hash)
+    return explode_phase_languages(df_phases, df_languages)
+
+
+@instrumented
+def load_phase_languages(data_dir=DATA_DIR):
+    """Carrega a tabela fase → idioma; só é recalculada quando phases.csv ou languages.csv mudam"""
+    try:
+        hashes = [data_file_signature(Path(data_dir) / f"{name}.csv")[3] for name in ('phases', 'languages')]
+        return _phase_languages_cached(str(data_dir), *hashes)
+    except Exception as e:
+        st.error(f"Erro ao carregar fases: {str(e)}")
+        return pd.DataFrame()
+
+# ========================================================================================
+# NÍVEL DE DETALHE (LOD) PARA GRÁFICOS DE DISPERSÃO
+# ========================================================================================
+
+# Acima deste número de pontos os gráficos de dispersão passam para WebGL com agregação no servidor
+LOD_POINT_THRESHOLD = 2_000
+# Células por eixo da grade de agregação: no máximo LOD_GRID_BINS² marcadores por gráfico
+LOD_GRID_BINS = 50
+# Apenas os N pontos mais relevantes recebem rótulo no modo agregado
+LOD_LABEL_TOP_N = 12
+
+
+def use_level_of_detail(df, threshold=LOD_POINT_THRESHOLD):
+    """Indica se o gráfico deve usar o modo agregado (WebGL + binning)"""
+    return len(df) > threshold
+
+
+def _grid_index(values, bins):
+    """Índice de célula (0..bins-1) de cada valor numa grade linear entre o mínimo e o máximo"""
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if not np.isfinite(hi - lo) or hi == lo:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.clip(((values - lo) / (hi - lo) * bins).astype(np.int64), 0, bins - 1)
+
+
+def bin_points(df, x, y, weight, mean_cols=(), bins=LOD_GRID_BINS):
+    """
+    Agrega pontos numa grade bins × bins.
+
+    Cada célula ocupada vira um ponto no centróide (média de x e y) dos seus pontos, com
+    contagem, soma de `weight` e média das colunas em `mean_cols`. O resultado tem no
+    máximo bins² linhas, independentemente do tamanho de df.
+    """
+    data = df[[x, y, weight, *mean_cols]].dropna(subset=[x, y])
+    xs = data[x].to_numpy(dtype=float)
+    ys = data[y].to_numpy(dtype=float)
+    cell = _grid_index(xs, bins) * bins + _grid_index(ys, bins)
+
+    agg = {x: 'mean', y: 'mean', weight: 'sum', **{col: 'mean' for col in mean_cols}}
+    grouped = data.groupby(cell, sort=False)
+    binned = grouped.agg(agg)
+    binned['Count'] = grouped.size()
+    return binned.reset_index(drop=True)
+
+
+def top_n_rows(df, column, n=LOD_LABEL_TOP_N):
+    """As n linhas com maior valor em `column` (argpartition, sem ordenar a tabela toda)"""
+    values = df[column].to_numpy(dtype=float)
+    if len(values) <= n:
+        return df
+    idx = np.argpartition(np.nan_to_num(values, nan=-np.inf), -n)[-n:]
+    return df.iloc[idx[np.argsort(-values[idx])]]
+
+
+def _bubble_sizes(values, min_size, max_size):
+    """Escala de área (raiz quadrada) para o tamanho dos marcadores agregados"""
+    root = np.sqrt(np.clip(np.asarray(values, dtype=float), 0, None))
+    peak = root.max() if len(root) else 0
+    if not peak:
+        return np.full(len(root), min_size, dtype=float)
+    return min_size + root / peak * (max_size - min_size)
+
+# ========================================================================================
+# ÍNDICE DE RANKING (TOP-K E SUBCONJUNTOS)
+# ========================================================================================
+
+# Chaves de ranking indexadas: coluna -> maior valor primeiro?
+RANK_INDEX_KEYS = {'TAM_Milhões': True, 'Rank_Global': False, 'ROI_Ratio': True}
+TAM_CHART_TOP_K = 8
+
+
+class RankIndex:
+    """
+    Ordenações pré-calculadas de df_languages por cada chave de ranking.
+
+    `order[chave]` lista as posições das linhas do melhor para o pior (NaN por último) e
+    `rank[chave]` é a permutação inversa (posição de cada linha no ranking). Top-K é um
+    fatiamento e um subconjunto é ordenado só pelos seus próprios ranks, sem reordenar o catálogo.
+    """
+
+    def __init__(self, df, keys=RANK_INDEX_KEYS):
+        self.languages = pd.Index(df['Idioma'] if 'Idioma' in df.columns else [])
+        self.order = {}
+        self.rank = {}
+        for key, descending in keys.items():
+            if key not in df.columns:
+                continue
+            values = df[key].to_numpy(dtype=float)
+            order = np.argsort(-values if descending else values, kind='stable')
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            self.order[key] = order
+            self.rank[key] = rank
+
+    @property
+    def nbytes(self):
+        arrays = [*self.order.values(), *self.rank.values()]
+        return sum(array.nbytes for array in arrays) + int(self.languages.memory_usage(deep=True))
+
+    def top_k(self, key, k):
+        """Posições das k melhores linhas pela chave"""
+        return self.order.get(key, np.array([], dtype=np.int64))[:k]
+
+    def subset(self, key, languages):
+        """Posições dos idiomas selecionados, na ordem do ranking (idiomas desconhecidos são ignorados)"""
+        languages = list(languages)
+        if self.languages.is_unique:
+            positions = self.languages.get_indexer(languages)
+        else:
+            positions = self.languages.get_indexer_non_unique(languages)[0]
+        positions = positions[positions >= 0]
+        if key not in self.rank:
+            return positions[:0]
+        return positions[np.argsort(self.rank[key][positions], kind='stable')]
+
+
+def build_rank_index(df, keys=RANK_INDEX_KEYS):
+    """Constrói o índice de ranking (uma ordenação por chave)"""
+    return RankIndex(df, keys)
 
 # ========================================================================================
 # FUNÇÕES DE VISUALIZAÇÃO AVANÇADAS
 # ========================================================================================
 
-def create_interactive_tam_chart(df, selected_languages=None):
+@instrumented
+def create_interactive_tam_chart(df, selected_languages=None, top_k=TAM_CHART_TOP_K, rank_index=None):
     """
     Enhanced TAM chart following Tufte's data-ink ratio principles
     Emphasizes data over decoration, uses strategic color coding
+    Rows come from the TAM rank index: top-K by slicing, or the selected languages in rank order
     """
-    df_filtered = df.head(8) if selected_languages is None else df[df['Idioma'].isin(selected_languages)]
-    df_sorted = df_filtered.sort_values('TAM_Milhões', ascending=True)
+    rank_index = rank_index if rank_index is not None else build_rank_index(df)
+    if selected_languages is None:
+        positions = rank_index.top_k('TAM_Milhões', top_k)
+    else:
+        positions = rank_index.subset('TAM_Milhões', selected_languages)
+    df_sorted = df.iloc[positions[::-1]]  # Ascending: largest bar on top
     
     fig = go.Figure()
     
     # Strategic color coding: highlight top performers only
-    colors = [COLORS['data_focus'] if x in df_sorted['Idioma'].tail(3).values 
-              else COLORS['primary'] for x in df_sorted['Idioma']]
+    colors = np.where(np.arange(len(df_sorted)) >= len(df_sorted) - 3,
+                      COLORS['data_focus'], COLORS['primary']).tolist()
     
     fig.add_trace(go.Bar(
         y=df_sorted['Idioma'],
@@ -874,7 +1424,7 @@ def create_interactive_tam_chart(df, selected_languages=None):
         orientation='h',
         marker_color=colors,
         marker_line=dict(width=0),  # Remove borders (eliminate chartjunk)
-        text=[f"{x}M" for x in df_sorted['TAM_Milhões']],  # Direct labeling (Tufte principle)
+        text=df_sorted['TAM_Milhões'].astype(str) + "M",  # Direct labeling (Tufte principle)
         textposition='inside',
         textfont=dict(color='white', weight='bold', size=11),
         hovertemplate='<b>%{y}</b><br>Demanda: %{x}M pessoas<br>Rank: #%{customdata}<extra></extra>',
@@ -883,8 +1433,7 @@ def create_interactive_tam_chart(df, selected_languages=None):
     ))
     
     # Apply Tufte-optimized layout
-    tufte_layout = create_tufte_optimized_layout()
-    fig.update_layout(**tufte_layout)
+    fig.update_layout(template=tufte_template())
     
     # Add accessibility and minimal styling
     fig = add_accessibility_attrs(
@@ -901,30 +1450,77 @@ def create_interactive_tam_chart(df, selected_languages=None):
     
     return fig
 
-def create_advanced_roi_matrix(df):
-    """Matriz ROI vs Complexidade com bubbles"""
-    fig = go.Figure()
-    
-    # Normalizar tamanho dos bubbles
-    sizes = (df['TAM_Milhões'] / df['TAM_Milhões'].max() * 50 + 10)
-    
-    fig.add_trace(go.Scatter(
-        x=df['Complexidade_Técnica'],
-        y=df['ROI_Ratio'],
-        mode='markers+text',
+ROI_PAYBACK_COLORSCALE = [[0.0, COLORS['success']], [0.5, COLORS['benchmark']], [1.0, COLORS['highlight']]]
+
+
+def _add_roi_matrix_lod_traces(fig, df):
+    """Modo agregado da matriz ROI: agrupamentos em WebGL e rótulos só para os maiores TAMs"""
+    binned = bin_points(df, 'Complexidade_Técnica', 'ROI_Ratio', 'TAM_Milhões', mean_cols=('Payback_Meses',))
+    fig.add_trace(go.Scattergl(
+        x=binned['Complexidade_Técnica'],
+        y=binned['ROI_Ratio'],
+        mode='markers',
         marker=dict(
-            size=sizes,
-            color=df['Payback_Meses'],
-            colorscale=[[0.0, COLORS['success']], [0.5, COLORS['benchmark']], [1.0, COLORS['highlight']]],
+            size=_bubble_sizes(binned['TAM_Milhões'], 6, 40),
+            color=binned['Payback_Meses'],
+            colorscale=ROI_PAYBACK_COLORSCALE,
             colorbar=dict(title="Payback (meses)"),
-            line=dict(width=2, color='white')
+            opacity=0.75,
+            line=dict(width=1, color='white')
         ),
-        text=df['Idioma'],
-        textposition='middle center',
-        textfont=dict(size=10, color='white'),
-        hovertemplate='<b>%{text}</b><br>Complexidade: %{x}/10<br>ROI: %{y:.1f}x<br>TAM: %{customdata}M<br>Payback: %{marker.color} meses<extra></extra>',
-        customdata=df['TAM_Milhões']
+        customdata=np.column_stack([binned['Count'], binned['TAM_Milhões']]),
+        hovertemplate='<b>%{customdata[0]:,} idiomas</b><br>Complexidade média: %{x:.1f}/10<br>ROI médio: %{y:.1f}x<br>TAM total: %{customdata[1]:,.0f}M<br>Payback médio: %{marker.color:.1f} meses<extra></extra>',
+        name='Agrupamentos'
+    ))
+    
+    top = top_n_rows(df, 'TAM_Milhões')
+    fig.add_trace(go.Scatter(
+        x=top['Complexidade_Técnica'],
+        y=top['ROI_Ratio'],
+        mode='markers+text',
+        marker=dict(size=8, color=COLORS['primary'], line=dict(width=1, color='white')),
+        text=top['Idioma'],
+        textposition='top center',
+        textfont=dict(size=10, color=COLORS['primary']),
+        customdata=top['TAM_Milhões'],
+        hovertemplate='<b>%{text}</b><br>Complexidade: %{x}/10<br>ROI: %{y:.1f}x<br>TAM: %{customdata}M<extra></extra>',
+        name=f'Top {len(top)} por TAM'
     ))
+    fig.update_layout(showlegend=False)
+
+
+@instrumented
+def create_advanced_roi_matrix(df):
+    """
+    Matriz ROI vs Complexidade com bubbles.
+    Acima de LOD_POINT_THRESHOLD idiomas, os pontos são agregados numa grade (WebGL) e apenas
+    os LOD_LABEL_TOP_N maiores TAMs recebem rótulo, mantendo o payload limitado.
+    """
+    fig = go.Figure()
+    
+    if use_level_of_detail(df):
+        _add_roi_matrix_lod_traces(fig, df)
+    else:
+        # Normalizar tamanho dos bubbles
+        sizes = (df['TAM_Milhões'] / df['TAM_Milhões'].max() * 50 + 10)
+        
+        fig.add_trace(go.Scatter(
+            x=df['Complexidade_Técnica'],
+            y=df['ROI_Ratio'],
+            mode='markers+text',
+            marker=dict(
+                size=sizes,
+                color=df['Payback_Meses'],
+                colorscale=ROI_PAYBACK_COLORSCALE,
+                colorbar=dict(title="Payback (meses)"),
+                line=dict(width=2, color='white')
+            ),
+            text=df['Idioma'],
+            textposition='middle center',
+            textfont=dict(size=10, color='white'),
+            hovertemplate='<b>%{text}</b><br>Complexidade: %{x}/10<br>ROI: %{y:.1f}x<br>TAM: %{customdata}M<br>Payback: %{marker.color} meses<extra></extra>',
+            customdata=df['TAM_Milhões']
+        ))
     
     # Linhas de referência
     fig.add_hline(y=3, line_dash="dash", line_color=COLORS['benchmark'], 
@@ -942,6 +1538,7 @@ def create_advanced_roi_matrix(df):
     
     return fig
 
+@instrumented
 def create_revenue_projection_with_scenarios(df_proj, scenario_factor=1.0):
     """Projeção de receita com cenários otimista/pessimista"""
     fig = go.Figure()
@@ -977,28 +1574,77 @@ def create_revenue_projection_with_scenarios(df_proj, scenario_factor=1.0):
     ))
     
     # Marcos importantes
-    fig.add_annotation(
-        x='Ano 1',
-        y=df_proj[df_proj['Período'] == 'Ano 1']['Receita_Base_K'].iloc[0] * scenario_factor,
-        text="Breakeven Global",
-        arrowhead=2,
-        arrowcolor=COLORS['benchmark']
-    )
+    first_year = df_proj[df_proj['Período'] == 'Ano 1']
+    if not first_year.empty:
+        fig.add_annotation(
+            x='Ano 1',
+            y=first_year['Receita_Base_K'].iloc[0] * scenario_factor,
+            text="Breakeven Global",
+            arrowhead=2,
+            arrowcolor=COLORS['benchmark']
+        )
     
     fig.update_layout(
         title=f'📈 Projeção de Receita (Cenário: {scenario_factor:.1f}x)',
         xaxis_title='Período',
         yaxis_title='Receita (K Reais)',
         height=400,
-        template='plotly_white'
+        showlegend=True,  # Base, pessimista e otimista: a legenda identifica os cenários
+        template=tufte_template()
     )
     
     return fig
 
+OUR_PRODUCT = 'LingoDash (Projetado)'
+
+
+def _add_competitive_lod_traces(fig, df_comp, colors_map):
+    """Modo agregado do posicionamento competitivo: agrupamentos em WebGL e rótulos só para os maiores market shares"""
+    binned = bin_points(df_comp, 'User_Base_Milhões', 'Revenue_Milhões', 'Market_Share_Pct', mean_cols=('Idiomas_Count',))
+    fig.add_trace(go.Scattergl(
+        x=binned['User_Base_Milhões'],
+        y=binned['Revenue_Milhões'],
+        mode='markers',
+        marker=dict(
+            size=_bubble_sizes(binned['Market_Share_Pct'], 6, 40),
+            color=COLORS['neutral'],
+            opacity=0.6,
+            line=dict(width=1, color='white')
+        ),
+        customdata=np.column_stack([binned['Count'], binned['Market_Share_Pct'], binned['Idiomas_Count']]),
+        hovertemplate='<b>%{customdata[0]:,} plataformas</b><br>Usuários médios: %{x:.1f}M<br>Receita média: R$ %{y:.1f}M<br>Market Share total: %{customdata[1]:.1f}%<br>Idiomas médios: %{customdata[2]:.0f}<extra></extra>',
+        name='Agrupamentos'
+    ))
+    
+    # Rótulos apenas para os líderes, mantendo sempre o nosso produto visível
+    labeled = top_n_rows(df_comp, 'Market_Share_Pct')
+    ours = df_comp[df_comp['Plataforma'] == OUR_PRODUCT]
+    if not ours.empty and OUR_PRODUCT not in set(labeled['Plataforma']):
+        labeled = pd.concat([labeled, ours.iloc[:1]])
+    fig.add_trace(go.Scatter(
+        x=labeled['User_Base_Milhões'],
+        y=labeled['Revenue_Milhões'],
+        mode='markers+text',
+        marker=dict(
+            size=10,
+            color=[colors_map.get(platform, COLORS['primary']) for platform in labeled['Plataforma']],
+            line=dict(width=1, color='white')
+        ),
+        text=labeled['Plataforma'],
+        textposition='top center',
+        textfont=dict(size=10, color=COLORS['primary'], family='Inter'),
+        customdata=labeled[['Market_Share_Pct', 'Idiomas_Count']].to_numpy(),
+        hovertemplate='<b>%{text}</b><br>Usuários: %{x}M<br>Receita: R$ %{y}M<br>Market Share: %{customdata[0]}%<br>Idiomas: %{customdata[1]}<extra></extra>',
+        name='Líderes'
+    ))
+
+
+@instrumented
 def create_competitive_landscape(df_comp):
     """
     Enhanced competitive analysis following Tufte and accessibility principles
     Strategic positioning with visual hierarchy and error handling
+    Above LOD_POINT_THRESHOLD platforms, points are binned server-side (WebGL) and only the leaders are labelled
     """
     try:
         # Debug: Check if DataFrame is empty or columns exist
@@ -1027,39 +1673,39 @@ def create_competitive_landscape(df_comp):
             'Duolingo': COLORS['highlight'],              # Market leader
             'Babbel': COLORS['benchmark'],                # Strong competitor  
             'Busuu': COLORS['neutral'],                   # Other competitor
-            'LingoDash (Projetado)': COLORS['data_focus'] # Our product (prominent)
+            OUR_PRODUCT: COLORS['data_focus']             # Our product (prominent)
         }
         
-        for platform in df_comp['Plataforma']:
-            data = df_comp[df_comp['Plataforma'] == platform].iloc[0]
-            
-            # Emphasize our product with enhanced styling
-            is_our_product = platform == 'LingoDash (Projetado)'
-            
+        if use_level_of_detail(df_comp):
+            _add_competitive_lod_traces(fig, df_comp, colors_map)
+        else:
+            # Single trace built from vectorized columns; our product is emphasized per point
+            platforms = df_comp['Plataforma'].astype(str)
+            is_our_product = (platforms == OUR_PRODUCT).to_numpy()
             fig.add_trace(go.Scatter(
-                x=[data['User_Base_Milhões']],
-                y=[data['Revenue_Milhões']],
+                x=df_comp['User_Base_Milhões'],
+                y=df_comp['Revenue_Milhões'],
                 mode='markers+text',
                 marker=dict(
-                    size=max(data['Market_Share_Pct'] * 3 + 15, 20),  # Better size scaling
-                    color=colors_map.get(platform, COLORS['neutral']),  # Safe fallback
-                    line=dict(width=3 if is_our_product else 1, color='white'),
-                    opacity=0.9 if is_our_product else 0.7
+                    size=np.maximum(df_comp['Market_Share_Pct'].to_numpy(dtype=float) * 3 + 15, 20),  # Better size scaling
+                    color=platforms.map(colors_map).fillna(COLORS['neutral']).tolist(),  # Safe fallback
+                    line=dict(width=np.where(is_our_product, 3, 1), color='white'),
+                    opacity=np.where(is_our_product, 0.9, 0.7)
                 ),
-                text=platform.replace(' (Projetado)', '<br>(Projetado)'),  # Better text layout
+                text=platforms.str.replace(' (Projetado)', '<br>(Projetado)', regex=False),  # Better text layout
                 textposition='middle center',
                 textfont=dict(
-                    size=10 if not is_our_product else 11, 
+                    size=np.where(is_our_product, 11, 10),
                     color='white',
                     family='Inter'
                 ),
-                name=platform,
-                hovertemplate=f'<b>{platform}</b><br>Usuários: %{{x}}M<br>Receita: R$ %{{y}}M<br>Market Share: {data["Market_Share_Pct"]}%<br>Idiomas: {data["Idiomas_Count"]}<extra></extra>'
+                customdata=df_comp[['Plataforma', 'Market_Share_Pct', 'Idiomas_Count']].to_numpy(),
+                name='Plataformas',
+                hovertemplate='<b>%{customdata[0]}</b><br>Usuários: %{x}M<br>Receita: R$ %{y}M<br>Market Share: %{customdata[1]}%<br>Idiomas: %{customdata[2]}<extra></extra>'
             ))
         
         # Apply Tufte-optimized layout
-        tufte_layout = create_tufte_optimized_layout()
-        fig.update_layout(**tufte_layout)
+        fig.update_layout(template=tufte_template())
         
         # Add accessibility features
         fig = add_accessibility_attrs(
@@ -1087,77 +1733,1174 @@ def create_competitive_landscape(df_comp):
             annotations=[dict(text="Erro ao processar dados", x=0.5, y=0.5, showarrow=False)]
         )
 
-def create_sensitivity_analysis():
-    """Análise de sensibilidade interativa"""
-    # Parâmetros base
-    base_tam = 100  # Milhões
-    base_conversion = 0.05  # 5%
-    base_arppu = 25  # USD
-    
-    # Variações
-    tam_variations = np.linspace(0.5, 2.0, 11)  # 50% a 200% do base
-    conversion_variations = np.linspace(0.5, 2.0, 11)
-    
-    revenues = []
-    for tam_mult in tam_variations:
-        row = []
-        for conv_mult in conversion_variations:
-            revenue = (base_tam * tam_mult) * (base_conversion * conv_mult) * base_arppu
-            row.append(revenue / 1000)  # Converter para milhões
-        revenues.append(row)
-    
+@instrumented
+def create_sensitivity_analysis(df=None, resolution=11, language=None, grid=None):
+    """Análise de sensibilidade interativa baseada nos dados reais de idiomas"""
+    if grid is None:
+        grid = compute_sensitivity_grid(
+            df, resolution=resolution,
+            languages=None if language is None else [language]
+        )
+    revenue = grid['revenue'] if language is None else grid['revenue'].sum(axis=0)
+    scope = language or 'Todos os Idiomas'
+
     fig = go.Figure(data=go.Heatmap(
-        z=revenues,
-        x=[f"{x:.1f}x" for x in conversion_variations],
-        y=[f"{x:.1f}x" for x in tam_variations],
+        z=revenue,
+        x=grid['conversion_multipliers'],
+        y=grid['tam_multipliers'],
         colorscale=[[0.0, COLORS['quaternary']], [0.3, COLORS['primary']], [0.7, COLORS['benchmark']], [1.0, COLORS['highlight']]],
-        hovertemplate='TAM: %{y}<br>Conversão: %{x}<br>Receita: R$ %{z:.1f}M<extra></extra>'
+        hovertemplate='TAM: %{y:.2f}x<br>Conversão: %{x:.2f}x<br>Receita: US$ %{z:.1f}M<extra></extra>'
     ))
     
     fig.update_layout(
-        title='🎯 Análise de Sensibilidade: TAM vs Taxa de Conversão',
+        title=f'🎯 Análise de Sensibilidade: TAM vs Taxa de Conversão ({scope})',
         xaxis_title='Multiplicador da Taxa de Conversão',
         yaxis_title='Multiplicador do TAM',
-        height=400
+        xaxis_ticksuffix='x',
+        yaxis_ticksuffix='x',
+        height=400,
+        template=tufte_template()
     )
     
     return fig
 
 # ========================================================================================
-# ENHANCED UI HELPER FUNCTIONS
+# MOTOR DE PRIORIZAÇÃO (SCORING VETORIZADO)
 # ========================================================================================
 
-def show_loading_state(message="Carregando dados..."):
-    """Display enhanced loading state with animation"""
-    return st.markdown(f"""
-    <div class="loading-skeleton">
-        <div style="text-align: center;">
-            <div style="font-size: 1.2rem; margin-bottom: 1rem;">⏳ {message}</div>
-            <div style="font-size: 0.9rem; opacity: 0.7;">Por favor, aguarde...</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+# Critérios de priorização: coluna -> (rótulo, maior é melhor, descrição)
+PRIORITY_CRITERIA = {
+    'TAM_Milhões': ('TAM', True, 'Tamanho do mercado endereçável'),
+    'ROI_Ratio': ('ROI', True, 'Retorno sobre investimento LTV/CAC'),
+    'Complexidade_Técnica': ('Complexidade', False, 'Dificuldade técnica e cultural'),
+    'Payback_Meses': ('Payback', False, 'Tempo para recuperação'),
+    'Competição_Level': ('Competição', False, 'Intensidade competitiva'),
+    'Market_Readiness': ('Prontidão', True, 'Maturidade do mercado para o produto'),
+}
+# Pesos da metodologia de scoring exibida na aba estratégica
+PRIORITY_DEFAULT_WEIGHTS = {
+    'TAM_Milhões': 0.30, 'ROI_Ratio': 0.25, 'Complexidade_Técnica': 0.20,
+    'Payback_Meses': 0.15, 'Competição_Level': 0.10, 'Market_Readiness': 0.0,
+}
+# Tiers por score mínimo (0-100), do mais alto para o mais baixo
+PRIORITY_TIERS = (
+    (75, 'Tier 1', 'PRIORIDADE MÁXIMA (0-6 meses)'),
+    (50, 'Tier 2', 'ALTA PRIORIDADE (6-12 meses)'),
+    (0, 'Tier 3', 'OPORTUNIDADE FUTURA (12+ meses)'),
+)
 
-def create_enhanced_metric_card(title, value, delta, icon="📊", help_text=""):
-    """Create modern metric card with enhanced typography and professional high-contrast colors"""
-    delta_color = "#059669" if str(delta).startswith("+") else "#dc2626" if str(delta).startswith("-") else "#374151"
-    delta_icon = "↗️" if str(delta).startswith("+") else "↘️" if str(delta).startswith("-") else "➡️"
-    delta_class = "positive" if str(delta).startswith("+") else "negative" if str(delta).startswith("-") else ""
-    
-    return f"""
-    <div class="metric-card-enhanced interactive-card" title="{help_text}">
-        <div style="font-size: 14px; color: #64748b; font-weight: 600; margin-bottom: 8px;">
-            {icon} {title}
-        </div>
-        <div style="font-size: 2.5rem; font-weight: 700; color: #0f172a; line-height: 1; margin-bottom: 4px;">
-            {value}
-        </div>
-        <div style="font-size: 13px; color: {delta_color}; font-weight: 600;">
-            {delta_icon} {delta}
-        </div>
-    </div>
+
+def normalize_priority_criteria(df):
     """
+    Normaliza cada critério para 0-1 pelo rank percentual (1 = melhor idioma no critério).
 
+    Critérios em que menor é melhor (complexidade, payback, competição) são invertidos.
+    Valores ausentes recebem 0; critérios sem coluna ficam neutros (0.5). Não depende dos
+    pesos, então é calculado uma vez por versão dos dados.
+
+    Returns:
+        ndarray (n_idiomas, n_critérios) na ordem de PRIORITY_CRITERIA
+    """
+    normalized = np.full((len(df), len(PRIORITY_CRITERIA)), 0.5)
+    for j, (column, (_, higher_is_better, _)) in enumerate(PRIORITY_CRITERIA.items()):
+        if column not in df.columns:
+            continue
+        values = pd.to_numeric(df[column], errors='coerce')
+        valid = values.notna().sum()
+        ranks = values.rank(method='average', ascending=higher_is_better)  # 1 = pior
+        normalized[:, j] = ((ranks - 1) / (valid - 1) if valid > 1 else values.notna().astype(float)).fillna(0.0).to_numpy()
+    return normalized
+
+
+def priority_weight_vector(weights=None):
+    """Pesos na ordem de PRIORITY_CRITERIA, normalizados para somar 1 (pesos todos zerados viram pesos iguais)"""
+    weights = PRIORITY_DEFAULT_WEIGHTS if weights is None else weights
+    vector = np.array([max(float(weights.get(column, 0.0)), 0.0) for column in PRIORITY_CRITERIA])
+    total = vector.sum()
+    return vector / total if total > 0 else np.full(len(vector), 1 / len(vector))
+
+
+def score_priorities(df, normalized, weights=None):
+    """
+    Scores (0-100), ranks e tiers a partir dos critérios já normalizados.
+    Re-ponderar é uma multiplicação matriz × vetor e um argsort, sem recalcular os ranks por critério.
+
+    Returns:
+        df com as colunas Score, Rank e Tier, ordenado do melhor para o pior
+    """
+    scores = normalized @ priority_weight_vector(weights) * 100
+    order = np.argsort(-scores, kind='stable')
+    ranks = np.empty(len(scores), dtype=np.int64)
+    ranks[order] = np.arange(1, len(scores) + 1)
+
+    thresholds = np.array([minimum for minimum, _, _ in PRIORITY_TIERS])
+    tier_index = np.argmax(scores[:, None] >= thresholds[None, :], axis=1)
+    tiers = pd.Categorical.from_codes(tier_index, categories=[tier for _, tier, _ in PRIORITY_TIERS])
+
+    return df.assign(Score=scores, Rank=ranks, Tier=tiers).iloc[order]
+
+
+def compute_priority_scores(df, weights=None):
+    """Scores, ranks e tiers de priorização para qualquer número de idiomas em uma passada"""
+    return score_priorities(df, normalize_priority_criteria(df), weights)
+
+# ========================================================================================
+# MOTOR DE ROADMAP (FLUXO DE CAIXA POR FASE)
+# ========================================================================================
+
+# Janela da fase no nome, ex.: "Fase 2a (6-9m)"
+ROADMAP_MONTHS_PATTERN = r'\((\d+)\s*-\s*(\d+)\s*m\)'
+# Duração assumida para fases sem janela no nome (encadeadas uma após a outra)
+ROADMAP_DEFAULT_PHASE_MONTHS = 6
+# Receita_Esperada_K é tratada como a receita dos primeiros 12 meses após o lançamento (fim da fase)
+ROADMAP_REVENUE_MONTHS = 12
+
+
+def parse_phase_months(fases):
+    """Meses de início e fim de cada fase a partir do nome; fases sem janela válida são encadeadas"""
+    months = pd.Series(fases, dtype=object).astype(str).str.extract(ROADMAP_MONTHS_PATTERN).astype(float)
+    start, end = months[0].to_numpy(), months[1].to_numpy()
+    valid = ~np.isnan(start) & (end > start)
+    duration = np.where(valid, end - start, ROADMAP_DEFAULT_PHASE_MONTHS)
+    chained = np.concatenate([[0.0], np.cumsum(duration)[:-1]])
+    start = np.where(valid, start, chained)
+    return start.astype(np.int64), (start + duration).astype(np.int64)
+
+
+def compute_roadmap(df_phases, revenue_months=ROADMAP_REVENUE_MONTHS):
+    """
+    Deriva o fluxo de caixa do roadmap a partir de df_phases.
+
+    O investimento de cada fase é distribuído igualmente pelos meses da sua janela e a receita
+    esperada pelos `revenue_months` meses seguintes ao lançamento. As séries mensais são montadas
+    com arrays de diferenças (np.add.at + cumsum), em O(fases + meses).
+
+    Returns:
+        dict com 'phases' (por fase: janela, ROI e acumulados), 'monthly' (por mês: fluxos e
+        acumulados) e 'summary' (totais, ROI e mês de break-even, ou None se não houver)
+    """
+    required_cols = ['Fase', 'Investimento_K', 'Receita_Esperada_K', 'Usuários_Projetados']
+    if df_phases.empty or not set(required_cols).issubset(df_phases.columns):
+        return {
+            'phases': pd.DataFrame(), 'monthly': pd.DataFrame(),
+            'summary': dict(total_investment_k=0.0, total_revenue_k=0.0, roi_pct=0.0,
+                            total_users=0, breakeven_month=None, horizon_months=0),
+        }
+
+    start, end = parse_phase_months(df_phases['Fase'])
+    invest = df_phases['Investimento_K'].to_numpy(dtype=float)
+    revenue = df_phases['Receita_Esperada_K'].to_numpy(dtype=float)
+    horizon = int(end.max()) + revenue_months
+
+    spend = np.zeros(horizon + 1)
+    np.add.at(spend, start, invest / (end - start))
+    np.add.at(spend, end, -invest / (end - start))
+    earn = np.zeros(horizon + 1)
+    np.add.at(earn, end, revenue / revenue_months)
+    np.add.at(earn, end + revenue_months, -revenue / revenue_months)
+
+    monthly_invest = np.cumsum(spend)[:horizon]
+    monthly_revenue = np.cumsum(earn)[:horizon]
+    cumulative_invest = np.cumsum(monthly_invest)
+    cumulative_revenue = np.cumsum(monthly_revenue)
+    balance = cumulative_revenue - cumulative_invest
+    # Tolerância para o resíduo de ponto flutuante das somas acumuladas
+    crossed = np.flatnonzero((balance >= -1e-9) & (cumulative_invest > 0))
+    breakeven_month = int(crossed[0]) + 1 if len(crossed) else None
+
+    phases = pd.DataFrame({
+        'Fase': df_phases['Fase'].to_numpy(),
+        'Mês_Início': start,
+        'Mês_Fim': end,
+        'Investimento_K': invest,
+        'Receita_Esperada_K': revenue,
+        'Usuários_Projetados': df_phases['Usuários_Projetados'].to_numpy(),
+        'ROI_Fase_Pct': np.divide(revenue - invest, invest, out=np.zeros_like(invest), where=invest != 0) * 100,
+        'Investimento_Acumulado_K': np.cumsum(invest),
+        'Receita_Acumulada_K': np.cumsum(revenue),
+    })
+    monthly = pd.DataFrame({
+        'Mês': np.arange(1, horizon + 1),
+        'Investimento_K': monthly_invest,
+        'Receita_K': monthly_revenue,
+        'Investimento_Acumulado_K': cumulative_invest,
+        'Receita_Acumulada_K': cumulative_revenue,
+        'Saldo_Acumulado_K': balance,
+    })
+    total_investment, total_revenue = invest.sum(), revenue.sum()
+    summary = dict(
+        total_investment_k=float(total_investment),
+        total_revenue_k=float(total_revenue),
+        roi_pct=float((total_revenue - total_investment) / total_investment * 100) if total_investment else 0.0,
+        total_users=int(phases['Usuários_Projetados'].sum()),
+        breakeven_month=breakeven_month,
+        horizon_months=horizon,
+    )
+    return {'phases': phases, 'monthly': monthly, 'summary': summary}
+
+
+@instrumented
+def create_roadmap_cashflow_chart(df_monthly, breakeven_month=None):
+    """Investimento e receita acumulados do roadmap, com o mês de break-even destacado"""
+    fig = go.Figure()
+    if not df_monthly.empty:
+        fig.add_trace(go.Scatter(
+            x=df_monthly['Mês'], y=df_monthly['Investimento_Acumulado_K'],
+            mode='lines', name='Investimento acumulado',
+            line=dict(color=COLORS['highlight'], width=2),
+            hovertemplate='Mês %{x}<br>Investimento: R$ %{y:,.0f}K<extra></extra>'
+        ))
+        fig.add_trace(go.Scatter(
+            x=df_monthly['Mês'], y=df_monthly['Receita_Acumulada_K'],
+            mode='lines', name='Receita acumulada',
+            line=dict(color=COLORS['success'], width=3),
+            hovertemplate='Mês %{x}<br>Receita: R$ %{y:,.0f}K<extra></extra>'
+        ))
+        if breakeven_month is not None:
+            fig.add_vline(x=breakeven_month, line_dash="dash", line_color=COLORS['benchmark'],
+                          annotation_text=f"Break-even: mês {breakeven_month}")
+    
+    fig.update_layout(template=tufte_template())
+    fig = add_accessibility_attrs(fig, "Fluxo de Caixa Acumulado do Roadmap")
+    fig.update_layout(
+        height=350,
+        xaxis_title="Mês",
+        yaxis_title="Milhares (R$)",
+        showlegend=True,  # Duas séries: a legenda identifica investimento vs receita
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom')
+    )
+    return fig
+
+
+def format_currency_k(value_k):
+    """Formata valores em milhares: R$ 950K, R$ 2.3M"""
+    if abs(value_k) >= 1000:
+        return f"R$ {value_k / 1000:.1f}M"
+    return f"R$ {value_k:.0f}K"
+
+# ========================================================================================
+# KPIs EXECUTIVOS (AGREGADOS POR VERSÃO DOS DADOS)
+# ========================================================================================
+
+def compute_executive_kpis(df_languages, df_projection):
+    """
+    Agregados dos cards executivos: TAM total, projeção de receita, idiomas Tier 1 e confiança.
+    A projeção e a confiança consideram apenas os períodos futuros (tudo exceto "Atual").
+    """
+    tam = df_languages['TAM_Milhões'] if 'TAM_Milhões' in df_languages.columns else pd.Series(dtype=float)
+    tam_total = float(tam.sum())
+    top3_share = float(tam.nlargest(3).sum() / tam_total * 100) if tam_total else 0.0
+
+    future = df_projection
+    if 'Período' in df_projection.columns:
+        future = df_projection[df_projection['Período'] != 'Atual']
+    revenue = future['Receita_Base_K'] if 'Receita_Base_K' in future.columns else pd.Series(dtype=float)
+    growth_pct = float((revenue.iloc[-1] / revenue.iloc[0] - 1) * 100) if len(revenue) > 1 and revenue.iloc[0] else 0.0
+    confidence = future['Confiança_Pct'] if 'Confiança_Pct' in future.columns else pd.Series(dtype=float)
+
+    tier1 = 0
+    if not df_languages.empty and 'Idioma' in df_languages.columns:
+        tier1 = int((compute_priority_scores(df_languages)['Tier'] == PRIORITY_TIERS[0][1]).sum())
+
+    return dict(
+        tam_total_m=tam_total,
+        top3_share_pct=top3_share,
+        languages=len(df_languages),
+        projected_revenue_k=float(revenue.sum()),
+        projection_years=len(revenue),
+        revenue_growth_pct=growth_pct,
+        tier1_languages=tier1,
+        confidence_pct=float(confidence.mean()) if len(confidence) else 0.0,
+    )
+
+
+def executive_kpi_cards(kpis):
+    """Argumentos de create_enhanced_metric_card para cada KPI executivo"""
+    return [
+        dict(title="TAM Total (pessoas)", value=f"{kpis['tam_total_m']:,.0f}M", icon="🌍",
+             delta=f"Top 3 idiomas: {kpis['top3_share_pct']:.0f}% do total",
+             help_text="Soma do TAM de todos os idiomas analisados"),
+        dict(title=f"Projeção {kpis['projection_years']} Anos", value=format_currency_k(kpis['projected_revenue_k']), icon="💰",
+             delta=f"{kpis['revenue_growth_pct']:+.0f}% do primeiro ao último ano",
+             help_text="Soma da receita base projetada nos períodos futuros"),
+        dict(title="Idiomas Prioritários", value=f"{kpis['tier1_languages']}", icon="🎯",
+             delta=f"Tier 1 de {kpis['languages']} idiomas analisados",
+             help_text="Idiomas no Tier 1 da matriz de priorização (pesos padrão)"),
+        dict(title="Nível de Confiança", value=f"{kpis['confidence_pct']:.1f}%", icon="📐",
+             delta="Média das bandas da projeção",
+             help_text="Confiança média dos intervalos da projeção de receita"),
+    ]
+
+# ========================================================================================
+# CACHE DE CENÁRIOS (LRU COM LIMITE DE MEMÓRIA)
+# ========================================================================================
+
+SCENARIO_CACHE_MAX_ENTRIES = 256
+SCENARIO_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+
+def estimate_nbytes(value):
+    """Estimativa do tamanho em memória de um resultado (DataFrames, arrays e containers)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray) or hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if hasattr(value, 'to_plotly_json'):
+        # Figuras Plotly: tamanho do JSON, sem forçar o import do plotly para outros tipos
+        return len(pio.to_json(value, validate=False))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def compute_data_version(*frames):
+    """Hash estável do conteúdo dos DataFrames, usado como 'versão dos dados' nas chaves de cache"""
+    digest = hashlib.blake2b(digest_size=8)
+    for df in frames:
+        digest.update(repr(list(df.columns)).encode())
+        if not df.empty:
+            digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def table_version(*tables, signature=None):
+    """
+    Versão dos dados por tabela para as chaves de cache: o hash do conteúdo de cada CSV,
+    lido da assinatura da execução (run_data_signature). Não reprocessa os DataFrames,
+    então o custo por rerun não cresce com o número de linhas.
+    """
+    hashes = {name: digest for name, _, _, digest in (signature or run_data_signature())}
+    return tuple(hashes.get(f"{table}.csv") for table in tables)
+
+
+def scenario_cache_key(kind, data_version, scenario_factor=None, confidence_level=None,
+                       time_horizon=None, **params):
+    """
+    Chave de cache (tipo, fator, confiança, horizonte, versão dos dados, parâmetros extras).
+    Parâmetros dos quais um resultado não depende ficam como None, de modo que o resultado
+    é compartilhado entre todos os valores desse controle.
+    """
+    if scenario_factor is not None:
+        scenario_factor = round(float(scenario_factor), 6)
+    if confidence_level is not None:
+        confidence_level = round(float(confidence_level), 6)
+    return (kind, scenario_factor, confidence_level, time_horizon, data_version, tuple(sorted(params.items())))
+
+
+class _InFlight:
+    """Cálculo em andamento de uma chave; as demais chamadas esperam pelo evento"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ScenarioCache:
+    """
+    Cache LRU thread-safe para resultados de projeção e sensibilidade.
+    Limita o número de entradas e o total de bytes; as entradas menos usadas são descartadas primeiro.
+    Como instância de st.cache_resource é compartilhado por todas as sessões, e get_or_compute
+    calcula cada chave uma única vez mesmo com várias sessões pedindo-a ao mesmo tempo.
+    """
+
+    def __init__(self, max_entries=SCENARIO_CACHE_MAX_ENTRIES, max_bytes=SCENARIO_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.computes = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return value  # Maior que o limite total: não armazena
+            self._entries[key] = (value, nbytes)
+            self.total_bytes += nbytes
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Retorna o resultado em cache ou calcula, armazena e retorna.
+        Single-flight: se a chave já está sendo calculada por outra sessão, espera esse
+        cálculo em vez de repeti-lo; um erro no cálculo é propagado a todos que esperavam.
+        """
+        sentinel = object()
+        with self._lock:
+            value = self.get(key, sentinel)
+            if value is not sentinel:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _InFlight()
+            else:
+                self.waits += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self.put(key, compute())
+            with self._lock:
+                self.computes += 1
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+        return flight.value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def metrics(self):
+        """stats() mais contadores de single-flight, descartes e taxa de acerto"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                **self.stats(),
+                'waits': self.waits,
+                'computes': self.computes,
+                'evictions': self.evictions,
+                'in_flight': len(self._inflight),
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+
+@st.cache_resource
+def get_scenario_cache():
+    """Instância única do cache de cenários, compartilhada entre reruns e sessões"""
+    return ScenarioCache()
+
+
+def cached_revenue_projection(df_languages, confidence_level, time_horizon, data_version, cache=None):
+    """Projeção Monte Carlo via cache; independe do fator de cenário, aplicado no gráfico"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('projection', data_version,
+                             confidence_level=confidence_level, time_horizon=time_horizon)
+    return cache.get_or_compute(
+        key, lambda: simulate_revenue_projection(df_languages, confidence_level, time_horizon)
+    )
+
+
+def cached_sensitivity_grid(df_languages, resolution, language, data_version, cache=None):
+    """Grade de sensibilidade via cache, por resolução e idioma"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('sensitivity', data_version, resolution=resolution, language=language)
+    return cache.get_or_compute(
+        key, lambda: compute_sensitivity_grid(
+            df_languages, resolution=resolution,
+            languages=None if language is None else [language]
+        )
+    )
+
+
+def cached_rank_index(df_languages, data_version, cache=None):
+    """Índice de ranking via cache; construído uma vez por versão dos dados"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('rank_index', data_version)
+    return cache.get_or_compute(key, lambda: build_rank_index(df_languages))
+
+
+def cached_roadmap(df_phases, data_version, cache=None):
+    """Fluxo de caixa do roadmap via cache; depende apenas da versão dos dados de fases"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('roadmap', data_version)
+    return cache.get_or_compute(key, lambda: compute_roadmap(df_phases))
+
+
+def cached_executive_kpis(df_languages, df_projection, data_version, cache=None):
+    """KPIs executivos via cache; recalculados apenas quando a versão dos dados muda"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('executive_kpis', data_version)
+    return cache.get_or_compute(key, lambda: compute_executive_kpis(df_languages, df_projection))
+
+
+def cached_priority_criteria(df_languages, data_version, cache=None):
+    """Critérios de priorização normalizados via cache; dependem apenas da versão dos dados"""
+    cache = cache if cache is not None else get_scenario_cache()
+    key = scenario_cache_key('priority_criteria', data_version)
+    return cache.get_or_compute(key, lambda: normalize_priority_criteria(df_languages))
+
+# ========================================================================================
+# POOL DE WORKERS (SIMULAÇÕES EM PROCESSOS SEPARADOS)
+# ========================================================================================
+
+# Processos do pool; LINGODASH_WORKERS=0 executa os jobs inline, no thread da sessão.
+# O padrão deixa um core para o servidor e limita a 4 processos por servidor em hosts compartilhados
+WORKER_POOL_SIZE = int(os.environ.get("LINGODASH_WORKERS", min(4, max(1, (os.cpu_count() or 1) - 1))))
+
+
+class WorkerPool:
+    """
+    Pool de processos para simulações NumPy pesadas, compartilhado entre sessões.
+    Cada sessão espera apenas pelo próprio job; jobs de usuários diferentes rodam em
+    paralelo nos workers. Jobs idênticos em andamento compartilham o mesmo Future e os
+    resultados concluídos vão para o cache de cenários.
+    """
+
+    def __init__(self, max_workers=WORKER_POOL_SIZE, cache=None):
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else ScenarioCache()
+        self.submitted = 0
+        self._executor = None
+        self._pending = {}
+        # Jobs que falharam: devolvidos uma vez no próximo submit para que o erro apareça na sessão
+        self._failed = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn: fork de um processo com os threads do servidor Streamlit não é seguro
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, key, func_name, *args, **kwargs):
+        """Retorna um Future com o resultado de func_name(*args, **kwargs), via cache quando possível"""
+        from concurrent.futures import Future
+
+        sentinel = object()
+        value = self.cache.get(key, sentinel)
+        if value is not sentinel:
+            future = Future()
+            future.set_result(value)
+            return future
+
+        with self._lock:
+            if key in self._failed:
+                return self._failed.pop(key)
+            if key in self._pending:
+                return self._pending[key]
+            self.submitted += 1
+            if self.max_workers <= 0:
+                future = Future()
+                try:
+                    future.set_result(simulation.run_pool_job(func_name, args, kwargs))
+                except Exception as error:
+                    future.set_exception(error)
+            else:
+                # Serializado por referência: o worker importa só o módulo simulation
+                future = self._get_executor().submit(simulation.run_pool_job, func_name, args, kwargs)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return future
+
+    def _finish(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+            if not future.cancelled() and future.exception() is not None:
+                self._failed[key] = future
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    def stats(self):
+        with self._lock:
+            return {'workers': self.max_workers, 'pending': len(self._pending), 'submitted': self.submitted}
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+@st.cache_resource
+def get_worker_pool():
+    """Instância única do pool de workers, compartilhada entre reruns e sessões"""
+    return WorkerPool(cache=get_scenario_cache())
+
+
+def pooled_revenue_projection(df_languages, confidence_level, time_horizon, data_version, pool=None):
+    """Projeção Monte Carlo no pool; mesma chave de cached_revenue_projection"""
+    pool = pool if pool is not None else get_worker_pool()
+    key = scenario_cache_key('projection', data_version,
+                             confidence_level=confidence_level, time_horizon=time_horizon)
+    return pool.submit(key, 'simulate_revenue_projection', df_languages, confidence_level, time_horizon)
+
+
+def pooled_sensitivity_grid(df_languages, resolution, language, data_version, pool=None):
+    """Grade de sensibilidade no pool; mesma chave de cached_sensitivity_grid"""
+    pool = pool if pool is not None else get_worker_pool()
+    key = scenario_cache_key('sensitivity', data_version, resolution=resolution, language=language)
+    return pool.submit(key, 'compute_sensitivity_grid', df_languages, resolution=resolution,
+                       languages=None if language is None else [language])
+
+# ========================================================================================
+# CACHE DE FIGURAS (SPEC PLOTLY SERIALIZADA)
+# ========================================================================================
+
+FIGURE_CACHE_MAX_ENTRIES = 64
+FIGURE_CACHE_MAX_BYTES = 128 * 1024 * 1024  # 128 MB
+
+
+class FigureCache(ScenarioCache):
+    """
+    Cache de figuras Plotly prontas.
+    É esvaziado sempre que a assinatura dos arquivos de dados muda.
+    """
+
+    def __init__(self, max_entries=FIGURE_CACHE_MAX_ENTRIES, max_bytes=FIGURE_CACHE_MAX_BYTES):
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+        self.data_signature = None
+
+    def invalidate_if_changed(self, signature):
+        """Limpa o cache quando os arquivos de dados mudaram desde a última consulta"""
+        with self._lock:
+            if signature != self.data_signature:
+                self.clear()
+                self.data_signature = signature
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Instância única do cache de figuras, compartilhada entre reruns e sessões"""
+    return FigureCache()
+
+
+def shared_cache_metrics():
+    """Métricas dos caches compartilhados entre sessões (cenários e figuras)"""
+    return {'scenarios': get_scenario_cache().metrics(), 'figures': get_figure_cache().metrics()}
+
+
+def frame_fingerprint(df):
+    """
+    Impressão digital barata de um recorte: shape, colunas e índice. Um RangeIndex entra
+    pelos limites (O(1)); outros índices por hash, sem tocar nos valores das colunas.
+    """
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        index_key = (index.start, index.stop, index.step)
+    else:
+        index_key = hashlib.blake2b(pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes(),
+                                    digest_size=8).hexdigest()
+    return (df.shape, tuple(df.columns), index_key)
+
+
+def cached_figure(chart_fn, *frames, layout=None, build=None, cache=None, version=None, compact=None, **params):
+    """
+    Retorna a figura de chart_fn(*frames, **params) a partir do cache de figuras.
+
+    A chave combina o nome da função, a impressão digital de cada DataFrame de entrada
+    (frame_fingerprint: shape, colunas e índice, então recortes e filtros diferentes não
+    colidem), `version`, os parâmetros e os ajustes de layout. Os valores dos DataFrames não
+    são hasheados a cada chamada: o cache é esvaziado quando a assinatura dos arquivos de dados
+    da execução muda. Quadros cujos valores mudam sem mudar o índice (simulações por controle)
+    passam esses controles em `version`. Em um acerto a mesma figura é devolvida, sem
+    desserializar nem revalidar; o st.plotly_chart só a converte com to_dict(). `build` permite
+    fornecer a função de construção quando a figura depende de valores que não entram na chave.
+    `compact` liga o modo compacto só para esta figura (padrão: COMPACT_FIGURES).
+    """
+    cache = cache if cache is not None else get_figure_cache()
+    cache.invalidate_if_changed(run_data_signature())
+    compact = COMPACT_FIGURES if compact is None else compact
+
+    key = (chart_fn.__name__, tuple(frame_fingerprint(df) for df in frames), version, compact,
+           repr(sorted(params.items())), repr(layout))
+
+    def build_figure():
+        start = time.perf_counter()
+        fig = build() if build is not None else chart_fn(*frames, **params)
+        if layout:
+            fig.update_layout(**layout)
+        if compact:
+            fig = compact_figure(fig)
+        get_metrics_registry().observe('lingodash_figure_build_seconds', time.perf_counter() - start,
+                                       figure=chart_fn.__name__)
+        return fig
+
+    return cache.get_or_compute(key, build_figure)
+
+# ========================================================================================
+# ORÇAMENTO DE PAYLOAD DAS FIGURAS (JSON ENVIADO AO NAVEGADOR)
+# ========================================================================================
+
+# Limite do JSON serializado por figura
+FIGURE_PAYLOAD_BUDGET_BYTES = 50_000
+# Algarismos significativos mantidos nos arrays numéricos do modo compacto
+PAYLOAD_SIGNIFICANT_DIGITS = 6
+# Grades (heatmaps) podem ir em float32: são exibidas com formato explícito no hover e na colorbar
+PAYLOAD_FLOAT32_KEYS = ('z',)
+# Modo compacto é com perdas (arredonda valores, float32, texttemplate): desligado por padrão e
+# ligado por figura (cached_figure(..., compact=True)) quando o --payload-report acusar excesso.
+# Hoje todas as figuras ficam abaixo de 3 KB. LINGODASH_COMPACT_FIGURES=1 liga para todas
+COMPACT_FIGURES = os.environ.get("LINGODASH_COMPACT_FIGURES", "0") == "1"
+# Rótulo por ponto no formato prefixo + número + sufixo, ex.: "12.5M", "#3", "R$ 1,200K"
+_TEXT_NUMBER_PATTERN = re.compile(r"^(\D*?)(-?[\d,]*\d(?:\.(\d+))?)(\D*)$")
+
+
+def figure_payload_bytes(fig):
+    """Tamanho em bytes do JSON da figura, como enviado pelo st.plotly_chart"""
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+def round_significant(values, digits=PAYLOAD_SIGNIFICANT_DIGITS):
+    """Arredonda cada valor para `digits` algarismos significativos (NaN e inf preservados)"""
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values) & (values != 0)
+    magnitude = np.zeros_like(values)
+    magnitude[finite] = np.floor(np.log10(np.abs(values[finite])))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.where(finite, np.round(values * scale) / scale, values)
+
+
+def _decode_typed_array(value):
+    """Typed array já codificado pelo Plotly ({'dtype', 'bdata', 'shape'}) de volta para ndarray"""
+    import base64
+    array = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']))
+    shape = value.get('shape')
+    if shape:
+        array = array.reshape([int(dim) for dim in str(shape).split(',')])
+    return array
+
+
+def _compact_array(value, digits, float32=False):
+    """
+    Arrays numéricos: floats arredondados e codificação mais curta entre lista JSON e
+    typed array (base64). Retorna None para valores não numéricos.
+    """
+    if isinstance(value, dict) and 'bdata' in value and 'dtype' in value:
+        value = _decode_typed_array(value)
+    if isinstance(value, (list, tuple)):
+        if not value or any(isinstance(item, (str, bool, dict)) or item is None for item in value):
+            return None
+        try:
+            value = np.asarray(value)
+        except ValueError:
+            return None  # Listas irregulares
+    if not isinstance(value, np.ndarray) or value.dtype.kind not in "iuf" or value.size == 0:
+        return None
+
+    if value.dtype.kind == "f":
+        if np.all(np.isfinite(value)) and np.array_equal(value, np.round(value)) and np.abs(value).max() < 2**31:
+            value = value.astype(np.int32)
+        else:
+            value = round_significant(value, digits)
+            if float32 and digits <= 6:
+                value = value.astype(np.float32)
+    elif np.abs(value).max() < 2**31:
+        value = value.astype(np.int32)
+
+    json_size = len(json.dumps(value.tolist()))
+    typed_size = 4 * -(-value.nbytes // 3) + 30  # base64 + {"dtype", "bdata"}
+    return value if typed_size < json_size else value.tolist()
+
+
+def _infer_texttemplate(trace):
+    """Substitui a lista `text` por texttemplate quando cada rótulo é o valor de x ou y formatado"""
+    text = trace.get('text')
+    hover = str(trace.get('hovertemplate', '')) + str(trace.get('hoverinfo', ''))
+    if trace.get('texttemplate') or 'text' in hover or not isinstance(text, (list, tuple, np.ndarray)) or len(text) < 2:
+        return
+    matches = [_TEXT_NUMBER_PATTERN.match(label) if isinstance(label, str) else None for label in text]
+    if not all(matches):
+        return
+    prefixes = {(m.group(1), m.group(4), len(m.group(3) or ""), "," in m.group(2)) for m in matches}
+    if len(prefixes) != 1:
+        return
+    prefix, suffix, decimals, grouped = prefixes.pop()
+    numbers = np.array([float(m.group(2).replace(",", "")) for m in matches])
+    for axis in ('x', 'y'):
+        values = trace.get(axis)
+        if isinstance(values, dict) and 'bdata' in values:
+            values = _decode_typed_array(values)
+        try:
+            values = np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            continue
+        if values.shape == numbers.shape and np.allclose(np.round(values, decimals), numbers):
+            fmt = f"{',' if grouped else ''}.{decimals}f"
+            trace['texttemplate'] = f"{prefix}%{{{axis}:{fmt}}}{suffix}"
+            del trace['text']
+            return
+
+
+def _compact_props(props, digits):
+    for key, value in list(props.items()):
+        if isinstance(value, dict) and 'bdata' not in value:
+            _compact_props(value, digits)
+            continue
+        compacted = _compact_array(value, digits, float32=key in PAYLOAD_FLOAT32_KEYS)
+        if compacted is not None:
+            props[key] = compacted
+
+
+def compact_figure_spec(fig, digits=PAYLOAD_SIGNIFICANT_DIGITS, drop_template=False):
+    """
+    Dict da figura no modo compacto: arrays numéricos arredondados e codificados como typed
+    arrays quando menores, rótulos por ponto trocados por texttemplate e, com drop_template,
+    o template embutido removido (o cliente usa o tema/template compartilhado).
+    """
+    spec = fig.to_plotly_json()
+    for trace in spec.get('data', []):
+        _infer_texttemplate(trace)
+        _compact_props(trace, digits)
+    if drop_template:
+        spec.setdefault('layout', {})['template'] = {}
+    return spec
+
+
+def compact_figure(fig, digits=PAYLOAD_SIGNIFICANT_DIGITS, drop_template=False):
+    """Figura reconstruída a partir de compact_figure_spec, sem revalidação"""
+    return go.Figure(compact_figure_spec(fig, digits, drop_template), _validate=False)
+
+
+def analyze_figure_payloads(figures, budget=FIGURE_PAYLOAD_BUDGET_BYTES):
+    """
+    Mede o JSON de cada figura ({nome: figura}) no modo normal e compacto e sinaliza as
+    que excedem o orçamento. Ordenado do maior payload para o menor.
+    """
+    rows = []
+    for name, fig in figures.items():
+        full = figure_payload_bytes(fig)
+        compact = figure_payload_bytes(compact_figure(fig))
+        shared_template = figure_payload_bytes(compact_figure(fig, drop_template=True))
+        rows.append({
+            'Figura': name,
+            'Traces': len(fig.data),
+            'Bytes': full,
+            'Bytes_Compacto': compact,
+            'Bytes_Sem_Template': shared_template,
+            'Redução_Pct': round((1 - shared_template / full) * 100, 1) if full else 0.0,
+            'Orçamento': budget,
+            'Acima_Orçamento': full > budget,
+        })
+    columns = ['Figura', 'Traces', 'Bytes', 'Bytes_Compacto', 'Bytes_Sem_Template', 'Redução_Pct',
+               'Orçamento', 'Acima_Orçamento']
+    return pd.DataFrame(rows, columns=columns).sort_values('Bytes', ascending=False, ignore_index=True)
+
+# ========================================================================================
+# MÉTRICAS (EXPOSIÇÃO NO FORMATO DE TEXTO DO PROMETHEUS)
+# ========================================================================================
+
+# Limites superiores (segundos) dos buckets dos histogramas
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# LINGODASH_METRICS_PORT ativa o endpoint HTTP /metrics; LINGODASH_METRICS_FILE grava o arquivo a cada rerun
+METRICS_PORT = os.environ.get("LINGODASH_METRICS_PORT")
+METRICS_HOST = os.environ.get("LINGODASH_METRICS_HOST", "127.0.0.1")
+METRICS_FILE = os.environ.get("LINGODASH_METRICS_FILE")
+# Sessão sem rerun há mais tempo que isso deixa de contar como ativa
+ACTIVE_SESSION_SECONDS = 300
+
+# Nome -> (tipo, descrição)
+METRIC_DEFINITIONS = {
+    'lingodash_rerun_duration_seconds': ('histogram', "Duração de cada rerun: main() (section=\"app\") ou só de um fragment"),
+    'lingodash_figure_build_seconds': ('histogram', "Tempo de construção de figuras (miss no cache de figuras)"),
+    'lingodash_load_data_cache_total': ('counter', "Tabelas servidas pelo cache de load_data ou recarregadas"),
+    'lingodash_active_sessions': ('gauge', f"Sessões com rerun nos últimos {ACTIVE_SESSION_SECONDS}s"),
+    'lingodash_cache_hits_total': ('counter', "Acertos nos caches compartilhados"),
+    'lingodash_cache_misses_total': ('counter', "Falhas nos caches compartilhados"),
+    'lingodash_cache_waits_total': ('counter', "Chamadas que esperaram um cálculo em andamento (single-flight)"),
+    'lingodash_cache_evictions_total': ('counter', "Entradas descartadas pelos limites dos caches"),
+    'lingodash_cache_entries': ('gauge', "Entradas nos caches compartilhados"),
+    'lingodash_cache_bytes': ('gauge', "Bytes estimados nos caches compartilhados"),
+}
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels) + "}"
+
+
+class MetricsRegistry:
+    """
+    Registro thread-safe de counters, gauges e histogramas, renderizado no formato de
+    texto do Prometheus. Coletores são chamados a cada renderização para atualizar
+    métricas derivadas de outros objetos (caches, sessões).
+    """
+
+    def __init__(self, definitions=METRIC_DEFINITIONS, buckets=METRICS_BUCKETS):
+        self.definitions = dict(definitions)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _key(self, name, labels):
+        if name not in self.definitions:
+            raise KeyError(f"Métrica não registrada: {name}")
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1.0, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(counts):
+                counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def value(self, name, **labels):
+        """Valor atual (counter/gauge) ou (contagem, soma) de um histograma"""
+        with self._lock:
+            value = self._values.get(self._key(name, labels))
+        if isinstance(value, tuple):
+            return value[2], value[1]
+        return value
+
+    def add_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self):
+        """Exposição em texto (formato 0.0.4)"""
+        for collector in self._collectors:
+            collector(self)
+        lines = []
+        with self._lock:
+            for name, (kind, help_text) in self.definitions.items():
+                series = [(labels, value) for (metric, labels), value in self._values.items() if metric == name]
+                if not series:
+                    continue
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+                for labels, value in series:
+                    if kind != 'histogram':
+                        lines.append(f"{name}{_format_labels(labels)} {value:g}")
+                        continue
+                    counts, total, count = value
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {total:g}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class ActiveSessionTracker:
+    """Último rerun de cada sessão; ativas são as vistas na janela ACTIVE_SESSION_SECONDS"""
+
+    def __init__(self, window=ACTIVE_SESSION_SECONDS):
+        self.window = window
+        self._last_seen = {}
+        self._lock = threading.Lock()
+
+    def touch(self, session_id):
+        with self._lock:
+            self._last_seen[session_id] = time.monotonic()
+
+    def count(self):
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            self._last_seen = {sid: seen for sid, seen in self._last_seen.items() if seen >= cutoff}
+            return len(self._last_seen)
+
+
+def collect_cache_metrics(registry):
+    """Espelha os contadores dos caches compartilhados no registro"""
+    for cache_name, metrics in shared_cache_metrics().items():
+        for field in ('hits', 'misses', 'waits', 'evictions'):
+            registry.set(f'lingodash_cache_{field}_total', metrics[field], cache=cache_name)
+        registry.set('lingodash_cache_entries', metrics['entries'], cache=cache_name)
+        registry.set('lingodash_cache_bytes', metrics['bytes'], cache=cache_name)
+
+
+@st.cache_resource
+def get_active_sessions():
+    """Rastreador de sessões ativas, compartilhado entre sessões"""
+    return ActiveSessionTracker()
+
+
+@st.cache_resource
+def get_metrics_registry():
+    """Registro único de métricas do processo, com os coletores de caches e sessões"""
+    registry = MetricsRegistry()
+    registry.add_collector(collect_cache_metrics)
+    registry.add_collector(lambda reg: reg.set('lingodash_active_sessions', get_active_sessions().count()))
+    return registry
+
+
+def start_metrics_server(registry, port=0, host="127.0.0.1"):
+    """
+    Serve GET /metrics em um thread daemon. port=0 escolhe uma porta livre
+    (server.server_address[1]); server.shutdown() encerra.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Scrapes periódicos não poluem o log do Streamlit
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="lingodash-metrics", daemon=True).start()
+    return server
+
+
+@st.cache_resource
+def get_metrics_server():
+    """Endpoint /metrics do processo, iniciado uma vez se LINGODASH_METRICS_PORT estiver definido"""
+    if not METRICS_PORT:
+        return None
+    return start_metrics_server(get_metrics_registry(), int(METRICS_PORT), METRICS_HOST)
+
+
+def write_metrics_file(registry, path):
+    """Exportador em arquivo (estilo textfile collector): escrita atômica via arquivo temporário"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(registry.render(), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def record_rerun_metrics(seconds, section="app"):
+    """
+    Registra a duração do rerun e a sessão atual; publica pelo endpoint e/ou arquivo configurados.
+    `section` é "app" para o script inteiro ou o nome da seção num rerun só do fragment.
+    """
+    registry = get_metrics_registry()
+    registry.observe('lingodash_rerun_duration_seconds', seconds, section=section)
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None:
+        get_active_sessions().touch(ctx.session_id)
+    get_metrics_server()
+    if METRICS_FILE:
+        write_metrics_file(registry, METRICS_FILE)
+
+# ========================================================================================
+# ENHANCED UI HELPER FUNCTIONS
+# ========================================================================================
+
+def show_loading_state(message="Carregando dados..."):
+    """Display enhanced loading state with animation"""
+    return st.markdown(f"""
+    <div class="loading-skeleton">
+        <div style="text-align: center;">
+            <div style="font-size: 1.2rem; margin-bottom: 1rem;">⏳ {message}</div>
+            <div style="font-size: 0.9rem; opacity: 0.7;">Por favor, aguarde...</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Intervalo de verificação dos jobs do pool enquanto o resultado não chega
+POOL_POLL_SECONDS = 0.5
+
+
+def _rerun_when_done(future):
+    """Corpo do fragment de polling: dispara um rerun completo assim que o job termina"""
+    if future.done():
+        st.rerun()
+
+
+def await_pool_job(future, message="Processando simulação..."):
+    """
+    Retorna o resultado do job do pool se ele já terminou. Caso contrário exibe
+    show_loading_state, agenda um fragment com run_every que faz o rerun quando o job
+    terminar e retorna None, sem bloquear o thread da sessão. Sem runtime do Streamlit
+    (testes, scripts) ou sem suporte a fragments, espera o resultado.
+    """
+    if future.done():
+        return future.result()
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    fragment = getattr(st, "fragment", None)
+    if fragment is None or get_script_run_ctx(suppress_warning=True) is None:
+        return future.result()
+    with st.container():
+        show_loading_state(message)
+        fragment(_rerun_when_done, run_every=POOL_POLL_SECONDS)(future)
+    return None
+
+@instrumented
+def create_enhanced_metric_card(title, value, delta, icon="📊", help_text=""):
+    """Create modern metric card with enhanced typography and professional high-contrast colors"""
+    delta_color = "#059669" if str(delta).startswith("+") else "#dc2626" if str(delta).startswith("-") else "#374151"
+    delta_icon = "↗️" if str(delta).startswith("+") else "↘️" if str(delta).startswith("-") else "➡️"
+    delta_class = "positive" if str(delta).startswith("+") else "negative" if str(delta).startswith("-") else ""
+    
+    return f"""
+    <div class="metric-card-enhanced interactive-card" title="{help_text}">
+        <div style="font-size: 14px; color: #64748b; font-weight: 600; margin-bottom: 8px;">
+            {icon} {title}
+        </div>
+        <div style="font-size: 2.5rem; font-weight: 700; color: #0f172a; line-height: 1; margin-bottom: 4px;">
+            {value}
+        </div>
+        <div style="font-size: 13px; color: {delta_color}; font-weight: 600;">
+            {delta_icon} {delta}
+        </div>
+    </div>
+    """
+
+@instrumented
 def create_enhanced_insight_box(title, content, icon="💡"):
     """Create enhanced insight box with professional high-contrast styling"""
     return f"""
@@ -1167,44 +2910,221 @@ def create_enhanced_insight_box(title, content, icon="💡"):
     </div>
     """
 
-def create_export_button(data, filename, button_text="📥 Exportar Dados"):
-    """Create enhanced export button for data"""
-    import io
-    import json
-    
-    if isinstance(data, pd.DataFrame):
-        csv = data.to_csv(index=False)
-        return st.download_button(
-            label=button_text,
-            data=csv,
-            file_name=f"{filename}.csv",
-            mime="text/csv",
-            help="Baixar dados em formato CSV"
-        )
+# ========== Exportação em Streaming ==========
+# Formato -> (extensão, mime, texto de ajuda)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv', "Baixar dados em formato CSV"),
+    'json': ('json', 'application/json', "Baixar dados em formato JSON"),
+    'parquet': ('parquet', 'application/vnd.apache.parquet', "Baixar dados em formato Parquet"),
+}
+# Compressão -> (sufixo do arquivo, mime)
+EXPORT_COMPRESSIONS = {'gzip': ('.gz', 'application/gzip'), 'zstd': ('.zst', 'application/zstd')}
+EXPORT_CHUNK_ROWS = 100_000
+# Acima deste número de linhas a exportação é adiada para o clique e escrita por chunks
+EXPORT_STREAMING_ROWS = 50_000
+# Nível 1: ~5x mais rápido que o padrão 6 para arquivos só ~7% maiores
+EXPORT_GZIP_LEVEL = 1
+
+
+def available_export_formats():
+    """Formatos oferecidos na interface; Parquet só aparece com o pacote pyarrow instalado"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or importlib.util.find_spec("pyarrow") is not None]
+
+
+def resolve_export_compression(compression):
+    """Valida a compressão pedida; zstd sem o pacote zstandard cai para gzip"""
+    if compression is None:
+        return None
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"Compressão não suportada: {compression}")
+    if compression == 'zstd' and importlib.util.find_spec("zstandard") is None:
+        return 'gzip'
+    return compression
+
+
+def _compressed_writer(raw, compression):
+    """Stream binário que comprime em raw; fechar o writer não fecha raw"""
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=EXPORT_GZIP_LEVEL)
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+    return None
+
+
+def iter_export_chunks(data, fmt='csv', chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Serializa data em blocos de bytes de até chunk_rows linhas, sem materializar
+    o arquivo inteiro. DataFrames em JSON viram um array de registros.
+    """
+    if not isinstance(data, pd.DataFrame):
+        yield json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        return
+    if fmt == 'csv':
+        yield data.iloc[:0].to_csv(index=False).encode('utf-8')
+        for start in range(0, len(data), chunk_rows):
+            yield data.iloc[start:start + chunk_rows].to_csv(index=False, header=False).encode('utf-8')
+    elif fmt == 'json':
+        yield b'['
+        for start in range(0, len(data), chunk_rows):
+            records = data.iloc[start:start + chunk_rows].to_json(orient='records', force_ascii=False)
+            yield (',' if start else '').encode('utf-8') + records[1:-1].encode('utf-8')
+        yield b']'
     else:
-        json_data = json.dumps(data, ensure_ascii=False, indent=2)
-        return st.download_button(
-            label=button_text,
-            data=json_data,
-            file_name=f"{filename}.json",
-            mime="application/json",
-            help="Baixar dados em formato JSON"
-        )
+        raise ValueError(f"Formato não suportado para streaming: {fmt}")
+
+
+def write_export(data, stream, fmt='csv', compression=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Escreve data em um stream binário por chunks, comprimindo em gzip/zstd se pedido.
+    Parquet é escrito um row group por chunk, com a compressão aplicada pelo próprio
+    formato (requer pyarrow).
+    """
+    if fmt == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for start in range(0, max(len(data), 1), chunk_rows):
+                table = pa.Table.from_pandas(data.iloc[start:start + chunk_rows], preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(stream, table.schema, compression=compression or 'snappy')
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return stream
+
+    writer = _compressed_writer(stream, compression)
+    target = writer or stream
+    for chunk in iter_export_chunks(data, fmt, chunk_rows):
+        target.write(chunk)
+    if writer is not None:
+        writer.close()
+    return stream
+
+
+def export_payload(data, fmt='csv', compression=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Gera o arquivo exportado num io.BytesIO, um dos tipos aceitos pelo data callable do
+    st.download_button (o armazenamento de mídia do Streamlit guarda os bytes de qualquer forma)
+    """
+    buffer = io.BytesIO()
+    write_export(data, buffer, fmt, compression, chunk_rows)
+    buffer.seek(0)
+    return buffer
+
+
+@instrumented
+def create_export_button(data, filename, button_text="📥 Exportar Dados", fmt=None, compression=None,
+                         key=None):
+    """
+    Create enhanced export button for data.
+
+    Tabelas pequenas sem compressão seguem como texto CSV/JSON. Tabelas grandes,
+    Parquet ou arquivos comprimidos são gerados só no clique (data callable do
+    download_button), escritos por chunks em um io.BytesIO.
+    """
+    is_frame = isinstance(data, pd.DataFrame)
+    fmt = fmt or ('csv' if is_frame else 'json')
+    if fmt not in EXPORT_FORMATS or (fmt != 'json' and not is_frame):
+        raise ValueError(f"Formato de exportação inválido: {fmt}")
+    if fmt not in available_export_formats():
+        raise ImportError(f"A exportação em {fmt} requer o pacote pyarrow")
+    compression = resolve_export_compression(compression)
+    extension, mime, help_text = EXPORT_FORMATS[fmt]
+    file_name = f"{filename}.{extension}"
+
+    if fmt == 'parquet' or compression or (is_frame and len(data) > EXPORT_STREAMING_ROWS):
+        if compression and fmt != 'parquet':
+            suffix, mime = EXPORT_COMPRESSIONS[compression]
+            file_name += suffix
+        payload = lambda: export_payload(data, fmt, compression)
+    elif is_frame:
+        payload = data.to_csv(index=False) if fmt == 'csv' else data.to_json(orient='records', force_ascii=False, indent=2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2)
+
+    return st.download_button(
+        label=button_text,
+        data=payload,
+        file_name=file_name,
+        mime=mime,
+        key=key,
+        help=help_text
+    )
 
 # ========================================================================================
-# INTERFACE PRINCIPAL DO STREAMLIT
+# RENDERIZAÇÃO POR SEÇÃO (LAZY TABS + FRAGMENTS)
 # ========================================================================================
 
-def main():
-    # ========================================================================================
-    # COMPREHENSIVE FRAMEWORK IMPLEMENTATION - WORLD-CLASS DATA VISUALIZATION
-    # ========================================================================================
-    
+# Modo lazy (opcional, LINGODASH_LAZY_TABS=1): troca as st.tabs por um seletor e executa apenas a
+# seção selecionada a cada rerun. Por padrão as abas continuam sendo st.tabs
+LAZY_TABS = os.environ.get("LINGODASH_LAZY_TABS", "0") == "1"
+
+
+def is_fragment_rerun():
+    """True quando a execução atual reexecuta apenas fragments (main() não roda)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
+def section_fragment(func):
+    """
+    Marca uma seção como fragment do Streamlit: interações com widgets dentro dela
+    reexecutam apenas a própria seção, não o script inteiro. Sem suporte a fragments
+    (Streamlit < 1.37) a seção é executada normalmente.
+
+    Num rerun só do fragment, main() não roda: a seção abre o próprio recorder de
+    performance e, ao final, exibe o resumo desse rerun dentro dela.
+    """
+    fragment = getattr(st, "fragment", None)
+    if fragment is None:
+        return func
+
+    @functools.wraps(func)
+    def run_section(*args, **kwargs):
+        if not is_fragment_rerun():
+            return func(*args, **kwargs)
+        recorder = reset_perf_recorder()
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            render_fragment_perf_panel(recorder, func.__name__)
+            record_rerun_metrics(time.perf_counter() - started, section=func.__name__)
+
+    return fragment(run_section)
+
+
+def render_sections(sections, key, lazy=None):
+    """
+    Renderiza uma lista de (rótulo, função) como abas.
+    No modo lazy a navegação é um seletor horizontal e somente a seção visível é executada;
+    caso contrário todas as seções são executadas dentro de st.tabs.
+    """
+    lazy = LAZY_TABS if lazy is None else lazy
+    labels = [label for label, _ in sections]
+    if lazy:
+        selected = st.radio("Seção", labels, horizontal=True, key=key, label_visibility="collapsed")
+        dict(sections)[selected]()
+        return
+    for tab, (_, render) in zip(st.tabs(labels), sections):
+        with tab:
+            render()
+
+
+@instrumented
+def render_header(last_loaded=None):
+    """Cabeçalho com skip link e indicadores de status (incluindo o horário real da última carga dos dados)"""
+    data_status = f"Dados Atualizados · {last_loaded:%d/%m %H:%M:%S}" if last_loaded else "Dados Atualizados"
     # Skip Link for Screen Readers (WCAG 2.1 Compliance)
     st.markdown('<a href="#main-content" class="skip-link">Skip to main content</a>', unsafe_allow_html=True)
     
     # Enhanced Header with Cognitive Psychology & Accessibility Principles
-    st.markdown("""
+    st.markdown(f"""
     <div class="main-header-enhanced" role="banner" aria-label="LingoDash Dashboard Header">
         <div style="display: flex; align-items: center; justify-content: center; gap: 16px; margin-bottom: 16px;">
             <div style="font-size: 48px;" role="img" aria-label="Globe emoji representing global language expansion">🌐</div>
@@ -1220,479 +3140,450 @@ def main():
             </div>
             <div class="status-indicator warning" role="status" aria-live="polite">
                 <span aria-hidden="true">⚡</span>
-                <span>Dados Atualizados</span>
+                <span>{data_status}</span>
             </div>
         </div>
     </div>
     """, unsafe_allow_html=True)
 
+# ========================================================================================
+# TAB 1: EXECUTIVE SUMMARY - Lea Pica's Opening Hook Strategy
+# ========================================================================================
+@section_fragment
+@instrumented
+def render_executive_summary(df_languages, df_projection):
+    """Aba 1: KPIs, insights estratégicos e análise TAM"""
+    st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">📊 VISÃO EXECUTIVA</div>', unsafe_allow_html=True)
+    
+    # Critical KPIs First - Tufte's Most Important Data First Principle
+    data_version = table_version('languages')
+    kpis = cached_executive_kpis(df_languages, df_projection, table_version('languages', 'projection'))
+    for col, card in zip(st.columns(4), executive_kpi_cards(kpis)):
+        with col:
+            st.markdown(create_enhanced_metric_card(**card), unsafe_allow_html=True)
+
     # ========================================================================================
-    # PROGRESSIVE DISCLOSURE WITH COGNITIVE LOAD MANAGEMENT
+    # STRATEGIC INSIGHTS - Wickham's Grammar of Graphics Implementation
     # ========================================================================================
     
-    # Main Navigation - Following F-Pattern Eye Movement
-    main_content = st.container()
-    main_content.markdown('<div id="main-content" tabindex="-1"></div>', unsafe_allow_html=True)
-    
-    # Navigation Guide
-    st.markdown("""
-    <div style="text-align: left; margin: 0 0 10px 5px; color: #64748b; font-size: 16px; font-weight: 500;">
-        👇 Navegue pelas seções clicando nas abas abaixo
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown("### 🎯 **INSIGHTS ESTRATÉGICOS PRINCIPAIS**")
     
-    # Enhanced Tab System with Accessibility and Progressive Disclosure
-    tab1, tab2, tab3 = st.tabs([
-        "Executive summary", 
-        "Strategic analysis", 
-        "Predictive analytics"
-    ])
+    # Enhanced Insight Boxes with Accessibility
+    insights = [
+        {
+            "icon": "🚀",
+            "title": "OPORTUNIDADE CRÍTICA",
+            "content": "<strong>Espanhol</strong> lidera o TAM com 120M pessoas, seguido de <strong>Francês</strong> (95M) e <strong>Alemão</strong> (70M). <strong>Português</strong> aparece com 25M - foco no mercado brasileiro justifica a priorização.",
+            "type": "success"
+        },
+        {
+            "icon": "⚠️", 
+            "title": "ATENÇÃO NECESSÁRIA",
+            "content": "<strong>Francês</strong> e <strong>Alemão</strong> representam mercados maduros com 95M e 70M respectivamente. Requerem estratégia diferenciada para competir com soluções locais estabelecidas.",
+            "type": "warning"
+        },
+        {
+            "icon": "📈",
+            "title": "CRESCIMENTO ACELERADO",
+            "content": "Mandarim (45M) e Italiano (35M) oferecem nicho interessante, mas Japonês (32M) pode ser mais acessível para primeira expansão asiática.",
+            "type": "info"
+        }
+    ]
+    
+    for i, insight in enumerate(insights):
+        st.markdown(f"""
+        <div class="insight-box-enhanced" role="article" aria-labelledby="insight-{i}-title">
+            <h4 id="insight-{i}-title">
+                <span role="img" aria-label="{insight['title']}">{insight['icon']}</span>
+                {insight['title']}
+            </h4>
+            <p>{insight['content']}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
     # ========================================================================================
-    # TAB 1: EXECUTIVE SUMMARY - Lea Pica's Opening Hook Strategy
+    # DATA VISUALIZATION - Tufte's Data-Ink Ratio Optimization
     # ========================================================================================
-    with tab1:
-        st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">📊 VISÃO EXECUTIVA</div>', unsafe_allow_html=True)
+    
+    # TAM Analysis - Horizontal bars for easier reading (Tufte principle)
+    st.markdown("### 📊 **ANÁLISE TAM POR IDIOMA**")
+    
+    col_chart, col_insights = st.columns([2, 1])
+    
+    with col_chart:
+        # Rank index built once per data version: top-K and selections are served by slicing
+        rank_index = cached_rank_index(df_languages, data_version)
+        tam_order = rank_index.order.get('TAM_Milhões', np.array([], dtype=np.int64))
+        selected = st.multiselect(
+            "Filtrar idiomas",
+            options=rank_index.languages[tam_order].tolist(),
+            placeholder=f"Top {TAM_CHART_TOP_K} por TAM",
+            key="tam_selected_languages"
+        )
+        selected_languages = tuple(selected) or None
         
-        # Critical KPIs First - Tufte's Most Important Data First Principle
-        col1, col2, col3, col4 = st.columns(4)
+        # Enhanced TAM chart with accessibility (served from the figure cache)
+        fig_tam = cached_figure(create_interactive_tam_chart, df_languages, selected_languages=selected_languages, build=lambda: create_interactive_tam_chart(
+            df_languages, selected_languages, rank_index=rank_index
+        ), layout=dict(
+            title={
+                'text': "Total Addressable Market por Idioma",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
+            },
+            # Enhanced accessibility
+            annotations=[
+                dict(
+                    text="Dados baseados em pesquisa de mercado 2024",
+                    xref="paper", yref="paper",
+                    x=0.5, y=-0.15, xanchor='center',
+                    showarrow=False,
+                    font=dict(size=12, color='#64748b')
+                )
+            ],
+            # Better contrast and readability
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(family='Inter, sans-serif'),
+            margin=dict(l=50, r=50, t=80, b=80)
+        ))
         
-        with col1:
-            st.markdown("""
-            <div class="metric-card-enhanced" role="region" aria-labelledby="tam-total-label">
-                <h3 id="tam-total-label" class="sr-only">Total Addressable Market</h3>
-                <div class="metric-value" aria-describedby="tam-total-desc">847M</div>
-                <div class="metric-label">TAM Total (pessoas)</div>
-                <div class="metric-delta positive" id="tam-total-desc">+12.3% vs Q anterior</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.plotly_chart(fig_tam, use_container_width=True, config={
+            'displayModeBar': True,
+            'displaylogo': False,
+            'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
+            'toImageButtonOptions': {
+                'format': 'png',
+                'filename': 'lingodash_tam_analysis',
+                'height': 600,
+                'width': 1000,
+                'scale': 2
+            }
+        })
+    
+    with col_insights:
+        st.markdown("#### 💡 **Insights do TAM**")
+        st.markdown("**Top 3 Oportunidades**")
         
-        with col2:
-            st.markdown("""
-            <div class="metric-card-enhanced" role="region" aria-labelledby="revenue-proj-label">
-                <h3 id="revenue-proj-label" class="sr-only">Revenue Projection</h3>
-                <div class="metric-value" aria-describedby="revenue-proj-desc">R$ 225M</div>
-                <div class="metric-label">Projeção 3 Anos</div>
-                <div class="metric-delta positive" id="revenue-proj-desc">ROI estimado: 340%</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("**1. Espanhol**")
+        st.success("120M pessoas • R$ 89 ARPPU")
         
-        with col3:
-            st.markdown("""
-            <div class="metric-card-enhanced" role="region" aria-labelledby="languages-label">
-                <h3 id="languages-label" class="sr-only">Priority Languages</h3>
-                <div class="metric-value" aria-describedby="languages-desc">10</div>
-                <div class="metric-label">Idiomas Prioritários</div>
-                <div class="metric-delta info" id="languages-desc">Priorizados por TAM e ROI</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("**2. Francês**") 
+        st.warning("95M pessoas • R$ 75 ARPPU")
         
-        with col4:
-            st.markdown("""
-            <div class="metric-card-enhanced" role="region" aria-labelledby="confidence-label">
-                <h3 id="confidence-label" class="sr-only">Confidence Level</h3>
-                <div class="metric-value" aria-describedby="confidence-desc">94.2%</div>
-                <div class="metric-label">Nível de Confiança</div>
-                <div class="metric-delta success" id="confidence-desc">Alta precisão estatística</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("**3. Alemão**")
+        st.info("70M pessoas • R$ 68 ARPPU")
 
-        # ========================================================================================
-        # STRATEGIC INSIGHTS - Wickham's Grammar of Graphics Implementation
-        # ========================================================================================
-        
-        st.markdown("### 🎯 **INSIGHTS ESTRATÉGICOS PRINCIPAIS**")
-        
-        # Enhanced Insight Boxes with Accessibility
-        insights = [
-            {
-                "icon": "🚀",
-                "title": "OPORTUNIDADE CRÍTICA",
-                "content": "<strong>Espanhol</strong> lidera o TAM com 120M pessoas, seguido de <strong>Francês</strong> (95M) e <strong>Alemão</strong> (70M). <strong>Português</strong> aparece com 25M - foco no mercado brasileiro justifica a priorização.",
-                "type": "success"
-            },
-            {
-                "icon": "⚠️", 
-                "title": "ATENÇÃO NECESSÁRIA",
-                "content": "<strong>Francês</strong> e <strong>Alemão</strong> representam mercados maduros com 95M e 70M respectivamente. Requerem estratégia diferenciada para competir com soluções locais estabelecidas.",
-                "type": "warning"
-            },
-            {
-                "icon": "📈",
-                "title": "CRESCIMENTO ACELERADO",
-                "content": "Mandarim (45M) e Italiano (35M) oferecem nicho interessante, mas Japonês (32M) pode ser mais acessível para primeira expansão asiática.",
-                "type": "info"
-            }
-        ]
-        
-        for i, insight in enumerate(insights):
+# ========================================================================================
+# TAB 2: STRATEGIC ANALYSIS - REAL STRATEGIC ANALYSIS, NOT JUST CHARTS
+# ========================================================================================
+ROADMAP_PHASE_COLUMNS = 4  # Fases exibidas como cartões; as demais vão para a tabela
+
+
+@instrumented
+def render_roadmap_timeline(roadmap, df_phase_languages):
+    """Cronograma de implementação por fase, derivado de df_phases"""
+    phases = roadmap['phases']
+    if phases.empty:
+        st.info("Dados de fases não disponíveis")
+        return
+    
+    languages = (df_phase_languages.groupby('Fase_Ordem')['Idioma'].agg(', '.join)
+                 if not df_phase_languages.empty else pd.Series(dtype=object))
+    
+    columns = st.columns(min(len(phases), ROADMAP_PHASE_COLUMNS))
+    for position, (col, phase) in enumerate(zip(columns, phases.itertuples(index=False))):
+        with col:
+            st.markdown(f"#### 🎯 **{phase.Fase.upper()}**")
+            st.markdown(f"**{languages.get(position, '—')}**")
             st.markdown(f"""
-            <div class="insight-box-enhanced" role="article" aria-labelledby="insight-{i}-title">
-                <h4 id="insight-{i}-title">
-                    <span role="img" aria-label="{insight['title']}">{insight['icon']}</span>
-                    {insight['title']}
-                </h4>
-                <p>{insight['content']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            • 🗓️ Meses {phase.Mês_Início}-{phase.Mês_Fim}  
+            • 🎯 Meta: {phase.Usuários_Projetados:,.0f} usuários, {format_currency_k(phase.Receita_Esperada_K)} de receita
+            
+            **💰 Investimento:** {format_currency_k(phase.Investimento_K)}  
+            **📈 ROI Esperado:** {phase.ROI_Fase_Pct:.0f}%
+            """)
+    
+    if len(phases) > ROADMAP_PHASE_COLUMNS:
+        st.dataframe(phases, hide_index=True, use_container_width=True)
 
-        # ========================================================================================
-        # DATA VISUALIZATION - Tufte's Data-Ink Ratio Optimization
-        # ========================================================================================
-        
-        # Load data with performance optimization
-        with st.spinner("🔄 Carregando dados com otimização de performance..."):
-            df_languages, df_phases, df_competitors, df_projection = load_data()
-        
-        # TAM Analysis - Horizontal bars for easier reading (Tufte principle)
-        st.markdown("### 📊 **ANÁLISE TAM POR IDIOMA**")
-        
-        col_chart, col_insights = st.columns([2, 1])
+@instrumented
+def render_roadmap_investments(roadmap):
+    """Investimentos, retorno projetado e estratégia de captação"""
+    phases, summary = roadmap['phases'], roadmap['summary']
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("#### 💰 **INVESTIMENTO TOTAL**")
+        st.metric("Total do Roadmap", format_currency_k(summary['total_investment_k']),
+                  help="Soma do investimento de todas as fases")
+        if not phases.empty:
+            total = summary['total_investment_k'] or 1
+            st.markdown("**Breakdown por fase:**")
+            st.markdown("\n".join(
+                f"• {phase.Fase}: {format_currency_k(phase.Investimento_K)} ({phase.Investimento_K / total:.0%})"
+                for phase in phases.head(ROADMAP_PHASE_COLUMNS * 2).itertuples(index=False)
+            ))
         
-        with col_chart:
-            # Enhanced TAM chart with accessibility
-            fig_tam = create_interactive_tam_chart(df_languages)
-            
-            # Add accessibility attributes
-            fig_tam.update_layout(
-                title={
-                    'text': "Total Addressable Market por Idioma",
-                    'x': 0.5,
-                    'xanchor': 'center',
-                    'font': {'size': 18, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
-                },
-                # Enhanced accessibility
-                annotations=[
-                    dict(
-                        text="Dados baseados em pesquisa de mercado 2024",
-                        xref="paper", yref="paper",
-                        x=0.5, y=-0.15, xanchor='center',
-                        showarrow=False,
-                        font=dict(size=12, color='#64748b')
-                    )
-                ],
-                # Better contrast and readability
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(family='Inter, sans-serif'),
-                margin=dict(l=50, r=50, t=80, b=80)
-            )
-            
-            st.plotly_chart(fig_tam, use_container_width=True, config={
-                'displayModeBar': True,
-                'displaylogo': False,
-                'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
-                'toImageButtonOptions': {
-                    'format': 'png',
-                    'filename': 'lingodash_tam_analysis',
-                    'height': 600,
-                    'width': 1000,
-                    'scale': 2
-                }
-            })
+    with col2:
+        st.markdown("#### 📈 **RETORNO PROJETADO**")
+        st.metric("Receita Esperada", format_currency_k(summary['total_revenue_k']),
+                  delta=f"{summary['roi_pct']:.0f}% ROI")
+        breakeven = summary['breakeven_month']
+        st.markdown(f"""
+        **Métricas:**
+        • ROI: {summary['roi_pct']:.0f}% em {summary['horizon_months']} meses
+        • Break-even: {f"mês {breakeven}" if breakeven else "não atingido no horizonte"}
+        • Usuários projetados: {summary['total_users']:,.0f}
+        """)
         
-        with col_insights:
-            st.markdown("#### 💡 **Insights do TAM**")
-            st.markdown("**Top 3 Oportunidades**")
-            
-            st.markdown("**1. Espanhol**")
-            st.success("120M pessoas • R$ 89 ARPPU")
-            
-            st.markdown("**2. Francês**") 
-            st.warning("95M pessoas • R$ 75 ARPPU")
-            
-            st.markdown("**3. Alemão**")
-            st.info("70M pessoas • R$ 68 ARPPU")
+    with col3:
+        st.markdown("#### 🎯 **FUNDING STRATEGY**")
+        st.markdown("**Estrutura de Captação:**")
+        st.markdown("""
+        • Seed Round: R$ 2M (Q4 2024) ✅
+        • Series A: R$ 8M (Q2 2025)
+        • Revenue-based: R$ 3M (Q4 2025)
+        • Target valuation: R$ 45M
+        """)
+    
+    fig_cashflow = cached_figure(create_roadmap_cashflow_chart, roadmap['monthly'],
+                                 breakeven_month=summary['breakeven_month'])
+    st.plotly_chart(fig_cashflow, use_container_width=True)
 
-    # ========================================================================================
-    # TAB 2: STRATEGIC ANALYSIS - REAL STRATEGIC ANALYSIS, NOT JUST CHARTS
-    # ========================================================================================
-    with tab2:
-        st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">🎯 ANÁLISE ESTRATÉGICA AVANÇADA</div>', unsafe_allow_html=True)
+@instrumented
+def render_roadmap_metrics(df_competitors, roadmap):
+    """Posicionamento competitivo e KPIs de acompanhamento"""
+    # Competitive Landscape with strategic overlay
+    st.markdown("### 🏆 **POSICIONAMENTO COMPETITIVO**")
+    fig_comp = cached_figure(create_competitive_landscape, df_competitors, layout=dict(
+        title={
+            'text': "Posicionamento Estratégico vs Concorrentes",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
+        },
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter, sans-serif'),
+        height=400
+    ))
+    st.plotly_chart(fig_comp, use_container_width=True)
+    
+    summary = roadmap['summary']
+    ours = df_competitors[df_competitors['Plataforma'] == OUR_PRODUCT] if 'Plataforma' in df_competitors.columns else df_competitors
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            label="📊 KPI Primário", 
+            value=f"{summary['total_users'] / 1000:,.0f}K",
+            delta="Usuários Projetados (roadmap)",
+            help="Soma dos usuários projetados de todas as fases"
+        )
+    with col2:
+        st.metric(
+            label="💰 Receita Target",
+            value=format_currency_k(summary['total_revenue_k']), 
+            delta="Receita Esperada (roadmap)",
+            help=f"Receita dos {ROADMAP_REVENUE_MONTHS} meses seguintes ao lançamento de cada fase"
+        )
+    with col3:
+        st.metric(
+            label="🎯 Market Share",
+            value=f"{ours['Market_Share_Pct'].iloc[0]:g}%" if not ours.empty else "—",
+            delta="Projetado",
+            help="Participação de mercado projetada na análise competitiva"
+        )
+
+@instrumented
+def render_roadmap_risks():
+    """Riscos críticos, operacionais e plano de contingência"""
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("#### 🔴 **RISCOS CRÍTICOS**")
         
-        # ========================================================================================
-        # 1. MATRIZ DE PRIORIZAÇÃO ESTRATÉGICA
-        # ========================================================================================
-        st.markdown("### 🎯 **MATRIZ DE PRIORIZAÇÃO ESTRATÉGICA**")
+        st.markdown("**Competição Agressiva** - :red[ALTO]")
+        st.markdown("""
+        Duolingo pode lançar features similares  
+        🛡️ **Mitigação:** Diferenciação por IA conversacional
+        """)
+        st.divider()
         
-        col1, col2 = st.columns([1, 1])
+        st.markdown("**Complexidade Cultural** - :orange[MÉDIO]")
+        st.markdown("""
+        Localização inadequada em mercados internacionais  
+        🛡️ **Mitigação:** Parcerias locais + consultoria cultural
+        """)
         
-        with col1:
-            st.markdown("#### 🥇 **TIER 1 - PRIORIDADE MÁXIMA (0-6 meses)**")
-            
-            # Português (Brasil)
-            st.markdown("**🇧🇷 Português (Brasil)** - :green[96 PONTOS]")
-            st.markdown("""
-            • TAM: 25M • ROI: 4.2x • Complexidade: 3/10  
-            • Payback: 8 meses • ARPPU: R$ 98  
-            ✅ **EXECUTAR IMEDIATAMENTE** - Mercado doméstico, baixo risco
-            """)
-            st.divider()
-            
-            # Espanhol  
-            st.markdown("**🇪🇸 Espanhol** - :green[92 PONTOS]")
-            st.markdown("""
-            • TAM: 120M • ROI: 3.8x • Complexidade: 4/10  
-            • Payback: 9 meses • ARPPU: R$ 89  
-            ✅ **EXECUTAR PARALELO** - Maior TAM disponível
-            """)
-            st.divider()
-            
-            st.markdown("#### 🥈 **TIER 2 - ALTA PRIORIDADE (6-12 meses)**")
-            
-            # Francês
-            st.markdown("**🇫🇷 Francês** - :orange[78 PONTOS]")
-            st.markdown("""
-            • TAM: 95M • ROI: 2.8x • Complexidade: 6/10  
-            • Payback: 14 meses • ARPPU: R$ 75  
-            ⚠️ **MERCADO MADURO** - Competição estabelecida
-            """)
-            st.divider()
-            
-            # Alemão
-            st.markdown("**🇩🇪 Alemão** - :orange[72 PONTOS]")
-            st.markdown("""
-            • TAM: 70M • ROI: 2.6x • Complexidade: 7/10  
-            • Payback: 16 meses • ARPPU: R$ 68  
-            ⚠️ **MERCADO EXIGENTE** - Qualidade premium obrigatória
-            """)
-            
-        with col2:
-            # Advanced ROI Matrix with strategic overlay
-            fig_roi = create_advanced_roi_matrix(df_languages)
-            fig_roi.update_layout(
-                title={
-                    'text': "Matriz ROI vs Complexidade - Posicionamento Estratégico",
-                    'x': 0.5,
-                    'xanchor': 'center',
-                    'font': {'size': 16, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
-                },
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(family='Inter, sans-serif'),
-                margin=dict(l=40, r=40, t=60, b=40),
-                height=350
-            )
-            st.plotly_chart(fig_roi, use_container_width=True)
-            
-            st.markdown("#### 📊 **CRITÉRIOS DE PRIORIZAÇÃO**")
-            st.markdown("**Metodologia de Scoring (0-100):**")
-            st.markdown("""
-            • **TAM** (30%): Tamanho do mercado endereçável
-            • **ROI** (25%): Retorno sobre investimento LTV/CAC
-            • **Complexidade** (20%): Dificuldade técnica e cultural
-            • **Payback** (15%): Tempo para recuperação
-            • **Competição** (10%): Intensidade competitiva
-            """)
+    with col2:
+        st.markdown("#### 🟡 **RISCOS OPERACIONAIS**")
         
-        # ========================================================================================
-        # 2. ROADMAP ESTRATÉGICO DE IMPLEMENTAÇÃO
-        # ========================================================================================
-        st.markdown("### 🚀 **ROADMAP ESTRATÉGICO DE IMPLEMENTAÇÃO**")
+        st.markdown("**Escalabilidade Técnica** - :orange[MÉDIO]")
+        st.markdown("""
+        Infraestrutura pode não suportar crescimento rápido  
+        🛡️ **Mitigação:** AWS auto-scaling + monitoring
+        """)
+        st.divider()
         
-        roadmap_tabs = st.tabs(["📅 **Cronograma**", "💰 **Investimentos**", "📈 **Métricas**", "⚠️ **Riscos**"])
+        st.markdown("**Aquisição de Talentos** - :green[BAIXO]")
+        st.markdown("""
+        Dificuldade em contratar especialistas em IA/ML  
+        🛡️ **Mitigação:** Remote-first + equity packages
+        """)
         
-        with roadmap_tabs[0]:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("#### 🎯 **FASE 1: Q1 2025**")
-                st.markdown("**🇧🇷 Português (Brasil)**")
-                st.markdown("""
-                • ✅ MVP em produção (Jan)  
-                • ✅ 50K usuários beta (Fev)  
-                • ✅ Monetização ativa (Mar)  
-                • 🎯 Meta: 100K usuários, R$ 2M ARR
-                
-                **💰 Investimento:** R$ 1.2M  
-                **📈 ROI Esperado:** 280% em 12 meses
-                """)
-                
-            with col2:
-                st.markdown("#### 🎯 **FASE 2: Q2 2025**")
-                st.markdown("**🇪🇸 Espanhol**")
-                st.markdown("""
-                • 🔄 Adaptação cultural (Abr)  
-                • 🔄 Teste de mercado (Mai)  
-                • 🔄 Lançamento oficial (Jun)  
-                • 🎯 Meta: 80K usuários, R$ 1.8M ARR
-                
-                **💰 Investimento:** R$ 800K  
-                **📈 ROI Esperado:** 320% em 10 meses
-                """)
-                
-            with col3:
-                st.markdown("#### 🎯 **FASE 3: Q3-Q4 2025**")
-                st.markdown("**🇫🇷 Francês & 🇩🇪 Alemão**")
-                st.markdown("""
-                • 🔄 Pesquisa de mercado  
-                • 🔄 Adaptação premium  
-                • 🔄 MVP localizado  
-                • 🎯 Meta: 120K usuários combinados
-                
-                **💰 Investimento:** R$ 2.8M  
-                **📈 ROI Esperado:** 180% em 18 meses
-                """)
-            
-        with roadmap_tabs[1]:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("#### 💰 **INVESTIMENTO TOTAL**")
-                st.metric("Total 2025", "R$ 4.8M", help="Investimento total previsto para 2025")
-                st.markdown("""
-                **Breakdown:**
-                • Desenvolvimento: R$ 2.1M (44%)
-                • Marketing: R$ 1.6M (33%)  
-                • Equipe: R$ 800K (17%)
-                • Infraestrutura: R$ 300K (6%)
-                """)
-                
-            with col2:
-                st.markdown("#### 📈 **RETORNO PROJETADO**")
-                st.metric("Receita 2025-2026", "R$ 16.3M", delta="340% ROI")
-                st.markdown("""
-                **Métricas:**
-                • ROI: 340% em 24 meses
-                • Payback médio: 11 meses
-                • Break-even: Q2 2025
-                • Usuários ativos: 330K+
-                """)
-                
-            with col3:
-                st.markdown("#### 🎯 **FUNDING STRATEGY**")
-                st.markdown("**Estrutura de Captação:**")
-                st.markdown("""
-                • Seed Round: R$ 2M (Q4 2024) ✅
-                • Series A: R$ 8M (Q2 2025)
-                • Revenue-based: R$ 3M (Q4 2025)
-                • Target valuation: R$ 45M
-                """)
-            
-        with roadmap_tabs[2]:
-            # Competitive Landscape with strategic overlay
-            st.markdown("### 🏆 **POSICIONAMENTO COMPETITIVO**")
-            fig_comp = create_competitive_landscape(df_competitors)
-            fig_comp.update_layout(
-                title={
-                    'text': "Posicionamento Estratégico vs Concorrentes",
-                    'x': 0.5,
-                    'xanchor': 'center',
-                    'font': {'size': 16, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
-                },
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(family='Inter, sans-serif'),
-                height=400
+    with col3:
+        st.markdown("#### 💡 **PLANO DE CONTINGÊNCIA**")
+        st.markdown("**Cenários Alternativos:**")
+        st.markdown("""
+        • **Cenário Pessimista:** Foco só Brasil/México
+        • **Cenário Otimista:** Aceleração para 7 idiomas
+        • **Pivot Option:** B2B corporate training
+        • **Exit Strategy:** Aquisição por BigTech (R$ 120M)
+        """)
+
+PRIORITY_TIER_STYLE = {'Tier 1': ('🥇', 'green'), 'Tier 2': ('🥈', 'orange'), 'Tier 3': ('🥉', 'red')}
+PRIORITY_TIER_DISPLAY = 3  # Idiomas exibidos por tier
+
+
+def render_priority_tiers(ranking):
+    """Lista os idiomas mais bem pontuados de cada tier, a partir do ranking calculado"""
+    for _, tier, description in PRIORITY_TIERS:
+        members = ranking[ranking['Tier'] == tier]
+        if members.empty:
+            continue
+        icon, color = PRIORITY_TIER_STYLE[tier]
+        st.markdown(f"#### {icon} **{tier.upper()} - {description}**")
+        for _, row in members.head(PRIORITY_TIER_DISPLAY).iterrows():
+            st.markdown(f"**#{row['Rank']} {row['Idioma']}** - :{color}[{row['Score']:.0f} PONTOS]")
+            st.markdown(
+                f"• TAM: {row['TAM_Milhões']:g}M • ROI: {row['ROI_Ratio']:.1f}x • Complexidade: {row['Complexidade_Técnica']}/10  \n"
+                f"• Payback: {row['Payback_Meses']} meses • ARPPU: US$ {row['ARPPU_USD']}"
             )
-            st.plotly_chart(fig_comp, use_container_width=True)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric(
-                    label="📊 KPI Primário", 
-                    value="330K",
-                    delta="Usuários Ativos (2025)",
-                    help="Meta de usuários ativos para 2025"
-                )
-            with col2:
-                st.metric(
-                    label="💰 Receita Target",
-                    value="R$ 16.3M", 
-                    delta="ARR Projetado (2026)",
-                    help="Annual Recurring Revenue projetado para 2026"
-                )
-            with col3:
-                st.metric(
-                    label="🎯 Market Share",
-                    value="3.2%",
-                    delta="LATAM (Meta 2026)",
-                    help="Participação de mercado estimada na América Latina"
-                )
-                
-        with roadmap_tabs[3]:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("#### 🔴 **RISCOS CRÍTICOS**")
-                
-                st.markdown("**Competição Agressiva** - :red[ALTO]")
-                st.markdown("""
-                Duolingo pode lançar features similares  
-                🛡️ **Mitigação:** Diferenciação por IA conversacional
-                """)
-                st.divider()
-                
-                st.markdown("**Complexidade Cultural** - :orange[MÉDIO]")
-                st.markdown("""
-                Localização inadequada em mercados internacionais  
-                🛡️ **Mitigação:** Parcerias locais + consultoria cultural
-                """)
-                
-            with col2:
-                st.markdown("#### 🟡 **RISCOS OPERACIONAIS**")
-                
-                st.markdown("**Escalabilidade Técnica** - :orange[MÉDIO]")
-                st.markdown("""
-                Infraestrutura pode não suportar crescimento rápido  
-                🛡️ **Mitigação:** AWS auto-scaling + monitoring
-                """)
-                st.divider()
-                
-                st.markdown("**Aquisição de Talentos** - :green[BAIXO]")
-                st.markdown("""
-                Dificuldade em contratar especialistas em IA/ML  
-                🛡️ **Mitigação:** Remote-first + equity packages
-                """)
-                
-            with col3:
-                st.markdown("#### 💡 **PLANO DE CONTINGÊNCIA**")
-                st.markdown("**Cenários Alternativos:**")
-                st.markdown("""
-                • **Cenário Pessimista:** Foco só Brasil/México
-                • **Cenário Otimista:** Aceleração para 7 idiomas
-                • **Pivot Option:** B2B corporate training
-                • **Exit Strategy:** Aquisição por BigTech (R$ 120M)
-                """)
+        if len(members) > PRIORITY_TIER_DISPLAY:
+            st.caption(f"+ {len(members) - PRIORITY_TIER_DISPLAY} idiomas neste tier")
+        st.divider()
 
+
+@section_fragment
+@instrumented
+def render_strategic_analysis(df_languages, df_phases, df_competitors, df_phase_languages):
+    """Aba 2: matriz de priorização e roadmap de implementação"""
+    st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">🎯 ANÁLISE ESTRATÉGICA AVANÇADA</div>', unsafe_allow_html=True)
+    
     # ========================================================================================
-    # TAB 3: PREDICTIVE ANALYTICS - Advanced Forecasting with Uncertainty
+    # 1. MATRIZ DE PRIORIZAÇÃO ESTRATÉGICA
     # ========================================================================================
-    with tab3:
-        st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">🔮 ANALYTICS PREDITIVOS</div>', unsafe_allow_html=True)
+    st.markdown("### 🎯 **MATRIZ DE PRIORIZAÇÃO ESTRATÉGICA**")
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # Pesos ajustáveis: o re-ranqueamento roda apenas neste fragmento
+        with st.expander("⚖️ **Ajustar pesos dos critérios**"):
+            weights = {
+                column: st.slider(
+                    label, 0, 50, int(PRIORITY_DEFAULT_WEIGHTS[column] * 100), step=5,
+                    format="%d%%", key=f"priority_weight_{column}", help=description
+                ) / 100
+                for column, (label, _, description) in PRIORITY_CRITERIA.items()
+            }
         
-        # Scenario Planning Controls
-        st.markdown("#### 🎛️ **Controles de Cenário**")
+        if df_languages.empty:
+            st.info("Dados de idiomas não disponíveis para priorização")
+        else:
+            normalized = cached_priority_criteria(df_languages, table_version('languages'))
+            render_priority_tiers(score_priorities(df_languages, normalized, weights))
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            scenario_factor = st.slider(
-                "Fator de Crescimento", 
-                min_value=0.5, 
-                max_value=2.0, 
-                value=1.0, 
-                step=0.1,
-                help="Ajusta as projeções baseado em diferentes cenários econômicos"
-            )
-        with col2:
-            confidence_level = st.selectbox(
-                "Nível de Confiança",
-                options=[0.80, 0.90, 0.95, 0.99],
-                index=2,
-                format_func=lambda x: f"{x*100:.0f}%"
-            )
-        with col3:
-            time_horizon = st.selectbox(
-                "Horizonte Temporal",
-                options=[1, 2, 3, 5],
-                index=2,
-                format_func=lambda x: f"{x} ano{'s' if x > 1 else ''}"
-            )
+    with col2:
+        # Advanced ROI Matrix with strategic overlay
+        fig_roi = cached_figure(create_advanced_roi_matrix, df_languages, layout=dict(
+            title={
+                'text': "Matriz ROI vs Complexidade - Posicionamento Estratégico",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 16, 'family': 'Inter, sans-serif', 'color': '#1e293b'}
+            },
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(family='Inter, sans-serif'),
+            margin=dict(l=40, r=40, t=60, b=40),
+            height=350
+        ))
+        st.plotly_chart(fig_roi, use_container_width=True)
         
-        # Revenue Projections with Scenarios
-        st.markdown("### 📈 **PROJEÇÕES DE RECEITA**")
-        fig_proj = create_revenue_projection_with_scenarios(df_projection, scenario_factor)
-        fig_proj.update_layout(
+        st.markdown("#### 📊 **CRITÉRIOS DE PRIORIZAÇÃO**")
+        st.markdown("**Metodologia de Scoring (0-100):**")
+        weight_vector = priority_weight_vector(weights)
+        st.markdown("\n".join(
+            f"• **{label}** ({weight:.0%}): {description}"
+            for (label, _, description), weight in zip(PRIORITY_CRITERIA.values(), weight_vector)
+            if weight > 0
+        ))
+    
+    # ========================================================================================
+    # 2. ROADMAP ESTRATÉGICO DE IMPLEMENTAÇÃO
+    # ========================================================================================
+    st.markdown("### 🚀 **ROADMAP ESTRATÉGICO DE IMPLEMENTAÇÃO**")
+    
+    roadmap = cached_roadmap(df_phases, table_version('phases'))
+    render_sections([
+        ("📅 **Cronograma**", lambda: render_roadmap_timeline(roadmap, df_phase_languages)),
+        ("💰 **Investimentos**", lambda: render_roadmap_investments(roadmap)),
+        ("📈 **Métricas**", lambda: render_roadmap_metrics(df_competitors, roadmap)),
+        ("⚠️ **Riscos**", render_roadmap_risks),
+    ], key="roadmap_section")
+
+# ========================================================================================
+# TAB 3: PREDICTIVE ANALYTICS - Advanced Forecasting with Uncertainty
+# ========================================================================================
+@section_fragment
+@instrumented
+def render_predictive_analytics(df_languages, df_projection):
+    """Aba 3: controles de cenário, projeções Monte Carlo e sensibilidade"""
+    st.markdown('<div class="tab-header-enhanced" role="heading" aria-level="2">🔮 ANALYTICS PREDITIVOS</div>', unsafe_allow_html=True)
+    
+    # Scenario Planning Controls
+    st.markdown("#### 🎛️ **Controles de Cenário**")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        scenario_factor = st.slider(
+            "Fator de Crescimento", 
+            min_value=0.5, 
+            max_value=2.0, 
+            value=1.0, 
+            step=0.1,
+            help="Ajusta as projeções baseado em diferentes cenários econômicos"
+        )
+    with col2:
+        confidence_level = st.selectbox(
+            "Nível de Confiança",
+            options=[0.80, 0.90, 0.95, 0.99],
+            index=2,
+            format_func=lambda x: f"{x*100:.0f}%"
+        )
+    with col3:
+        time_horizon = st.selectbox(
+            "Horizonte Temporal",
+            options=[1, 2, 3, 5],
+            index=2,
+            format_func=lambda x: f"{x} ano{'s' if x > 1 else ''}"
+        )
+    
+    # Revenue Projections with Scenarios
+    st.markdown("### 📈 **PROJEÇÕES DE RECEITA**")
+    data_version = table_version('languages')
+    df_simulation = await_pool_job(
+        pooled_revenue_projection(df_languages, confidence_level, time_horizon, data_version),
+        "Simulando projeções Monte Carlo..."
+    )
+    if df_simulation is not None:
+        if df_simulation.empty:
+            df_simulation = df_projection
+        fig_proj = cached_figure(create_revenue_projection_with_scenarios, df_simulation, scenario_factor=scenario_factor,
+                                 version=(confidence_level, time_horizon), layout=dict(
             title={
                 'text': f"Projeção de Receita - Cenário {scenario_factor:.1f}x com {confidence_level*100:.0f}% de Confiança",
                 'x': 0.5,
@@ -1703,18 +3594,59 @@ def main():
             paper_bgcolor='rgba(0,0,0,0)',
             font=dict(family='Inter, sans-serif'),
             margin=dict(l=60, r=60, t=80, b=60)
-        )
+        ))
         st.plotly_chart(fig_proj, use_container_width=True)
-        
-        # Sensitivity Analysis
-        st.markdown("### 🎯 **ANÁLISE DE SENSIBILIDADE**")
-        sensitivity_data = create_sensitivity_analysis()
+
+        with st.expander("📥 Exportar Projeção"):
+            col_fmt, col_comp, col_btn = st.columns(3)
+            with col_fmt:
+                export_format = st.selectbox("Formato", options=available_export_formats(), format_func=str.upper,
+                                             key="projection_export_format")
+            with col_comp:
+                export_compression = st.selectbox("Compressão", options=[None, *EXPORT_COMPRESSIONS],
+                                                  format_func=lambda c: c or "Nenhuma", key="projection_export_compression")
+            with col_btn:
+                create_export_button(df_simulation, f"projecao_{confidence_level*100:.0f}_{time_horizon}a",
+                                     fmt=export_format, compression=export_compression, key="projection_export")
+    
+    # Sensitivity Analysis
+    st.markdown("### 🎯 **ANÁLISE DE SENSIBILIDADE**")
+    col_res, col_lang = st.columns(2)
+    with col_res:
+        sensitivity_resolution = st.select_slider(
+            "Resolução da Grade",
+            options=[11, 51, 101, 251, 501],
+            value=11,
+            help="Número de pontos por eixo na grade TAM × Conversão"
+        )
+    with col_lang:
+        sensitivity_language = st.selectbox(
+            "Idioma",
+            options=["Todos"] + list(df_languages.get('Idioma', [])),
+            index=0
+        )
+    sensitivity_language = None if sensitivity_language == "Todos" else sensitivity_language
+    sensitivity_grid = await_pool_job(
+        pooled_sensitivity_grid(df_languages, sensitivity_resolution, sensitivity_language, data_version),
+        "Calculando grade de sensibilidade..."
+    )
+    if sensitivity_grid is not None:
+        sensitivity_data = cached_figure(
+            create_sensitivity_analysis, df_languages,
+            resolution=sensitivity_resolution,
+            language=sensitivity_language,
+            build=lambda: create_sensitivity_analysis(
+                df_languages,
+                resolution=sensitivity_resolution,
+                language=sensitivity_language,
+                grid=sensitivity_grid
+            )
+        )
         st.plotly_chart(sensitivity_data, use_container_width=True)
 
-    # ========================================================================================
-    # FOOTER WITH METHODOLOGY & PERFORMANCE METRICS
-    # ========================================================================================
-    
+@instrumented
+def render_footer():
+    """Rodapé com metodologia e princípios de design"""
     st.markdown("---")
     st.markdown("""
     <div style="text-align: center; color: #6c757d; font-size: 0.9em; padding: 20px 0;">
@@ -1732,5 +3664,97 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+def _render_perf_summary(recorder, label):
+    st.metric(label, f"{recorder.total_wall_ms():.0f} ms")
+    st.dataframe(
+        recorder.summary().round(1).rename(columns={
+            'name': 'Trecho', 'calls': 'Chamadas', 'wall_ms': 'Wall (ms)',
+            'cpu_ms': 'CPU (ms)', 'alloc_blocks': 'Blocos alocados'
+        }),
+        hide_index=True, use_container_width=True
+    )
+
+
+def render_perf_panel(recorder=None):
+    """Painel opcional na sidebar: tempos do rerun completo por trecho instrumentado e exportação em JSON"""
+    if not PERF_ENABLED:
+        return
+    recorder = recorder if recorder is not None else PERF_RECORDER
+    with st.sidebar:
+        if not st.toggle("⏱️ Painel de performance", key="perf_panel"):
+            return
+        _render_perf_summary(recorder, "Tempo do rerun")
+        st.caption("Reruns de uma seção aparecem dentro da própria seção")
+        create_export_button(
+            {**recorder.export(), 'caches': shared_cache_metrics()},
+            f"perf_{recorder.started_at:%Y%m%d_%H%M%S}", "📥 Exportar JSON", key="perf_export"
+        )
+
+
+def render_fragment_perf_panel(recorder, section):
+    """Resumo do rerun de uma seção (fragment), exibido nela: o fragment não redesenha a sidebar"""
+    if not PERF_ENABLED or not st.session_state.get("perf_panel"):
+        return
+    with st.expander(f"⏱️ Performance · {section}", expanded=True):
+        _render_perf_summary(recorder, "Tempo do rerun da seção")
+        create_export_button(
+            {**recorder.export(), 'section': section, 'caches': shared_cache_metrics()},
+            f"perf_{section}_{recorder.started_at:%Y%m%d_%H%M%S}", "📥 Exportar JSON",
+            key=f"perf_export_{section}"
+        )
+
+# ========================================================================================
+# INTERFACE PRINCIPAL DO STREAMLIT
+# ========================================================================================
+
+def main():
+    # ========================================================================================
+    # COMPREHENSIVE FRAMEWORK IMPLEMENTATION - WORLD-CLASS DATA VISUALIZATION
+    # ========================================================================================
+    
+    configure_page()
+    reset_perf_recorder()
+    rerun_started = time.perf_counter()
+    begin_data_run()
+    
+    # Load data with performance optimization
+    with st.spinner("🔄 Carregando dados com otimização de performance..."):
+        (df_languages, df_phases, df_competitors, df_projection), last_loaded = load_data_with_status()
+        df_phase_languages = load_phase_languages()
+    
+    render_header(last_loaded)
+
+    # ========================================================================================
+    # PROGRESSIVE DISCLOSURE WITH COGNITIVE LOAD MANAGEMENT
+    # ========================================================================================
+    
+    # Main Navigation - Following F-Pattern Eye Movement
+    main_content = st.container()
+    main_content.markdown('<div id="main-content" tabindex="-1"></div>', unsafe_allow_html=True)
+    
+    # Navigation Guide
+    st.markdown("""
+    <div style="text-align: left; margin: 0 0 10px 5px; color: #64748b; font-size: 16px; font-weight: 500;">
+        👇 Navegue pelas seções clicando nas abas abaixo
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Enhanced Tab System with Accessibility and Progressive Disclosure
+    # Each section is an independently invocable render function
+    render_sections([
+        ("Executive summary", lambda: render_executive_summary(df_languages, df_projection)),
+        ("Strategic analysis", lambda: render_strategic_analysis(df_languages, df_phases, df_competitors, df_phase_languages)),
+        ("Predictive analytics", lambda: render_predictive_analytics(df_languages, df_projection)),
+    ], key="main_section")
+
+    # ========================================================================================
+    # FOOTER WITH METHODOLOGY & PERFORMANCE METRICS
+    # ========================================================================================
+    
+    render_footer()
+    render_perf_panel()
+    record_rerun_metrics(time.perf_counter() - rerun_started)
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
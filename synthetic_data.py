@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for LingoDash
+Writes the four CSV tables in the same raw schema as data/ with an
+arbitrary number of rows, so load_data and the charts can be exercised
+at catalog sizes far beyond the shipped 10 languages
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BUSINESS_MODELS = np.array(["Freemium", "Paid", "Subscription", "Tutoring"])
+
+
+def generate_languages(n_rows, seed=42):
+    """Tabela de idiomas (schema bruto de languages.csv) com distribuições plausíveis"""
+    rng = np.random.default_rng(seed)
+    tam = np.round(rng.lognormal(mean=2.5, sigma=1.0, size=n_rows), 1)
+    arppu = rng.integers(15, 40, size=n_rows)
+    ano1 = np.round(tam * rng.uniform(2.0, 4.0, size=n_rows)).astype(int) + 10
+    investimento = rng.integers(20, 120, size=n_rows)
+    return pd.DataFrame({
+        'Idioma': np.char.add("Idioma ", np.arange(1, n_rows + 1).astype(str)),
+        'TAM_Milhoes': tam,
+        'ARPPU_USD': arppu,
+        'LTV_USD': arppu * rng.integers(2, 5, size=n_rows),
+        'CAC_USD': rng.integers(10, 50, size=n_rows),
+        'Ano1_Revenue_K': ano1,
+        'Ano2_Revenue_K': np.round(ano1 * rng.uniform(1.2, 3.5, size=n_rows)).astype(int),
+        'Complexidade_Tecnica': rng.integers(1, 6, size=n_rows),
+        'Payback_Meses': rng.integers(4, 25, size=n_rows),
+        'Rank_Global': rng.permutation(n_rows) + 1,
+        'Investimento_K': investimento,
+        'Market_Readiness': rng.integers(1, 11, size=n_rows),
+        'Competicao_Level': rng.integers(1, 11, size=n_rows),
+    })
+
+
+def generate_phases(n_rows, languages, seed=42):
+    """Tabela de fases; cada fase lista até três idiomas no formato de lista em string do CSV original"""
+    rng = np.random.default_rng(seed + 1)
+    names = np.asarray(languages)
+    picks = names[rng.integers(0, len(names), size=(n_rows, 3))]
+    idiomas = ("['" + pd.Series(picks[:, 0]) + "','" + pd.Series(picks[:, 1]) + "','" + pd.Series(picks[:, 2]) + "']")
+    start = np.arange(n_rows) * 6
+    fase = ("Fase " + pd.Series(np.arange(1, n_rows + 1).astype(str))
+            + " (" + pd.Series(start.astype(str)) + "-" + pd.Series((start + 6).astype(str)) + "m)")
+    investimento = rng.integers(50, 200, size=n_rows)
+    return pd.DataFrame({
+        'Fase': fase,
+        'Idiomas': idiomas,
+        'Investimento_K': investimento,
+        'Receita_Esperada_K': investimento * rng.integers(3, 9, size=n_rows),
+        'Usuarios_Projetados': rng.integers(5_000, 60_000, size=n_rows),
+    })
+
+
+def generate_competitors(n_rows, seed=42):
+    """Tabela de competidores com market share normalizado para 100%"""
+    rng = np.random.default_rng(seed + 2)
+    share = rng.pareto(1.5, size=n_rows) + 1
+    return pd.DataFrame({
+        'Plataforma': np.char.add("Plataforma ", np.arange(1, n_rows + 1).astype(str)),
+        'Market_Share_Pct': np.round(share / share.sum() * 100, 4),
+        'User_Base_Milhoes': np.round(rng.lognormal(1.5, 1.0, size=n_rows), 2),
+        'Revenue_Milhoes': np.round(rng.lognormal(3.0, 1.2, size=n_rows), 2),
+        'Idiomas_Count': rng.integers(1, 45, size=n_rows),
+        'Modelo_Negocio': BUSINESS_MODELS[rng.integers(0, len(BUSINESS_MODELS), size=n_rows)],
+    })
+
+
+def generate_projection(n_rows, seed=42):
+    """Projeção com n_rows períodos ("Atual", "Ano 1", ...) e bandas min/max em torno da base"""
+    rng = np.random.default_rng(seed + 3)
+    # Crescimento linear acumulado: composto estoura float64 em catálogos de milhões de períodos
+    base = np.round(1000 * (1 + np.cumsum(rng.uniform(0.05, 0.6, size=n_rows))))
+    spread = rng.uniform(0.05, 0.3, size=n_rows)
+    periodo = pd.Series(np.arange(n_rows).astype(str))
+    return pd.DataFrame({
+        'Periodo': ("Ano " + periodo).where(periodo != "0", "Atual"),
+        'Receita_Base_K': base,
+        'Receita_Min_K': np.round(base * (1 - spread)),
+        'Receita_Max_K': np.round(base * (1 + spread)),
+        'Confianca_Pct': np.clip(95 - np.arange(n_rows) * 5, 50, 95),
+    })
+
+
+def generate_tables(n_rows, seed=42):
+    """Gera as quatro tabelas brutas, indexadas pelos mesmos nomes de DATA_TABLES"""
+    languages = generate_languages(n_rows, seed)
+    return {
+        'languages': languages,
+        'phases': generate_phases(n_rows, languages['Idioma'], seed),
+        'competitors': generate_competitors(n_rows, seed),
+        'projection': generate_projection(n_rows, seed),
+    }
+
+
+def write_synthetic_data(data_dir, n_rows, seed=42):
+    """Escreve os CSVs sintéticos em data_dir e retorna {tabela: caminho}"""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    written = {}
+    for name, df in generate_tables(n_rows, seed).items():
+        path = data_dir / f"{name}.csv"
+        df.to_csv(path, index=False)
+        written[name] = path
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic LingoDash data tables")
+    parser.add_argument("data_dir", type=Path, help="Output directory for the CSV files")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per table")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    written = write_synthetic_data(args.data_dir, args.rows, args.seed)
+    print(f"✅ Wrote {len(written)} tables with {args.rows:,} rows each to {args.data_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Benchmarks de escala para LingoDash (pytest-benchmark)
+Executa load_data, a preparação das colunas derivadas e cada função create_* sobre
+tabelas sintéticas, registrando tempo (stats do benchmark) e pico de memória (extra_info)
+
+Tamanhos: LINGODASH_BENCH_SIZES=1000,100000,1000000 (padrão: 1000; a varredura completa
+          roda com `python run_tests.py --scale`)
+Sem estatísticas (--benchmark-disable ou xdist) só o orçamento de memória é verificado
+Regressões: pytest tests/test_benchmarks.py --benchmark-autosave
+            pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+import sys, os, tracemalloc
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+pytest.importorskip("pytest_benchmark")
+
+import streamlit_app as app
+import synthetic_data
+
+BENCH_SIZES = [int(size) for size in os.environ.get("LINGODASH_BENCH_SIZES", "1000").split(",") if size.strip()]
+
+# Orçamentos (tempo médio em segundos, pico de memória em MB) por tamanho de tabela
+BUDGETS = {
+    'load_data':                    {1_000: (0.5, 50),  100_000: (5.0, 400),  1_000_000: (40.0, 4000)},
+    'prepare_languages':            {1_000: (0.1, 20),  100_000: (0.2, 100),  1_000_000: (1.0, 1000)},
+    'create_interactive_tam_chart': {1_000: (0.5, 50),  100_000: (0.5, 100),  1_000_000: (1.0, 500)},
+    'create_advanced_roi_matrix':   {1_000: (0.5, 50),  100_000: (0.5, 100),  1_000_000: (2.0, 500)},
+    'create_revenue_projection':    {1_000: (0.5, 50),  100_000: (2.0, 200),  1_000_000: (15.0, 1000)},
+    'create_competitive_landscape': {1_000: (0.5, 50),  100_000: (0.5, 100),  1_000_000: (3.0, 500)},
+    'create_sensitivity_analysis':  {1_000: (0.2, 20),  100_000: (0.5, 100),  1_000_000: (2.0, 500)},
+}
+
+CHARTS = {
+    'create_interactive_tam_chart': lambda frames: app.create_interactive_tam_chart(frames['languages']),
+    'create_advanced_roi_matrix': lambda frames: app.create_advanced_roi_matrix(frames['languages']),
+    'create_revenue_projection': lambda frames: app.create_revenue_projection_with_scenarios(frames['projection']),
+    'create_competitive_landscape': lambda frames: app.create_competitive_landscape(frames['competitors']),
+    'create_sensitivity_analysis': lambda frames: app.create_sensitivity_analysis(frames['languages']),
+}
+
+
+@pytest.fixture(scope="module", params=BENCH_SIZES, ids=lambda size: f"{size}rows")
+def synthetic_dataset(request, tmp_path_factory):
+    """Gera e prepara as tabelas sintéticas uma vez por tamanho"""
+    size = request.param
+    data_dir = tmp_path_factory.mktemp(f"data_{size}")
+    synthetic_data.write_synthetic_data(data_dir, size)
+    raw = {name: app.pd.read_csv(data_dir / f"{name}.csv") for name in app.DATA_TABLES}
+    frames = {name: prepare(raw[name]) for name, prepare in app.DATA_TABLES.items()}
+    return size, data_dir, raw, frames
+
+
+def _run(benchmark, name, size, func, setup=None):
+    """Mede o pico de memória numa execução isolada, depois o tempo via benchmark, e compara com o orçamento"""
+    if size not in BUDGETS[name]:
+        pytest.skip(f"{name} sem orçamento para {size} linhas")
+    max_seconds, max_mb = BUDGETS[name][size]
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+    rounds = 3 if size <= 100_000 else 1
+    benchmark.extra_info.update(rows=size, peak_memory_mb=round(peak_mb, 2))
+    benchmark.pedantic(func, setup=setup, rounds=rounds, iterations=1)
+
+    assert peak_mb < max_mb, f"{name} com {size} linhas usou {peak_mb:.1f}MB (orçamento {max_mb}MB)"
+    if benchmark.stats is None:
+        # --benchmark-disable ou xdist: a função rodou uma vez, mas não há tempo médio para comparar
+        return
+    mean = benchmark.stats.stats.mean
+    assert mean < max_seconds, f"{name} com {size} linhas levou {mean:.2f}s (orçamento {max_seconds}s)"
+
+
+# ========== Carregamento de Dados ==========
+def test_benchmark_load_data(benchmark, synthetic_dataset):
+    size, data_dir, _, _ = synthetic_dataset
+
+    def clear_caches():
+        # Mede a carga a frio: hashes de conteúdo e tabelas são recalculados
+        app._file_content_hash.clear()
+        app._load_table_cached.clear()
+
+    def load():
+        frames = app.load_data(data_dir)
+        assert len(frames[0]) == size, "load_data retornou tabela incompleta"
+
+    _run(benchmark, 'load_data', size, load, setup=clear_caches)
+
+
+def test_benchmark_prepare_languages(benchmark, synthetic_dataset):
+    size, _, raw, _ = synthetic_dataset
+    _run(benchmark, 'prepare_languages', size, lambda: app.prepare_languages(raw['languages']))
+
+
+# ========== Funções de Visualização ==========
+@pytest.mark.parametrize("chart", list(CHARTS))
+def test_benchmark_charts(benchmark, synthetic_dataset, chart):
+    size, _, _, frames = synthetic_dataset
+    _run(benchmark, chart, size, lambda: CHARTS[chart](frames))
+
+
+# ========== Orçamentos de Interatividade (fora da suíte funcional) ==========
+def _within(benchmark, name, max_seconds, func, setup=None, rounds=5):
+    """Mede func via benchmark e compara o tempo médio com o orçamento; sem estatísticas só executa"""
+    result = benchmark.pedantic(func, setup=setup, rounds=rounds, iterations=1)
+    if benchmark.stats is not None:
+        mean = benchmark.stats.stats.mean
+        assert mean < max_seconds, f"{name} levou {mean:.3f}s (orçamento {max_seconds}s)"
+    return result
+
+
+def test_benchmark_sensitivity_grid_500x500(benchmark):
+    df_languages, _, _, _ = app.load_data()
+    grid = _within(benchmark, 'compute_sensitivity_grid 500x500', 0.1,
+                   lambda: app.compute_sensitivity_grid(df_languages, resolution=500))
+    assert grid['revenue'].shape == (500, 500)
+
+
+def test_benchmark_monte_carlo_100k_paths(benchmark):
+    df_languages, _, _, _ = app.load_data()
+    df_sim = _within(benchmark, 'simulate_revenue_projection 100k caminhos', 1.0,
+                     lambda: app.simulate_revenue_projection(df_languages, confidence_level=0.95, time_horizon=5),
+                     rounds=3)
+    assert len(df_sim) == 5
+
+
+def test_benchmark_priority_rescoring_100k(benchmark):
+    df = app.prepare_languages(synthetic_data.generate_languages(100_000))
+    normalized = app.normalize_priority_criteria(df)
+    ranking = _within(benchmark, 'score_priorities 100k idiomas', 0.1,
+                      lambda: app.score_priorities(df, normalized, weights={'ROI_Ratio': 0.5, 'Market_Readiness': 0.5}))
+    assert ranking['Rank'].iloc[0] == 1
+
+
+def test_benchmark_roadmap_500_phases(benchmark):
+    n = 500
+    df_phases = app.pd.DataFrame({
+        'Fase': [f"Fase {i} ({3 * i}-{3 * i + 3}m)" for i in range(n)],
+        'Investimento_K': [100] * n,
+        'Receita_Esperada_K': [300] * n,
+        'Usuários_Projetados': [1000] * n,
+    })
+    roadmap = _within(benchmark, 'compute_roadmap 500 fases', 1.0, lambda: app.compute_roadmap(df_phases))
+    assert len(roadmap['phases']) == n
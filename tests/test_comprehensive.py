@@ -1,4 +1,4 @@
-import sys, os
+import sys, os, io
 import pytest
 import pandas as pd
 import numpy as np
@@ -6,6 +6,17 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import streamlit_app as app
 
+
+@pytest.fixture(autouse=True)
+def static_dir(tmp_path, monkeypatch):
+    """Test fixture: generated stylesheets go to a tmp dir, never into the tracked static/ folder"""
+    path = tmp_path / "static"
+    monkeypatch.setattr(app, "STATIC_DIR", path)
+    app.get_stylesheet_tag.clear()
+    yield path
+    app.get_stylesheet_tag.clear()
+
+
 # ========== Test Helper Functions ==========
 
 def test_create_tufte_optimized_layout():
@@ -30,6 +41,24 @@ def test_create_tufte_optimized_layout():
     assert layout['yaxis']['gridwidth'] == 0.5
 
 
+def test_tufte_template_registered_once():
+    """Test the design system is a named Plotly template shared by the charts"""
+    name = app.tufte_template()
+    template = app.pio.templates[name]
+    assert app.tufte_template() == name
+    assert app.pio.templates[name] is template  # Registered only once
+
+    layout = app.create_tufte_optimized_layout()
+    assert template.layout.plot_bgcolor == layout['plot_bgcolor']
+    assert template.layout.yaxis.gridwidth == layout['yaxis']['gridwidth']
+
+    df_languages, _, _, _ = app.load_data()
+    fig = app.create_interactive_tam_chart(df_languages)
+    assert fig.layout.template.layout.yaxis.gridwidth == 0.5
+    # Without Plotly's default template embedded, the figure JSON is much smaller
+    assert app.figure_payload_bytes(fig) < 3_000
+
+
 def test_add_accessibility_attrs():
     """Test accessibility attributes are added correctly"""
     mock_fig = MagicMock()
@@ -46,11 +75,12 @@ def test_add_accessibility_attrs():
     # Get the args passed to update_layout
     layout_args = mock_fig.update_layout.call_args[1]
     
-    # Check title structure
-    assert 'title' in layout_args
-    assert title in layout_args['title']['text']
-    assert layout_args['title']['x'] == 0.02  # Left-aligned
-    assert layout_args['title']['font']['size'] == 16
+    # Only the title text is set; alignment and font come from the template
+    assert set(layout_args) == {'title_text'}
+    assert title in layout_args['title_text']
+    template_title = app.pio.templates[app.tufte_template()].layout.title
+    assert template_title.x == 0.02  # Left-aligned
+    assert template_title.font.size == 16
 
 
 def test_show_loading_state():
@@ -159,6 +189,45 @@ def test_create_export_button_dict(mock_download_button):
     assert 'value1' in json_data
 
 
+@pytest.mark.parametrize("fmt,compression,rows", [
+    ('csv', None, None), ('csv', 'gzip', 25), ('json', 'gzip', 25), ('parquet', None, 25),
+])
+@patch('streamlit.download_button')
+def test_create_export_button_deferred_payload_is_downloadable(mock_download_button, fmt, compression, rows):
+    """Test deferred exports (large, compressed or Parquet) return data Streamlit's download path accepts"""
+    if fmt == 'parquet':
+        pytest.importorskip("pyarrow")
+    from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+    rows = rows or app.EXPORT_STREAMING_ROWS + 1
+    df = pd.DataFrame({'Idioma': [f"Idioma {i}" for i in range(rows)], 'TAM': np.arange(rows) * 1.5})
+
+    app.create_export_button(df, "export", fmt=fmt, compression=compression)
+    call_args = mock_download_button.call_args[1]
+    assert callable(call_args['data'])
+
+    data, _ = convert_data_to_bytes_and_infer_mime(call_args['data'](), TypeError("unsupported"))
+    if fmt == 'csv':
+        result = pd.read_csv(io.BytesIO(data), compression=compression)
+    elif fmt == 'json':
+        result = pd.read_json(io.BytesIO(data), orient='records', compression=compression)
+    else:
+        result = pd.read_parquet(io.BytesIO(data))
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+    if compression:
+        assert call_args['file_name'] == f"export.{fmt}.gz"
+        assert call_args['mime'] == "application/gzip"
+
+
+def test_parquet_export_hidden_without_pyarrow():
+    """Test Parquet is only offered when pyarrow is installed"""
+    real_find_spec = app.importlib.util.find_spec
+    with patch.object(app.importlib.util, 'find_spec',
+                      side_effect=lambda name: None if name == 'pyarrow' else real_find_spec(name)):
+        assert app.available_export_formats() == ['csv', 'json']
+        with pytest.raises(ImportError):
+            app.create_export_button(pd.DataFrame({'A': [1]}), "export", fmt='parquet')
+
+
 # ========== Test Chart Functions with Edge Cases ==========
 
 def test_create_interactive_tam_chart_empty_data():
@@ -241,6 +310,21 @@ def test_create_competitive_landscape_empty_data():
         assert 'não disponíve' in str(fig.layout.title.text) or 'annotations' in fig.layout
 
 
+def test_create_competitive_landscape_single_trace():
+    """Test competitive landscape renders all platforms in one vectorized trace"""
+    _, _, df_competitors, _ = app.load_data()
+    fig = app.create_competitive_landscape(df_competitors)
+
+    assert len(fig.data) == 1
+    trace = fig.data[0]
+    assert len(trace.x) == len(df_competitors)
+    assert list(trace.customdata[:, 0]) == list(df_competitors['Plataforma'])
+    # Our product keeps its emphasis inside the shared trace
+    ours = list(df_competitors['Plataforma']).index(app.OUR_PRODUCT)
+    assert trace.marker.color[ours] == app.COLORS['data_focus']
+    assert trace.marker.line.width[ours] == 3 and trace.marker.opacity[ours] == 0.9
+
+
 def test_create_sensitivity_analysis_calculations():
     """Test sensitivity analysis calculations"""
     fig = app.create_sensitivity_analysis()
@@ -259,6 +343,655 @@ def test_create_sensitivity_analysis_calculations():
     assert z_values[0][0] < z_values[-1][-1]  # Bottom-left < Top-right
 
 
+def test_compute_sensitivity_grid_matches_loop():
+    """Test vectorized sensitivity grid matches the scalar revenue formula"""
+    df_languages, _, _, _ = app.load_data()
+    grid = app.compute_sensitivity_grid(df_languages, resolution=(7, 5))
+    
+    assert grid['revenue'].shape == (7, 5)
+    conversion = app.SENSITIVITY_FALLBACK_BASE['conversion']
+    for i, tam_mult in enumerate(grid['tam_multipliers']):
+        for j, conv_mult in enumerate(grid['conversion_multipliers']):
+            expected = sum(
+                tam * tam_mult * conversion * conv_mult * arppu
+                for tam, arppu in zip(df_languages['TAM_Milhões'], df_languages['ARPPU_USD'])
+            )
+            assert abs(grid['revenue'][i, j] - expected) < 1e-9
+
+
+def test_compute_sensitivity_grid_uses_tam_arppu_and_conversion():
+    """Test TAM, ARPPU and the conversion input all drive the grid"""
+    df_languages, _, _, _ = app.load_data()
+    base = app.compute_sensitivity_grid(df_languages, resolution=5)['revenue']
+    
+    doubled_arppu = df_languages.assign(ARPPU_USD=df_languages['ARPPU_USD'] * 2)
+    np.testing.assert_allclose(app.compute_sensitivity_grid(doubled_arppu, resolution=5)['revenue'], base * 2)
+    
+    doubled_tam = df_languages.assign(**{'TAM_Milhões': df_languages['TAM_Milhões'] * 2})
+    np.testing.assert_allclose(app.compute_sensitivity_grid(doubled_tam, resolution=5)['revenue'], base * 2)
+    
+    np.testing.assert_allclose(app.compute_sensitivity_grid(df_languages, resolution=5, conversion=0.1)['revenue'], base * 2)
+    
+    # A conversion column takes precedence over the parameter
+    with_column = df_languages.assign(**{app.SENSITIVITY_CONVERSION_COLUMN: 0.1})
+    np.testing.assert_allclose(
+        app.compute_sensitivity_grid(with_column, resolution=5, conversion=0.01)['revenue'], base * 2
+    )
+
+
+def test_compute_sensitivity_grid_per_language():
+    """Test per-language grids add up to the aggregated grid"""
+    df_languages, _, _, _ = app.load_data()
+    languages = list(df_languages['Idioma'])
+    
+    per_language = app.compute_sensitivity_grid(df_languages, resolution=21, languages=languages)
+    aggregated = app.compute_sensitivity_grid(df_languages, resolution=21)
+    
+    assert per_language['revenue'].shape == (len(languages), 21, 21)
+    np.testing.assert_allclose(per_language['revenue'].sum(axis=0), aggregated['revenue'])
+
+
+def test_simulate_revenue_projection_bands():
+    """Test Monte Carlo projection covers the horizon with ordered percentile bands"""
+    df_languages, _, _, _ = app.load_data()
+    df_sim = app.simulate_revenue_projection(df_languages, confidence_level=0.90, time_horizon=5, n_paths=20_000)
+    
+    assert list(df_sim['Período']) == [f"Ano {i}" for i in range(1, 6)]
+    assert (df_sim['Receita_Min_K'] <= df_sim['Receita_Base_K']).all()
+    assert (df_sim['Receita_Base_K'] <= df_sim['Receita_Max_K']).all()
+    assert (df_sim['Confiança_Pct'] == 90).all()
+    
+    # Wider confidence level should widen the band
+    df_wide = app.simulate_revenue_projection(df_languages, confidence_level=0.99, time_horizon=5, n_paths=20_000)
+    assert (df_wide['Receita_Max_K'] - df_wide['Receita_Min_K'] > df_sim['Receita_Max_K'] - df_sim['Receita_Min_K']).all()
+
+
+def test_simulate_revenue_projection_reproducible():
+    """Test seeded simulations are reproducible"""
+    df_languages, _, _, _ = app.load_data()
+    first = app.simulate_revenue_projection(df_languages, n_paths=10_000, seed=7)
+    second = app.simulate_revenue_projection(df_languages, n_paths=10_000, seed=7)
+    
+    pd.testing.assert_frame_equal(first, second)
+
+
+# ========== Test Scenario Cache ==========
+
+def test_scenario_cache_lru_eviction():
+    """Test scenario cache evicts least recently used entries"""
+    cache = app.ScenarioCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'a' becomes most recently used
+    cache.put('c', 3)
+    
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert cache.stats()['hits'] == 1
+
+
+def test_scenario_cache_memory_cap():
+    """Test scenario cache keeps total bytes under the memory cap"""
+    cache = app.ScenarioCache(max_entries=100, max_bytes=20_000)
+    for i in range(5):
+        cache.put(i, np.zeros(1000))  # 8 KB each
+    
+    assert cache.total_bytes <= 20_000
+    assert len(cache) == 2
+    
+    # Values larger than the cap are returned but not stored
+    big = np.zeros(10_000)
+    assert cache.put('big', big) is big
+    assert 'big' not in cache
+
+
+def test_cached_revenue_projection_reuses_result():
+    """Test revisiting a scenario is served from the cache"""
+    df_languages, _, _, _ = app.load_data()
+    cache = app.ScenarioCache()
+    version = app.compute_data_version(df_languages)
+    
+    first = app.cached_revenue_projection(df_languages, 0.95, 3, version, cache=cache)
+    second = app.cached_revenue_projection(df_languages, 0.95, 3, version, cache=cache)
+    
+    assert first is second
+    assert cache.stats() == {'entries': 1, 'bytes': cache.total_bytes, 'hits': 1, 'misses': 1}
+
+
+def test_scenario_cache_single_flight():
+    """Test concurrent requests for the same key compute it once"""
+    import threading, time
+    cache = app.ScenarioCache()
+    calls = []
+    barrier = threading.Barrier(50)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return 'result'
+
+    def request(results):
+        barrier.wait()
+        results.append(cache.get_or_compute('scenario', compute))
+
+    results = []
+    threads = [threading.Thread(target=request, args=(results,)) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = cache.metrics()
+    assert len(calls) == 1
+    assert results == ['result'] * 50
+    assert metrics['computes'] == 1 and metrics['in_flight'] == 0
+    assert metrics['waits'] + metrics['hits'] == 49
+
+
+def test_scenario_cache_single_flight_propagates_errors():
+    """Test a failed computation is not cached and can be retried"""
+    cache = app.ScenarioCache()
+    with pytest.raises(ValueError):
+        cache.get_or_compute('bad', lambda: (_ for _ in ()).throw(ValueError("falhou")))
+    assert 'bad' not in cache
+    assert cache.get_or_compute('bad', lambda: 42) == 42
+    assert cache.metrics()['computes'] == 1
+
+
+def test_compute_data_version_changes_with_data():
+    """Test data version reflects DataFrame content"""
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    version = app.compute_data_version(df)
+    
+    assert version == app.compute_data_version(df.copy())
+    assert version != app.compute_data_version(df.assign(A=[1, 2, 4]))
+
+
+def test_table_version_follows_file_content(tmp_path):
+    """Test per-table versions come from the data-file signature, one content hash per CSV"""
+    import shutil
+    for name in app.DATA_TABLES:
+        shutil.copy(app.DATA_DIR / f"{name}.csv", tmp_path / f"{name}.csv")
+    before = app.table_version('languages', 'phases', signature=app.data_files_signature(tmp_path))
+    
+    with open(tmp_path / "languages.csv", "a", encoding="utf-8") as f:
+        f.write("Novo,1,20,60,20,10,20,2,8,11,45,5,5\n")
+    after = app.table_version('languages', 'phases', signature=app.data_files_signature(tmp_path))
+    
+    assert None not in before
+    assert after[0] != before[0]
+    assert after[1] == before[1]
+
+
+# ========== Test Worker Pool ==========
+
+def test_worker_pool_runs_simulation_in_process():
+    """Test pool jobs run in a worker process and land in the shared cache"""
+    df_languages, _, _, _ = app.load_data()
+    version = app.compute_data_version(df_languages)
+    pool = app.WorkerPool(max_workers=1)
+    try:
+        future = app.pooled_revenue_projection(df_languages, 0.95, 3, version, pool=pool)
+        duplicate = app.pooled_revenue_projection(df_languages, 0.95, 3, version, pool=pool)
+        result = future.result(timeout=120)
+    finally:
+        pool.shutdown()
+
+    assert duplicate is future  # An identical job in flight is not resubmitted
+    assert pool.stats()['submitted'] == 1
+    expected = app.simulate_revenue_projection(df_languages, 0.95, 3)
+    pd.testing.assert_frame_equal(result, expected)
+    # Result is shared with the synchronous path through the same key
+    assert app.cached_revenue_projection(df_languages, 0.95, 3, version, cache=pool.cache) is result
+
+
+def test_worker_pool_inline_mode():
+    """Test max_workers=0 computes in the calling thread and propagates errors"""
+    df_languages, _, _, _ = app.load_data()
+    pool = app.WorkerPool(max_workers=0)
+    grid = app.pooled_sensitivity_grid(df_languages, 11, None, 'v1', pool=pool).result()
+    np.testing.assert_array_equal(grid['revenue'], app.compute_sensitivity_grid(df_languages, resolution=11)['revenue'])
+
+    failing = pool.submit(('boom',), 'no_such_function')
+    assert failing.exception() is not None
+    assert ('boom',) not in pool.cache
+    # The error is delivered once to the next rerun; after that the job can be resubmitted
+    assert pool.submit(('boom',), 'no_such_function') is failing
+    assert pool.submit(('boom',), 'no_such_function') is not failing
+
+
+def test_worker_entry_point_does_not_import_streamlit():
+    """Test pool workers import only the simulation engines"""
+    import subprocess
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import sys, simulation; print(sorted(m for m in ('streamlit', 'plotly', 'streamlit_app') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_dir, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_await_pool_job_without_runtime_waits_for_result():
+    """Test await_pool_job falls back to waiting when there is no session to rerun"""
+    import threading
+    from concurrent.futures import Future
+    future = Future()
+    threading.Timer(0.05, future.set_result, args=('done',)).start()
+    assert app.await_pool_job(future) == 'done'
+
+
+# ========== Test Figure Cache ==========
+
+def test_cached_figure_builds_once():
+    """Test unchanged charts are served from the figure cache"""
+    df_languages, _, _, _ = app.load_data()
+    cache = app.FigureCache()
+    calls = []
+    
+    def chart(df):
+        calls.append(1)
+        return app.create_interactive_tam_chart(df)
+    
+    first = app.cached_figure(chart, df_languages, layout={'height': 300}, cache=cache)
+    second = app.cached_figure(chart, df_languages, layout={'height': 300}, cache=cache)
+    
+    assert len(calls) == 1
+    assert isinstance(second, app.go.Figure)
+    assert second.layout.height == 300
+    assert second is first
+    
+    # Different slices never collide, even without an explicit version
+    top = app.cached_figure(chart, df_languages.head(3), layout={'height': 300}, cache=cache)
+    bottom = app.cached_figure(chart, df_languages.tail(3), layout={'height': 300}, cache=cache)
+    filtered = app.cached_figure(chart, df_languages[df_languages.index % 3 == 0], layout={'height': 300}, cache=cache)
+    assert len(calls) == 4
+    assert list(top.data[0].y) != list(bottom.data[0].y)
+    assert len(filtered.data[0].y) == len(df_languages[df_languages.index % 3 == 0])
+    
+    # Values derived from controls are told apart by an explicit version
+    app.cached_figure(chart, df_languages.head(3), layout={'height': 300}, cache=cache, version='scenario')
+    assert len(calls) == 5
+    
+    # Changed data files empty the cache
+    cache.invalidate_if_changed(('changed',))
+    app.cached_figure(chart, df_languages, layout={'height': 300}, cache=cache)
+    assert len(calls) == 6
+
+
+def test_figure_cache_invalidates_on_data_change():
+    """Test figure cache is cleared when the data files signature changes"""
+    cache = app.FigureCache()
+    cache.invalidate_if_changed(('languages.csv', 1, 100))
+    cache.put('fig', '{}')
+    
+    cache.invalidate_if_changed(('languages.csv', 1, 100))
+    assert 'fig' in cache
+    
+    cache.invalidate_if_changed(('languages.csv', 2, 100))
+    assert 'fig' not in cache
+
+
+# ========== Test Rank Index ==========
+
+def test_rank_index_top_k_matches_sort():
+    """Test rank index top-K matches a full sort on each key"""
+    df_languages, _, _, _ = app.load_data()
+    index = app.build_rank_index(df_languages)
+
+    top_tam = df_languages.iloc[index.top_k('TAM_Milhões', 8)]
+    assert list(top_tam['TAM_Milhões']) == sorted(df_languages['TAM_Milhões'], reverse=True)[:8]
+    # Current data: top 8 by TAM is the same set the chart showed with head(8)
+    assert set(top_tam['Idioma']) == set(df_languages.head(8)['Idioma'])
+
+    top_rank = df_languages.iloc[index.top_k('Rank_Global', 3)]
+    assert list(top_rank['Rank_Global']) == [1, 2, 3]
+
+
+def test_rank_index_subset_in_rank_order():
+    """Test selected languages come back in TAM order and unknown names are ignored"""
+    df_languages, _, _, _ = app.load_data()
+    index = app.build_rank_index(df_languages)
+
+    positions = index.subset('TAM_Milhões', ['Turco', 'Espanhol', 'Inexistente', 'Alemão'])
+    assert list(df_languages.iloc[positions]['Idioma']) == ['Espanhol', 'Alemão', 'Turco']
+
+
+def test_tam_chart_uses_rank_index():
+    """Test TAM chart shows top-K ascending with the top 3 highlighted"""
+    df_languages, _, _, _ = app.load_data()
+    fig = app.create_interactive_tam_chart(df_languages, rank_index=app.build_rank_index(df_languages))
+
+    assert list(fig.data[0].x) == sorted(fig.data[0].x)
+    assert len(fig.data[0].y) == app.TAM_CHART_TOP_K
+    colors = list(fig.data[0].marker.color)
+    assert colors[-3:] == [app.COLORS['data_focus']] * 3
+    assert app.COLORS['data_focus'] not in colors[:-3]
+
+
+# ========== Test Priority Scoring ==========
+
+def test_priority_scores_ranks_and_tiers():
+    """Test priority scoring returns sorted scores, unique ranks and valid tiers"""
+    df_languages, _, _, _ = app.load_data()
+    ranking = app.compute_priority_scores(df_languages)
+
+    assert len(ranking) == len(df_languages)
+    assert ranking['Score'].between(0, 100).all()
+    assert ranking['Score'].is_monotonic_decreasing
+    assert list(ranking['Rank']) == list(range(1, len(df_languages) + 1))
+    assert set(ranking['Tier']) <= {tier for _, tier, _ in app.PRIORITY_TIERS}
+
+
+def test_priority_scores_respect_criterion_direction():
+    """Test lower-is-better criteria invert the ranking"""
+    df = pd.DataFrame({'Idioma': ['A', 'B', 'C'], 'Payback_Meses': [6, 12, 24], 'TAM_Milhões': [10, 50, 100]})
+
+    by_payback = app.compute_priority_scores(df, weights={'Payback_Meses': 1})
+    assert list(by_payback['Idioma']) == ['A', 'B', 'C']
+    assert by_payback['Score'].iloc[0] == pytest.approx(100)
+
+    by_tam = app.compute_priority_scores(df, weights={'TAM_Milhões': 1})
+    assert list(by_tam['Idioma']) == ['C', 'B', 'A']
+
+
+def test_priority_weights_zero_fall_back_to_equal():
+    """Test all-zero weights are replaced by equal weights"""
+    vector = app.priority_weight_vector({column: 0 for column in app.PRIORITY_CRITERIA})
+    assert np.allclose(vector, 1 / len(app.PRIORITY_CRITERIA))
+    assert app.priority_weight_vector().sum() == pytest.approx(1)
+
+
+def test_priority_rescoring_100k_languages():
+    """Test re-weighting 100k languages reuses the normalized criteria"""
+    import synthetic_data
+    df = app.prepare_languages(synthetic_data.generate_languages(100_000))
+    normalized = app.normalize_priority_criteria(df)
+
+    ranking = app.score_priorities(df, normalized, weights={'ROI_Ratio': 0.5, 'Market_Readiness': 0.5})
+    assert len(ranking) == 100_000
+    assert ranking['Rank'].iloc[0] == 1
+
+
+# ========== Test Executive KPIs ==========
+
+def test_executive_kpis_follow_data():
+    """Test KPI aggregates are computed from the loaded DataFrames"""
+    df_languages, _, _, df_projection = app.load_data()
+    kpis = app.compute_executive_kpis(df_languages, df_projection)
+
+    assert kpis['tam_total_m'] == pytest.approx(df_languages['TAM_Milhões'].sum())
+    future = df_projection[df_projection['Período'] != 'Atual']
+    assert kpis['projected_revenue_k'] == pytest.approx(future['Receita_Base_K'].sum())
+    assert kpis['confidence_pct'] == pytest.approx(future['Confiança_Pct'].mean())
+    ranking = app.compute_priority_scores(df_languages)
+    assert kpis['tier1_languages'] == (ranking['Tier'] == 'Tier 1').sum()
+
+    # Changing the data changes the KPIs
+    doubled = df_languages.assign(**{'TAM_Milhões': df_languages['TAM_Milhões'] * 2})
+    assert app.compute_executive_kpis(doubled, df_projection)['tam_total_m'] == pytest.approx(2 * kpis['tam_total_m'])
+
+
+def test_executive_kpis_cached_per_data_version():
+    """Test KPIs are computed once per data version"""
+    df_languages, _, _, df_projection = app.load_data()
+    cache = app.ScenarioCache()
+    version = app.compute_data_version(df_languages, df_projection)
+
+    first = app.cached_executive_kpis(df_languages, df_projection, version, cache=cache)
+    second = app.cached_executive_kpis(df_languages, df_projection, version, cache=cache)
+    assert first is second
+    assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 1
+
+
+def test_executive_kpi_cards_render():
+    """Test KPI cards render through create_enhanced_metric_card"""
+    df_languages, _, _, df_projection = app.load_data()
+    cards = app.executive_kpi_cards(app.compute_executive_kpis(df_languages, df_projection))
+    assert len(cards) == 4
+    for card in cards:
+        html = app.create_enhanced_metric_card(**card)
+        assert card['value'] in html and 'metric-card-enhanced' in html
+
+
+# ========== Test Roadmap ==========
+
+def test_compute_roadmap_from_phases():
+    """Test roadmap totals, phase ROI, cumulative columns and breakeven"""
+    _, df_phases, _, _ = app.load_data()
+    roadmap = app.compute_roadmap(df_phases)
+    phases, monthly, summary = roadmap['phases'], roadmap['monthly'], roadmap['summary']
+
+    assert summary['total_investment_k'] == df_phases['Investimento_K'].sum()
+    assert summary['total_revenue_k'] == df_phases['Receita_Esperada_K'].sum()
+    assert list(phases['Mês_Início']) == [0, 6, 9, 12]
+    assert list(phases['Mês_Fim']) == [6, 9, 12, 15]
+    assert phases['ROI_Fase_Pct'].iloc[0] == pytest.approx((950 - 135) / 135 * 100)
+    # Monthly flows add up to the phase totals
+    assert monthly['Investimento_K'].sum() == pytest.approx(summary['total_investment_k'])
+    assert monthly['Receita_K'].sum() == pytest.approx(summary['total_revenue_k'])
+    # Breakeven is the first month the cumulative balance turns non-negative
+    month = summary['breakeven_month']
+    assert monthly['Saldo_Acumulado_K'].iloc[month - 1] >= 0
+    assert (monthly['Saldo_Acumulado_K'].iloc[:month - 1] < 0).all()
+
+
+def test_compute_roadmap_chains_phases_without_window():
+    """Test phases without a month window are placed back to back"""
+    start, end = app.parse_phase_months(['Fase A', 'Fase B'])
+    assert list(start) == [0, app.ROADMAP_DEFAULT_PHASE_MONTHS]
+    assert list(end) == [app.ROADMAP_DEFAULT_PHASE_MONTHS, 2 * app.ROADMAP_DEFAULT_PHASE_MONTHS]
+
+
+def test_compute_roadmap_hundreds_of_phases():
+    """Test roadmap computation handles large plans"""
+    n = 500
+    df_phases = pd.DataFrame({
+        'Fase': [f"Fase {i} ({3 * i}-{3 * i + 3}m)" for i in range(n)],
+        'Investimento_K': np.full(n, 100),
+        'Receita_Esperada_K': np.full(n, 300),
+        'Usuários_Projetados': np.full(n, 1000),
+    })
+    roadmap = app.compute_roadmap(df_phases)
+    assert len(roadmap['phases']) == n
+    assert roadmap['summary']['roi_pct'] == pytest.approx(200)
+
+
+def test_compute_roadmap_empty():
+    """Test roadmap with no phase data"""
+    roadmap = app.compute_roadmap(pd.DataFrame())
+    assert roadmap['phases'].empty
+    assert roadmap['summary']['breakeven_month'] is None
+
+
+# ========== Test Performance Instrumentation ==========
+
+def test_perf_recorder_records_nested_spans():
+    """Test spans record wall/CPU time and allocations with nesting depth"""
+    recorder = app.PerfRecorder()
+    with recorder.span('outer'):
+        with recorder.span('inner'):
+            _ = [object() for _ in range(1000)]
+        with recorder.span('inner'):
+            pass
+
+    summary = recorder.summary().set_index('name')
+    assert summary.loc['inner', 'calls'] == 2
+    assert summary.loc['outer', 'wall_ms'] >= summary.loc['inner', 'wall_ms']
+    assert [r['depth'] for r in recorder.records] == [1, 1, 0]
+    assert recorder.total_wall_ms() == recorder.records[-1]['wall_ms']
+
+    exported = app.json.loads(app.json.dumps(recorder.export()))
+    assert exported['summary'][0]['name'] == 'outer'
+    assert len(exported['records']) == 3
+
+
+def test_chart_functions_are_instrumented():
+    """Test load_data and create_* calls land in the per-rerun recorder"""
+    recorder = app.reset_perf_recorder()
+    df_languages, _, _, _ = app.load_data()
+    app.create_interactive_tam_chart(df_languages)
+
+    names = [record['name'] for record in recorder.records]
+    assert 'load_data' in names and 'load_data_with_status' in names
+    assert 'create_interactive_tam_chart' in names
+    assert app.create_interactive_tam_chart.__name__ == 'create_interactive_tam_chart'
+
+
+@patch('streamlit.fragment', lambda func: func)
+def test_section_fragment_rerun_scopes_its_own_recorder():
+    """Test a fragment-only rerun starts a fresh recorder, renders its summary and records its duration"""
+    stale = app.reset_perf_recorder()
+    with stale.span('previous_full_run'):
+        pass
+
+    @app.section_fragment
+    @app.instrumented
+    def render_section():
+        return app.PERF_RECORDER
+
+    with patch.object(app, 'is_fragment_rerun', return_value=True), \
+            patch.object(app, 'render_fragment_perf_panel') as mock_panel, \
+            patch.object(app, 'record_rerun_metrics') as mock_metrics:
+        recorder = render_section()
+
+    assert recorder is not stale
+    assert [record['name'] for record in recorder.records] == ['render_section']
+    mock_panel.assert_called_once_with(recorder, 'render_section')
+    # Fragment reruns also reach the histogram, labelled by section
+    assert mock_metrics.call_args.kwargs['section'] == 'render_section'
+
+    # Full runs keep the recorder opened by main()
+    with patch.object(app, 'is_fragment_rerun', return_value=False):
+        assert render_section() is recorder
+
+
+# ========== Test Metrics Endpoint ==========
+
+def test_metrics_registry_renders_prometheus_text():
+    """Test counters and histograms render in the Prometheus text format"""
+    registry = app.MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe('lingodash_rerun_duration_seconds', 0.05)
+    registry.observe('lingodash_rerun_duration_seconds', 0.5)
+    registry.observe('lingodash_rerun_duration_seconds', 3.0)
+    registry.inc('lingodash_load_data_cache_total', table='languages', result='hit')
+
+    text = registry.render()
+    assert '# TYPE lingodash_rerun_duration_seconds histogram' in text
+    assert 'lingodash_rerun_duration_seconds_bucket{le="0.1"} 1' in text
+    assert 'lingodash_rerun_duration_seconds_bucket{le="1"} 2' in text
+    assert 'lingodash_rerun_duration_seconds_bucket{le="+Inf"} 3' in text
+    assert 'lingodash_rerun_duration_seconds_count 3' in text
+    assert 'lingodash_load_data_cache_total{result="hit",table="languages"} 1' in text
+    with pytest.raises(KeyError):
+        registry.inc('unknown_metric')
+
+
+def test_metrics_endpoint_local_scrape(tmp_path):
+    """Test /metrics serves load_data cache hits, figure build times and cache gauges"""
+    import urllib.request
+    registry = app.get_metrics_registry()
+    before = registry.value('lingodash_load_data_cache_total', table='languages', result='hit') or 0
+    df_languages, _, _, _ = app.load_data()
+    app.load_data()
+    app.cached_figure(app.create_interactive_tam_chart, df_languages, cache=app.FigureCache())
+
+    server = app.start_metrics_server(registry, port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            text = response.read().decode('utf-8')
+    finally:
+        server.shutdown()
+
+    assert registry.value('lingodash_load_data_cache_total', table='languages', result='hit') >= before + 1
+    assert 'lingodash_figure_build_seconds_count{figure="create_interactive_tam_chart"}' in text
+    assert 'lingodash_cache_entries{cache="scenarios"}' in text
+    assert 'lingodash_active_sessions 0' in text
+
+    path = app.write_metrics_file(registry, tmp_path / "lingodash.prom")
+    assert 'lingodash_load_data_cache_total' in path.read_text()
+
+
+# ========== Test Precompiled Stylesheet ==========
+
+def test_minify_css_keeps_rules():
+    """Test minification drops comments and whitespace but keeps every rule"""
+    minified, digest = app.compile_stylesheet()
+    assert len(minified) < len(app.APP_CSS) * 0.75
+    assert minified.count('{') == app.APP_CSS.count('{')
+    assert '/*' not in minified and '<style>' not in minified
+    assert '.metric-card-enhanced' in minified
+    assert digest == app.compile_stylesheet()[1]
+
+
+def test_stylesheet_tag_static_and_inline(static_dir):
+    """Test a versioned <link> is used with static serving and inline CSS otherwise"""
+    tag = app.stylesheet_tag(True)
+    _, digest = app.compile_stylesheet()
+    assert tag == f'<link rel="stylesheet" href="app/static/lingodash.{digest}.css">'
+    assert (static_dir / f"lingodash.{digest}.css").read_text() == app.compile_stylesheet()[0]
+
+    # A new stylesheet version replaces the previous file
+    app.stylesheet_tag(True, css=".a { color: red; }")
+    assert len(list(static_dir.glob("lingodash.*.css"))) == 1
+
+    inline = app.stylesheet_tag(False)
+    assert inline.startswith('<style>') and len(inline) < len(app.APP_CSS)
+
+
+# ========== Test Figure Payloads ==========
+
+def test_compact_figure_preserves_values():
+    """Test compact mode rounds numbers and swaps per-point text for a texttemplate"""
+    df_languages, _, _, _ = app.load_data()
+    fig = app.create_interactive_tam_chart(df_languages)
+    compact = app.compact_figure(fig)
+
+    trace, compact_trace = fig.data[0], compact.data[0]
+    np.testing.assert_allclose(np.asarray(compact_trace.x, dtype=float), np.asarray(trace.x, dtype=float))
+    assert list(compact_trace.y) == list(trace.y)
+    assert compact_trace.text is None
+    assert compact_trace.texttemplate == '%{x:.1f}M'
+    assert app.figure_payload_bytes(compact) < app.figure_payload_bytes(fig)
+
+
+def test_cached_figure_compacts_only_on_request():
+    """Test cached figures keep full precision unless a chart opts in to compact mode"""
+    df_languages, _, _, _ = app.load_data()
+    cache = app.FigureCache()
+    full = app.cached_figure(app.create_interactive_tam_chart, df_languages, cache=cache)
+    compact = app.cached_figure(app.create_interactive_tam_chart, df_languages, cache=cache, compact=True)
+
+    assert not app.COMPACT_FIGURES
+    assert full.data[0].text is not None
+    assert compact.data[0].texttemplate == '%{x:.1f}M'
+
+
+def test_round_significant_and_typed_arrays():
+    """Test significant-digit rounding and the shorter encoding choice"""
+    values = np.array([123456.789, 0.000123456789, 0.0, np.nan])
+    np.testing.assert_allclose(app.round_significant(values, 3), [123000.0, 0.000123, 0.0, np.nan])
+
+    small = app._compact_array([1.0, 2.0, 3.0], 6)
+    assert small == [1, 2, 3]  # Short list: plain JSON is smaller than the typed array
+    grid = app._compact_array(np.random.default_rng(0).random((50, 50)), 6, float32=True)
+    assert isinstance(grid, np.ndarray) and grid.dtype == np.float32
+
+
+def test_analyze_figure_payloads_flags_budget():
+    """Test the payload analyzer measures every figure and flags the ones over budget"""
+    df_languages, _, _, _ = app.load_data()
+    figures = {
+        'tam': app.create_interactive_tam_chart(df_languages),
+        'sensitivity': app.create_sensitivity_analysis(df_languages, resolution=101),
+    }
+    report = app.analyze_figure_payloads(figures, budget=20_000)
+
+    assert list(report['Figura']) == ['sensitivity', 'tam']
+    assert report.set_index('Figura')['Acima_Orçamento'].to_dict() == {'sensitivity': True, 'tam': False}
+    assert (report['Bytes_Sem_Template'] <= report['Bytes_Compacto']).all()
+    assert (report['Bytes_Compacto'] <= report['Bytes']).all()
+
+
 # ========== Test Data Processing Functions ==========
 
 def test_load_data_calculations():
@@ -332,6 +1065,83 @@ def test_main_function_executes(*mocks):
     assert mocks[1].call_count > 0  # markdown called multiple times
 
 
+@patch('streamlit.radio', return_value="Second")
+def test_render_sections_lazy_runs_only_selected(mock_radio):
+    """Test lazy rendering executes only the visible section"""
+    calls = []
+    sections = [
+        ("First", lambda: calls.append("First")),
+        ("Second", lambda: calls.append("Second")),
+    ]
+    
+    app.render_sections(sections, key="test_section", lazy=True)
+    
+    assert calls == ["Second"]
+    assert mock_radio.call_args[0][1] == ["First", "Second"]
+
+
+@patch('streamlit.tabs')
+def test_render_sections_tabs_mode_runs_all(mock_tabs):
+    """Test non-lazy rendering executes every section inside st.tabs"""
+    mock_tabs.return_value = [MagicMock(), MagicMock()]
+    calls = []
+    sections = [
+        ("First", lambda: calls.append("First")),
+        ("Second", lambda: calls.append("Second")),
+    ]
+    
+    app.render_sections(sections, key="test_section", lazy=False)
+    
+    assert calls == ["First", "Second"]
+
+
+# ========== Test Startup Performance ==========
+
+def test_lazy_module_defers_import():
+    """Test LazyModule imports only on first attribute access"""
+    lazy_json = app.LazyModule("json")
+    assert lazy_json._module is None
+    
+    assert lazy_json.dumps({'a': 1}) == '{"a": 1}'
+    assert lazy_json._module is not None
+
+
+def test_app_import_skips_heavy_unused_modules():
+    """Test importing the app does not pull in unused plotting libraries"""
+    import subprocess
+    code = (
+        "import sys, streamlit_app; "
+        "print(','.join(m for m in ('seaborn', 'matplotlib.pyplot', 'plotly.express') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_parse_importtime_report():
+    """Test parsing of -X importtime output"""
+    import profile_startup
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+        "import time:        50 |        470 | streamlit_app\n"
+    )
+    entries = profile_startup.parse_importtime(stderr)
+    
+    assert entries == [
+        ('json.decoder', 120, 120, 1),
+        ('json', 300, 420, 0),
+        ('streamlit_app', 50, 470, 0),
+    ]
+    report = profile_startup.format_report(entries, module="streamlit_app", top=5)
+    assert "0.5 ms" in report
+
+
 # ========== Test Data Validation ==========
 
 def test_data_files_exist():
@@ -146,6 +146,52 @@ def test_large_dataset_handling():
         assert len(fig.data[0].y) <= 8  # Should limit to top 8
 
 
+def test_sensitivity_grid_high_resolution():
+    """Test 500x500 sensitivity grids keep their shape and stay finite"""
+    df_languages, _, _, _ = app.load_data()
+    grid = app.compute_sensitivity_grid(df_languages, resolution=500)
+    
+    assert grid['revenue'].shape == (500, 500)
+    assert np.isfinite(grid['revenue']).all()
+
+
+def test_monte_carlo_simulation_missing_columns():
+    """Test simulation returns an empty projection when revenue columns are missing"""
+    df_sim = app.simulate_revenue_projection(pd.DataFrame({'Idioma': ['Lang1']}))
+    
+    assert df_sim.empty
+    assert 'Receita_Base_K' in df_sim.columns
+
+
+def test_scatter_charts_level_of_detail_bounds_payload():
+    """Test ROI matrix and competitive landscape switch to binned WebGL traces on large catalogs"""
+    import synthetic_data
+    max_points = app.LOD_GRID_BINS ** 2 + app.LOD_LABEL_TOP_N + 1
+
+    for n_rows in (app.LOD_POINT_THRESHOLD + 1, 200_000):
+        tables = synthetic_data.generate_tables(n_rows)
+        df_languages = app.prepare_languages(tables['languages'])
+        df_competitors = app.prepare_competitors(tables['competitors'])
+        for fig in (app.create_advanced_roi_matrix(df_languages), app.create_competitive_landscape(df_competitors)):
+            assert fig.data[0].type == 'scattergl'
+            assert sum(len(trace.x) for trace in fig.data) <= max_points
+            labeled = [trace for trace in fig.data if trace.text is not None]
+            assert len(labeled) == 1 and len(labeled[0].text) <= app.LOD_LABEL_TOP_N + 1
+
+
+def test_bin_points_preserves_totals():
+    """Test server-side binning keeps counts and weight sums"""
+    df = pd.DataFrame({
+        'x': np.random.default_rng(0).uniform(0, 10, 5000),
+        'y': np.random.default_rng(1).uniform(0, 10, 5000),
+        'w': np.ones(5000),
+    })
+    binned = app.bin_points(df, 'x', 'y', 'w', bins=10)
+    assert len(binned) <= 100
+    assert binned['Count'].sum() == 5000
+    assert binned['w'].sum() == pytest.approx(5000)
+
+
 def test_empty_selection_handling():
     """Test chart functions with empty selection"""
     df_languages, _, _, _ = app.load_data()
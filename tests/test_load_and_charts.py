@@ -43,6 +43,96 @@ def test_load_data_missing(monkeypatch):
     df1, df2, df3, df4 = app.load_data()
     assert df1.empty and df2.empty and df3.empty and df4.empty, "DataFrames não estão vazios quando arquivos faltam"
 
+# ========== 2b. Testes do Armazenamento Colunar Compilado ==========
+def _copy_data_dir(tmp_path):
+    import shutil
+    data_dir = tmp_path / "data"
+    shutil.copytree(app.DATA_DIR, data_dir, ignore=shutil.ignore_patterns("compiled"))
+    return data_dir
+
+def test_compiled_tables_match_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    data_dir = _copy_data_dir(tmp_path)
+    written = app.compile_data(data_dir)
+    assert set(written) == set(app.DATA_TABLES), "Nem todas as tabelas foram compiladas"
+
+    for name, prepare in app.DATA_TABLES.items():
+        compiled = app.read_compiled_table(name, data_dir)
+        assert compiled is not None, f"Tabela compilada {name} não foi lida"
+        expected = prepare(app.pd.read_csv(data_dir / f"{name}.csv"))
+        app.pd.testing.assert_frame_equal(compiled, expected)
+
+def test_stale_compiled_table_falls_back_to_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    data_dir = _copy_data_dir(tmp_path)
+    app.compile_data(data_dir)
+
+    # Altera o CSV após a compilação: o arquivo compilado fica desatualizado
+    csv_path = data_dir / "projection.csv"
+    csv_path.write_text(csv_path.read_text(encoding="utf-8") + '"Ano 4",9000,7000,11000,50\n', encoding="utf-8")
+
+    assert app.read_compiled_table("projection", data_dir) is None, "Arquivo compilado desatualizado foi usado"
+    df = app.read_table("projection", data_dir)
+    assert len(df) == 5 and 'Período' in df.columns, "Fallback para CSV não aplicou a preparação"
+
+# ========== 2c. Testes de Invalidação por Arquivo ==========
+def test_only_changed_table_is_reloaded(tmp_path):
+    data_dir = _copy_data_dir(tmp_path)
+    first = {name: app._load_table_cached(name, str(data_dir), app.data_file_signature(data_dir / f"{name}.csv")[3]) for name in app.DATA_TABLES}
+
+    # Touch sem alterar conteúdo: mtime muda, hash não
+    csv_path = data_dir / "projection.csv"
+    os.utime(csv_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    frames, _ = app.load_data_with_status(data_dir)
+    assert len(frames[3]) == 4, "Tabela de projeção recarregada incorretamente"
+
+    csv_path.write_text(csv_path.read_text(encoding="utf-8") + '"Ano 4",9000,7000,11000,50\n', encoding="utf-8")
+    frames, last_loaded = app.load_data_with_status(data_dir)
+    assert len(frames[3]) == 5, "Alteração no CSV não invalidou o cache"
+    assert last_loaded > first['projection'][1], "Horário da última carga não foi atualizado"
+
+    for name in ('languages', 'phases', 'competitors'):
+        _, loaded_at = app._load_table_cached(name, str(data_dir), app.data_file_signature(data_dir / f"{name}.csv")[3])
+        assert loaded_at == first[name][1], f"Tabela {name} foi recarregada sem alteração"
+
+# ========== 2d. Testes da Tabela Fase → Idioma ==========
+def test_phase_languages_exploded_and_joined():
+    df_languages, df_phases, _, _ = app.load_data()
+    table = app.load_phase_languages()
+
+    assert len(table) == 10, "Tabela fase → idioma com número de linhas incorreto"
+    assert table['Idioma_Cadastrado'].all(), "Idioma das fases sem cadastro em df_languages"
+    assert set(table['Idioma']) == set(df_languages['Idioma']), "Idiomas das fases diferentes do cadastro"
+    # Agregações por groupby, sem parsing de string
+    invest = table.groupby('Fase', sort=False)['Investimento_K'].sum()
+    assert list(invest) == list(df_phases['Investimento_K']), "Investimento por fase não bate com a soma dos idiomas"
+    assert app.compute_data_version(table), "Tabela fase → idioma não é hasheável"
+
+def test_phase_languages_flags_unknown_language():
+    df_phases = app.pd.DataFrame({
+        'Fase': ['Fase X (0-3m)'], 'Idiomas': ["['Espanhol', \"Klingon\"]"],
+        'Investimento_K': [10], 'Receita_Esperada_K': [20], 'Usuários_Projetados': [100]
+    })
+    df_languages, _, _, _ = app.load_data()
+    table = app.explode_phase_languages(df_phases, df_languages)
+    assert list(table['Idioma']) == ['Espanhol', 'Klingon'], "Parsing da lista de idiomas incorreto"
+    assert list(table['Idioma_Cadastrado']) == [True, False], "Idioma desconhecido não sinalizado"
+    assert app.pd.isna(table['TAM_Milhões'].iloc[1]), "Idioma desconhecido recebeu dados de mercado"
+
+# ========== 2e. Testes do Renderizador em Lote ==========
+def test_render_reports_writes_html_per_variant(tmp_path):
+    import render_reports
+    variants = render_reports.build_variants([0.8, 1.2], [0.95], [3], n_paths=1_000)
+    results = render_reports.render_reports(
+        output_dir=tmp_path, figures=['tam', 'projection'], variants=variants, workers=1
+    )
+
+    names = sorted(os.path.basename(path) for path, _ in results)
+    assert names == ['projection__sf0.80_cl0.95_h3.html', 'projection__sf1.20_cl0.95_h3.html', 'tam.html'], \
+        "Figuras sem cenário devem ser renderizadas uma vez; as demais, uma por variante"
+    assert (tmp_path / "plotly.min.js").exists(), "Bundle plotly.js compartilhado não foi escrito"
+    assert 'plotly.min.js' in (tmp_path / "tam.html").read_text(), "HTML não referencia o bundle compartilhado"
+
 # ========== 3. Testes de Funções de Visualização ==========
 def test_chart_functions_return_figures():
     df_languages, df_phases, df_competitors, df_projection = app.load_data()